@@ -31,17 +31,19 @@ export default function ArchivesPage() {
         enabled: !!board
     });
 
-    // --- Transform Data for Visualizations ---
-
-    // 1. Velocity (Fake specific data for now since we lack daily pixel history API, or derive from journals)
-    // In a real app we'd aggregate pixels by created_at. Flattening journal activity as proxy.
     const last14Days = eachDayOfInterval({ start: subDays(new Date(), 13), end: new Date() });
-    const velocityData = last14Days.map(day => {
-        // Mock random fluctuation for "cool chart" effect + some real data influence
-        const dateStr = format(day, "yyyy-MM-dd");
-        const hasJournal = journals?.find(j => j.journalDate === dateStr);
-        return hasJournal ? 40 + Math.random() * 20 : 10 + Math.random() * 10;
+    const velocityStart = format(last14Days[0], "yyyy-MM-dd");
+    const velocityEnd = format(last14Days[last14Days.length - 1], "yyyy-MM-dd");
+    const { data: recent } = useQuery({
+        queryKey: queryKeys.pixels.summary(velocityStart, velocityEnd),
+        queryFn: () => api.pixels.getSummary(velocityStart, velocityEnd),
     });
+
+    // --- Transform Data for Visualizations ---
+
+    // 1. Velocity: pixels earned per day over the last 14 days (pixel ledger)
+    const pixelsByDate = new Map(recent?.byDate.map(d => [d.date, d.totalPixels]));
+    const velocityData = last14Days.map(day => pixelsByDate.get(format(day, "yyyy-MM-dd")) ?? 0);
     const velocityLabels = last14Days.map(d => format(d, "dd/MM"));
 
     // 2. Domain Radar
@@ -7,7 +7,8 @@ import { queryKeys } from "@/lib/query/queryClient";
 import { SystemPanel } from "@/components/shared/SystemPanel";
 import { PixelatedBoard } from "@/components/boards/PixelatedBoard";
 import { MainBoardProgress } from "@/components/boards/MainBoardProgress";
-import { Loader2, Download, Share2, Maximize2 } from "lucide-react";
+import { WallpaperExport } from "@/components/boards/WallpaperExport";
+import { Loader2, Share2, Maximize2 } from "lucide-react";
 import { format, parseISO } from "date-fns";
 import { SystemButton } from "@/components/shared/SystemButton";
 
@@ -75,10 +76,7 @@ export default function MainBoardPage() {
             <Maximize2 className="w-4 h-4 mr-2" />
             Fullscreen
           </SystemButton>
-          <SystemButton variant="outline" size="sm">
-            <Download className="w-4 h-4 mr-2" />
-            Export
-          </SystemButton>
+          {mainBoard && <WallpaperExport boardId={mainBoard.id} />}
           <SystemButton variant="outline" size="sm">
             <Share2 className="w-4 h-4 mr-2" />
             Share
@@ -7,8 +7,10 @@ import { format } from "date-fns";
 import { useRouter } from "next/navigation";
 import { api } from "@/lib/api";
 import { queryKeys } from "@/lib/query/queryClient";
+import { seedDashboardQueries } from "@/lib/query/dashboardSnapshot";
 import { MilestoneCelebration } from "@/components/dashboard/MilestoneCelebration";
 import { calculateStreak } from "@/lib/utils/streakCalculator";
+import { useJournalAnalysis } from "@/lib/hooks/useJournalAnalysis";
 import { VisionBoardWidget } from "@/components/dashboard/VisionBoardWidget";
 import { HeroProgressCard } from "@/components/dashboard/HeroProgressCard";
 import { LifeDomainsPanel } from "@/components/dashboard/LifeDomainsPanel";
@@ -45,6 +47,17 @@ export default function DashboardPage() {
   };
 
   // --- Data Fetching --- 
+  // One round trip for first paint: the snapshot seeds the board, domains,
+  // goals, journals and timeline caches before the queries below run.
+  const { isPending: snapshotPending } = useQuery({
+    queryKey: queryKeys.dashboard.snapshot,
+    queryFn: async () => {
+      const snapshot = await api.dashboard.getSnapshot();
+      if (snapshot) seedDashboardQueries(queryClient, snapshot);
+      return snapshot;
+    },
+  });
+
   const { data: currentBoard, isLoading: boardLoading } = useQuery({
     queryKey: [...queryKeys.boards.current, boardType],
     queryFn: async () => {
@@ -53,6 +66,7 @@ export default function DashboardPage() {
       if (boardType === "annual") return api.boards.getAnnual();
       return api.boards.getCurrent();
     },
+    enabled: !snapshotPending,
   });
 
   const { data: pixelSummary } = useQuery({
@@ -64,22 +78,31 @@ export default function DashboardPage() {
   const { data: domains, isLoading: domainsLoading } = useQuery({
     queryKey: queryKeys.domains.all,
     queryFn: api.domains.getAll,
+    enabled: !snapshotPending,
   });
 
   const { data: journals } = useQuery({
     queryKey: queryKeys.journals.all,
     queryFn: () => api.journals.getAll(),
+    enabled: !snapshotPending,
+  });
+
+  const { data: streak } = useQuery({
+    queryKey: queryKeys.journals.streak,
+    queryFn: api.journals.getStreak,
+    enabled: !snapshotPending,
   });
 
   // Calculations
-  const streakData = journals ? calculateStreak(journals) : { currentStreak: 0, isActive: false };
+  // Persisted aggregate when signed in; mock journals are folded client-side
+  const streakData = streak ?? (journals ? calculateStreak(journals) : { currentStreak: 0, isActive: false });
   const completionPercentage = currentBoard?.totalPixels
     ? Math.round((currentBoard.coloredPixels / currentBoard.totalPixels) * 100)
     : 0;
 
-  const hasPendingJournal = !journals?.some(
-    (j) => j.journalDate === format(new Date(), "yyyy-MM-dd")
-  );
+  const todayJournal = journals?.find((j) => j.journalDate === format(new Date(), "yyyy-MM-dd"));
+  const hasPendingJournal = !todayJournal;
+  const todayAnalysis = useJournalAnalysis(todayJournal);
 
   // Milestones Check
   useEffect(() => {
@@ -192,6 +215,24 @@ export default function DashboardPage() {
                   <p className="text-green-400">Journal Entry received.</p>
                   <p className="text-purple-400">+45 Pixels generated.</p>
                 </div>
+                {todayAnalysis?.analysisStatus && (
+                  <div data-testid="journal-analysis" data-status={todayAnalysis.analysisStatus} className="pl-2 border-l border-white/10 my-2">
+                    {todayAnalysis.analysisStatus === "pending" && (
+                      <p className="text-gray-400">&gt; <span className="animate-pulse">Analyzing journal entry...</span></p>
+                    )}
+                    {todayAnalysis.analysisStatus === "done" && (
+                      <>
+                        <p className="text-green-400">
+                          Mood: {todayAnalysis.emotionalState} // Energy: {todayAnalysis.energyLevel}/10
+                        </p>
+                        <p className="text-gray-300">{todayAnalysis.aiReflection}</p>
+                      </>
+                    )}
+                    {todayAnalysis.analysisStatus === "failed" && (
+                      <p className="text-red-400">Journal analysis unavailable.</p>
+                    )}
+                  </div>
+                )}
                 <p className="text-gray-400">&gt; <span className="animate-pulse">Awaiting new directives...</span></p>
               </div>
             </div>
@@ -211,7 +252,7 @@ export default function DashboardPage() {
                 domains={domains || []}
                 currentView={boardType as "weekly" | "monthly" | "annual"}
                 onViewChange={(view) => setBoardType(view)}
-                isLoading={boardLoading || domainsLoading}
+                isLoading={snapshotPending || boardLoading || domainsLoading}
               />
             </div>
 
@@ -1,7 +1,7 @@
 import { currentUser } from "@clerk/nextjs/server";
 import { redirect } from "next/navigation";
 import { Navbar } from "@/components/layout/Navbar";
-import { prisma } from "@/lib/prisma";
+import { getCurrentUserId } from "@/lib/auth/identity";
 
 export default async function ProtectedLayout({
   children,
@@ -21,20 +21,13 @@ export default async function ProtectedLayout({
     // 2. Deep Check: Database Source of Truth
     // This handles the race condition where Clerk metadata hasn't propagated yet
     // but the DB write in server action was successful.
-    const userEmail = user.emailAddresses[0]?.emailAddress;
-    if (userEmail) {
-      const dbUser = await prisma.user.findUnique({
-        where: { email: userEmail },
-        select: { id: true }
-      });
+    // Shares the per-request identity resolution with the server actions.
+    const dbUserId = await getCurrentUserId();
 
-      if (!dbUser) {
-        redirect("/onboarding");
-      }
-      // If dbUser exists, they are onboarded. Allow access.
-    } else {
+    if (!dbUserId) {
       redirect("/onboarding");
     }
+    // If dbUser exists, they are onboarded. Allow access.
   }
 
   return (
@@ -3,6 +3,7 @@
 import { motion } from "framer-motion";
 import { SystemPanel } from "@/components/shared/SystemPanel";
 import { SystemButton } from "@/components/shared/SystemButton";
+import { ReminderSettingsPanel } from "@/components/settings/ReminderSettingsPanel";
 import { useTheme } from "@/lib/contexts/ThemeContext";
 import { Moon, Sun } from "lucide-react";
 
@@ -57,6 +58,9 @@ export default function SettingsPage() {
         </div>
       </SystemPanel>
 
+      {/* Reminder Settings */}
+      <ReminderSettingsPanel />
+
       {/* Account Settings */}
       <SystemPanel title="ACCOUNT">
         <div className="space-y-4">
@@ -2,7 +2,11 @@
 
 import { prisma } from "@/lib/prisma";
 import { revalidatePath } from "next/cache";
-import type { VisionBoard, Domain, Goal as GoalType } from "@/lib/types";
+import { after } from "next/server";
+import { randomUUID } from "crypto";
+import { Prisma } from "@prisma/client";
+import type { VisionBoard as VisionBoardRow, TimelineSnapshot as TimelineSnapshotRow } from "@prisma/client";
+import type { VisionBoard, Domain, Goal as GoalType, Journal, TimelineSnapshot, PixelSummary } from "@/lib/types";
 
 // ... existing syncOnboardingData ...
 // (I will assume syncOnboardingData uses 'prisma' variable which is now imported)
@@ -38,109 +42,123 @@ interface OnboardingData {
     reminders: {
         bedtime: string;
         morning: string;
+        timezone?: string; // Browser zone, so reminders fire on the user's clock
     };
+    idempotencyKey: string; // One per onboarding completion, reused by retries
 }
 
+/**
+ * Persist a completed onboarding in one transaction: a half-written user is
+ * never left behind, and the round trips are fixed (bulk inserts, domains
+ * matched on Domain_userId_name_key) however many domains and goals there
+ * are. `idempotencyKey` identifies the completion; replaying the same call
+ * (a retry, a double submit) returns without writing anything again.
+ */
 export async function syncOnboardingData(data: OnboardingData) {
     try {
         // 1. Create or Update User
-        // For now, we'll create a dummy user or use a fixed one since auth isn't fully set up with a provider yet.
-        // In a real app, we'd get the user ID from the session.
         const clerkUser = await currentUser();
         if (!clerkUser?.emailAddresses[0]) return { success: false, error: "Unauthorized" };
         const userEmail = clerkUser.emailAddresses[0].emailAddress;
+        const timezone =
+            data.reminders.timezone && isValidTimeZone(data.reminders.timezone) ? data.reminders.timezone : undefined;
+        const profile = {
+            clerkId: clerkUser.id,
+            visionMotto: data.vision,
+            bedtimeReminder: data.reminders.bedtime,
+            morningReminder: data.reminders.morning,
+            timezone,
+        };
+
+        const { user, replayed } = await prisma.$transaction(async (tx) => {
+            // Row-locks the user, so concurrent replays run one after the other
+            const user = await tx.user.upsert({
+                where: { email: userEmail },
+                update: profile,
+                create: {
+                    email: userEmail,
+                    name: "Architect",
+                    username: "architect", // Default
+                    ...profile,
+                },
+            });
+            if (user.onboardingSyncKey === data.idempotencyKey) return { user, replayed: true };
 
-        const user = await prisma.user.upsert({
-            where: { email: userEmail },
-            update: {
-                visionMotto: data.vision,
-                bedtimeReminder: data.reminders.bedtime,
-                morningReminder: data.reminders.morning,
-            },
-            create: {
-                email: userEmail,
-                name: "Architect",
-                visionMotto: data.vision,
-                bedtimeReminder: data.reminders.bedtime,
-                morningReminder: data.reminders.morning,
-                username: "architect", // Default
-            },
-        });
-
-        // 2. Create Domains and Images
-        for (const d of data.domains) {
-            let domain = await prisma.domain.findFirst({
-                where: {
+            // 2. Domains: insert the new names, reuse the ones already there
+            await tx.domain.createMany({
+                data: data.domains.map((d) => ({
                     userId: user.id,
-                    name: d.name
-                }
+                    name: d.name,
+                    description: d.description,
+                    colorHex: d.colorHex,
+                    imageKeywords: d.imageKeywords,
+                })),
+                skipDuplicates: true,
             });
-
-            if (!domain) {
-                domain = await prisma.domain.create({
-                    data: {
-                        userId: user.id,
-                        name: d.name,
-                        description: d.description,
-                        colorHex: d.colorHex,
-                        imageKeywords: d.imageKeywords,
-                    },
+            const domains = await tx.domain.findMany({
+                where: { userId: user.id, name: { in: data.domains.map((d) => d.name) } },
+                select: { id: true, name: true },
+            });
+            const domainIds = new Map(domains.map((d) => [d.name, d.id]));
+
+            // 3. Images: the onboarding selection replaces a domain's images
+            const withImages = domains.filter((d) => (data.domainImages[d.name]?.length ?? 0) > 0);
+            if (withImages.length > 0) {
+                await tx.domainImage.deleteMany({ where: { domainId: { in: withImages.map((d) => d.id) } } });
+                await tx.domainImage.createMany({
+                    data: withImages.flatMap((d) =>
+                        data.domainImages[d.name].map((url, index) => ({ domainId: d.id, url, sortOrder: index }))
+                    ),
                 });
-            } else {
-                // Optional: Update exist domain if needed, but for now just skip creation
             }
 
-            // Add Images
-            const images = data.domainImages[d.name] || [];
-            if (images.length > 0) {
-                await prisma.domainImage.createMany({
-                    data: images.map((url, index) => ({
-                        domainId: domain.id,
-                        url: url,
-                        sortOrder: index,
-                    })),
+            // 4. Goals and their milestones, ids assigned here so both insert in bulk
+            const goals = data.goals
+                .filter((g) => domainIds.has(g.domain))
+                .map((g) => ({ id: randomUUID(), domainId: domainIds.get(g.domain)!, milestones: g.milestones }));
+            if (goals.length > 0) {
+                await tx.goal.createMany({
+                    // The onboarding goal has no title of its own; its milestones carry the detail
+                    data: goals.map((g) => ({ id: g.id, domainId: g.domainId, title: "Strategic Goal", status: "ACTIVE" })),
                 });
-            }
-
-            // 3. Create Goals
-            const goals = data.goals.filter((g) => g.domain === d.name);
-            for (const g of goals) {
-                await prisma.goal.create({
-                    data: {
-                        domainId: domain.id,
-                        title: "Strategic Goal", // The frontend 'goals' object structure seems to lack a 'title', using generic or mapping differently?
-                        // Wait, looking at OnboardingPage.tsx, 'goals' are 'Goal[]' where Goal has domain, milestones, todos.
-                        // But no explicit title for the Goal itself? It seems the Domain's 'suggestedGoal' was the high level one.
-                        // Let's assume the first milestone or the domain name implies the goal for now.
-                        // Actually, let's just use "Q1 Objective" as a placeholder or map better if possible.
-                        status: "ACTIVE",
-                        milestones: {
-                            create: g.milestones.map((m) => ({
-                                title: m,
-                                isCompleted: false,
-                            })),
-                        },
-                    },
+                await tx.milestone.createMany({
+                    data: goals.flatMap((g) => g.milestones.map((title) => ({ goalId: g.id, title, isCompleted: false }))),
                 });
             }
-        }
-
-        // 4. Create Initial Vision Board
-        await prisma.visionBoard.create({
-            data: {
-                userId: user.id,
-                type: "WEEKLY", // Default
-                startDate: new Date(),
-                endDate: new Date(Date.now() + 7 * 24 * 60 * 60 * 1000), // 7 days from now
-                designId: data.design,
-                isPublic: true,
-                totalPixels: 7500, // Default from setup
-                coloredPixels: 0,
-                pixelState: [], // Empty initially
-            },
+
+            // 5. Create Initial Vision Board, its fill order fixed to the domains it starts with
+            const boardDomains = await tx.domain.findMany({
+                where: { userId: user.id },
+                select: { id: true },
+                orderBy: DOMAIN_ORDER,
+            });
+            await tx.visionBoard.create({
+                data: {
+                    userId: user.id,
+                    type: "WEEKLY", // Default
+                    startDate: new Date(),
+                    endDate: new Date(Date.now() + 7 * 24 * 60 * 60 * 1000), // 7 days from now
+                    designId: data.design,
+                    isPublic: true,
+                    totalPixels: 7500, // Default from setup
+                    coloredPixels: 0,
+                    fillDomainIds: boardDomains.map((d) => d.id),
+                },
+                select: { id: true },
+            });
+
+            await tx.user.update({
+                where: { id: user.id },
+                data: { onboardingSyncKey: data.idempotencyKey },
+                select: { id: true },
+            });
+            return { user, replayed: false };
         });
 
-        revalidatePath("/dashboard");
+        // Idempotent, so it also runs on a replay whose first attempt died before it
+        await rescheduleReminders(user.id, user);
+
+        if (!replayed) revalidatePath("/dashboard");
         return { success: true, userId: user.id };
     } catch (error) {
         console.error("Sync failed:", error);
@@ -150,26 +168,66 @@ export async function syncOnboardingData(data: OnboardingData) {
 // ... existing code ...
 
 import { currentUser } from "@clerk/nextjs/server";
+import { getCurrentUserId } from "@/lib/auth/identity";
+import { awardPixels, JOURNAL_PIXELS } from "@/lib/pixels/state";
+import { pixelSummary } from "@/lib/pixels/ledger";
+import { DOMAIN_ORDER } from "@/lib/pixels/grid";
+import { SNAPSHOT_TYPE, type DomainBreakdownEntry } from "@/lib/timeline/snapshots";
+import { requestJournalAnalysis } from "@/app/functions/inngest/journal-analysis";
+import { rescheduleReminders, type ReminderSettings } from "@/lib/reminders/schedule";
+import { isValidReminderTime, isValidTimeZone, type ReminderKind } from "@/lib/reminders/time";
+import {
+    advanceStreak,
+    dayNumber,
+    dayNumberFromISO,
+    dayToDate,
+    streakAsOf,
+    type StreakAggregate,
+    type StreakData,
+} from "@/lib/utils/streakCalculator";
 
 // ... existing code ...
 
-export async function getCurrentBoard(): Promise<VisionBoard | null> {
-    const clerkUser = await currentUser();
-    if (!clerkUser?.emailAddresses[0]) return null;
-
-    const user = await prisma.user.findUnique({ where: { email: clerkUser.emailAddresses[0].emailAddress } });
-    if (!user) return null;
-
-    const board = await prisma.visionBoard.findFirst({
-        where: {
-            userId: user.id,
-            endDate: { gte: new Date() }
-        },
-        orderBy: { startDate: 'desc' }
-    });
-
-    if (!board) return null;
-
+// --- Read models ---
+// Query shapes and DTO mappers shared by the single-resource actions and
+// getDashboardSnapshot, so both always return identical payloads.
+
+const currentBoardQuery = (userId: string) => ({
+    where: {
+        userId,
+        endDate: { gte: new Date() }
+    },
+    orderBy: { startDate: 'desc' as const }
+});
+
+const domainsQuery = (userId: string) => ({
+    where: { userId },
+    orderBy: DOMAIN_ORDER,
+    include: { images: { orderBy: { sortOrder: 'asc' as const } } }
+});
+
+const activeGoalsQuery = (userId: string) => ({
+    where: {
+        domain: { userId },
+        status: "ACTIVE"
+    },
+    include: { milestones: true }
+});
+
+const journalsQuery = (userId: string) => ({
+    where: { userId },
+    orderBy: { date: 'desc' as const },
+    take: 365
+});
+
+// Materialized weekly rollups (lib/timeline/snapshots.ts), newest first
+const timelineQuery = (userId: string, count: number) => ({
+    where: { userId, type: SNAPSHOT_TYPE },
+    orderBy: { date: 'desc' as const },
+    take: count
+});
+
+function mapBoard(board: VisionBoardRow): VisionBoard {
     return {
         id: board.id,
         userId: board.userId,
@@ -182,24 +240,15 @@ export async function getCurrentBoard(): Promise<VisionBoard | null> {
         currentImageUrl: board.baseImage || "",
         totalPixels: board.totalPixels,
         coloredPixels: board.coloredPixels,
+        fillSeed: board.fillSeed,
+        fillDomainIds: board.fillDomainIds,
         lastUpdated: new Date().toISOString(),
         createdAt: new Date().toISOString()
     };
 }
 
-export async function getDomains(): Promise<Domain[]> {
-    const clerkUser = await currentUser();
-    if (!clerkUser?.emailAddresses[0]) return [];
-
-    const user = await prisma.user.findUnique({ where: { email: clerkUser.emailAddresses[0].emailAddress } });
-    if (!user) return [];
-
-    const domains = await prisma.domain.findMany({
-        where: { userId: user.id },
-        include: { images: { orderBy: { sortOrder: 'asc' } } }
-    });
-
-    return domains.map((d: any) => ({
+function mapDomain(d: any): Domain {
+    return {
         id: d.id,
         name: d.name,
         description: d.description || "",
@@ -210,27 +259,15 @@ export async function getDomains(): Promise<Domain[]> {
             id: img.id,
             imageUrl: img.url,
             sortOrder: img.sortOrder,
-            uploadedAt: new Date().toISOString()
+            uploadedAt: new Date().toISOString(),
+            variants: img.variants ?? undefined,
+            placeholder: img.placeholder,
         }))
-    }));
+    };
 }
 
-export async function getGoals(): Promise<GoalType[]> {
-    const clerkUser = await currentUser();
-    if (!clerkUser?.emailAddresses[0]) return [];
-
-    const user = await prisma.user.findUnique({ where: { email: clerkUser.emailAddresses[0].emailAddress } });
-    if (!user) return [];
-
-    const goals = await prisma.goal.findMany({
-        where: {
-            domain: { userId: user.id },
-            status: "ACTIVE"
-        },
-        include: { milestones: true }
-    });
-
-    return goals.map((g: any) => ({
+function mapGoal(g: any): GoalType {
+    return {
         id: g.id,
         domainId: g.domainId,
         title: g.title,
@@ -246,106 +283,337 @@ export async function getGoals(): Promise<GoalType[]> {
             completedAt: m.isCompleted ? new Date().toISOString() : null,
             sortOrder: 0
         }))
-    }));
+    };
 }
-// ... existing code ...
 
-export async function submitJournal(text: string): Promise<{ success: boolean; pixelsEarned: number }> {
-    const clerkUser = await currentUser();
-    if (!clerkUser?.emailAddresses[0]) return { success: false, pixelsEarned: 0 };
+// Clears a previous analysis so the entry is picked up again, with a fresh retry budget
+const pendingAnalysis = () => ({
+    sentiment: null,
+    effortScore: null,
+    aiReflection: null,
+    analysisStatus: "PENDING",
+    analyzedAt: null,
+    analysisAttempts: 0,
+    analysisQueuedAt: new Date()
+});
+
+function mapJournal(j: any): Journal {
+    return {
+        id: j.id,
+        userId: j.userId,
+        journalDate: j.date.toISOString().split('T')[0], // format YYYY-MM-DD
+        entryText: j.text,
+        emotionalState: j.sentiment,
+        energyLevel: j.effortScore,
+        aiReflection: j.aiReflection ?? null,
+        analysisStatus: j.analysisStatus?.toLowerCase(),
+        submittedAt: j.date.toISOString(),
+        completedTasks: [] // handle task completion JSON parsing if needed
+    };
+}
+
+const streakSelect = {
+    timezone: true,
+    streakCurrent: true,
+    streakLongest: true,
+    streakLastDay: true,
+    journalCount: true,
+} as const;
+
+type StreakRow = {
+    streakCurrent: number;
+    streakLongest: number;
+    streakLastDay: Date | null;
+    journalCount: number;
+};
+
+function streakAggregate(row: StreakRow): StreakAggregate {
+    return {
+        currentStreak: row.streakCurrent,
+        longestStreak: row.streakLongest,
+        lastDay: row.streakLastDay ? dayNumberFromISO(row.streakLastDay.toISOString()) : null,
+        totalJournals: row.journalCount,
+    };
+}
+
+function streakColumns(aggregate: StreakAggregate) {
+    return {
+        streakCurrent: aggregate.currentStreak,
+        streakLongest: aggregate.longestStreak,
+        streakLastDay: aggregate.lastDay === null ? null : dayToDate(aggregate.lastDay),
+        journalCount: aggregate.totalJournals,
+    };
+}
+
+function mapStreak(row: (StreakRow & { timezone: string }) | null): StreakData | null {
+    if (!row) return null;
+    return streakAsOf(streakAggregate(row), dayNumber(new Date(), row.timezone));
+}
+
+// Map to frontend TimelineSnapshot type
+function mapTimelineSnapshot(s: TimelineSnapshotRow): TimelineSnapshot {
+    const domainBreakdown = (s.domainBreakdown ?? []) as unknown as DomainBreakdownEntry[];
+    return {
+        id: s.id,
+        snapshotDate: s.date.toISOString(),
+        snapshotType: s.type as TimelineSnapshot["snapshotType"],
+        weekNumber: s.weekNumber,
+        boardImageUrl: s.imageUrl || "/placeholder-board.png",
+        narrativeText: s.narrative,
+        animationUrl: s.animationUrl,
+        pixelsSummary: {
+            totalPixels: s.pixelCount,
+            completionRate: s.completionRate,
+            domainBreakdown
+        },
+        journalCount: s.journalCount,
+        topDomains: domainBreakdown.slice(0, 3).map((d) => d.domainId),
+        createdAt: s.updatedAt.toISOString()
+    };
+}
+
+export type TimelineWeek = TimelineSnapshot;
+
+export async function getCurrentBoard(): Promise<VisionBoard | null> {
+    const userId = await getCurrentUserId();
+    if (!userId) return null;
+
+    const board = await prisma.visionBoard.findFirst(currentBoardQuery(userId));
+    return board ? mapBoard(board) : null;
+}
+
+export async function getDomains(): Promise<Domain[]> {
+    const userId = await getCurrentUserId();
+    if (!userId) return [];
+
+    const domains = await prisma.domain.findMany(domainsQuery(userId));
+    return domains.map(mapDomain);
+}
+
+export async function getGoals(): Promise<GoalType[]> {
+    const userId = await getCurrentUserId();
+    if (!userId) return [];
 
-    const user = await prisma.user.findUnique({ where: { email: clerkUser.emailAddresses[0].emailAddress } });
-    if (!user) return { success: false, pixelsEarned: 0 };
+    const goals = await prisma.goal.findMany(activeGoalsQuery(userId));
+    return goals.map(mapGoal);
+}
+// ... existing code ...
+
+export async function submitJournal(text: string): Promise<{ success: boolean; pixelsEarned: number; journalId?: string }> {
+    const userId = await getCurrentUserId();
+    if (!userId) return { success: false, pixelsEarned: 0 };
 
     const today = new Date();
+    const user = await prisma.user.findUnique({ where: { id: userId }, select: { timezone: true } });
+    // The user's calendar day, stored as a DATE
+    const day = dayNumber(today, user?.timezone);
+    const date = dayToDate(day);
+
+    // 1. Create Journal Entry (one per day, DailyJournal_userId_date_key)
+    //    and advance the streak aggregate in the same transaction
+    //    Sentiment/energy/reflection are filled in later by analyzeJournals
+    let journalId: string;
+    try {
+        journalId = await prisma.$transaction(async (tx) => {
+            const journal = await tx.dailyJournal.create({
+                data: { userId, date, text },
+                select: { id: true }
+            });
+            const row = await tx.user.findUniqueOrThrow({ where: { id: userId }, select: streakSelect });
+            await tx.user.update({
+                where: { id: userId },
+                data: streakColumns(advanceStreak(streakAggregate(row), day))
+            });
+            return journal.id;
+        });
+    } catch (error) {
+        if (!(error instanceof Prisma.PrismaClientKnownRequestError && error.code === "P2002")) throw error;
+        // Already journaled today: keep the latest text, no second reward, re-analyze
+        const journal = await prisma.dailyJournal.update({
+            where: { userId_date: { userId, date } },
+            data: { text, ...pendingAnalysis() },
+            select: { id: true }
+        });
+        after(() => requestJournalAnalysis(journal.id));
+        revalidatePath("/dashboard");
+        return { success: true, pixelsEarned: 0, journalId: journal.id };
+    }
 
-    // 1. Create Journal Entry
-    await prisma.dailyJournal.create({
-        data: {
-            userId: user.id,
-            date: today,
-            text: text,
-            sentiment: "neutral", // analyze with AI later
-            effortScore: 5
-        }
-    });
+    // Queued once the response is sent; the sweep retries if this is lost
+    after(() => requestJournalAnalysis(journalId));
 
     // 2. Reward Pixels
-    const PIXEL_REWARD = 50;
-
     // Update Board
     const board = await prisma.visionBoard.findFirst({
-        where: { userId: user.id, endDate: { gte: today } },
-        orderBy: { startDate: 'desc' }
+        where: { userId, endDate: { gte: today } },
+        orderBy: { startDate: 'desc' },
+        select: { id: true }
     });
 
     if (board) {
-        await prisma.visionBoard.update({
-            where: { id: board.id },
-            data: {
-                coloredPixels: { increment: PIXEL_REWARD },
-                // complex: update pixelState here? For MVP, just update count. 
-                // PixelatedBoard renders based on count random fill locally if state is missing.
-            }
-        });
+        // Bumps coloredPixels and lights the matching cells in the board bitmap
+        await awardPixels(board.id, JOURNAL_PIXELS, { source: "journal", sourceId: journalId, day });
     }
 
     revalidatePath("/dashboard");
-    return { success: true, pixelsEarned: PIXEL_REWARD };
+    return { success: true, pixelsEarned: JOURNAL_PIXELS, journalId };
 }
-// ... existing code ...
 
-export async function getJournals() {
-    const clerkUser = await currentUser();
-    if (!clerkUser?.emailAddresses[0]) return [];
+export type JournalAnalysisView = Pick<Journal, "id" | "emotionalState" | "energyLevel" | "aiReflection" | "analysisStatus">;
 
-    const user = await prisma.user.findUnique({ where: { email: clerkUser.emailAddresses[0].emailAddress } });
-    if (!user) return [];
+/** Analysis state of one of the caller's entries; polled until it leaves "pending". */
+export async function getJournalAnalysis(journalId: string): Promise<JournalAnalysisView | null> {
+    const userId = await getCurrentUserId();
+    if (!userId) return null;
 
-    const journals = await prisma.dailyJournal.findMany({
-        where: { userId: user.id },
-        orderBy: { date: 'desc' },
-        take: 365
+    const j = await prisma.dailyJournal.findFirst({
+        where: { id: journalId, userId },
+        select: { id: true, sentiment: true, effortScore: true, aiReflection: true, analysisStatus: true }
     });
-
-    return journals.map((j: any) => ({
+    if (!j) return null;
+    return {
         id: j.id,
-        userId: j.userId,
-        journalDate: j.date.toISOString().split('T')[0], // format YYYY-MM-DD
-        entryText: j.text,
         emotionalState: j.sentiment,
         energyLevel: j.effortScore,
-        aiReflection: null,
-        submittedAt: j.date.toISOString(),
-        completedTasks: [] // handle task completion JSON parsing if needed
-    }));
+        aiReflection: j.aiReflection,
+        analysisStatus: j.analysisStatus.toLowerCase() as JournalAnalysisView["analysisStatus"],
+    };
+}
+// ... existing code ...
+
+export async function getJournals(): Promise<Journal[]> {
+    const userId = await getCurrentUserId();
+    if (!userId) return [];
+
+    const journals = await prisma.dailyJournal.findMany(journalsQuery(userId));
+    return journals.map(mapJournal);
 }
 
-export async function getTimelineWeeks(count: number = 26) {
-    const clerkUser = await currentUser();
-    if (!clerkUser?.emailAddresses[0]) return [];
+export async function getTimelineWeeks(count: number = 26): Promise<TimelineWeek[]> {
+    const userId = await getCurrentUserId();
+    if (!userId) return [];
 
-    const user = await prisma.user.findUnique({ where: { email: clerkUser.emailAddresses[0].emailAddress } });
-    if (!user) return [];
+    const snapshots = await prisma.timelineSnapshot.findMany(timelineQuery(userId, count));
+    return snapshots.map(mapTimelineSnapshot);
+}
 
-    const snapshots = await prisma.timelineSnapshot.findMany({
-        where: { userId: user.id },
-        orderBy: { date: 'desc' },
-        take: count
-    });
+/** Streak from the persisted aggregate, no journal history read. */
+export async function getStreak(): Promise<StreakData | null> {
+    const userId = await getCurrentUserId();
+    if (!userId) return null;
 
-    // Map to frontend TimelineSnapshot type
-    return snapshots.map((s) => ({
-        id: s.id,
-        snapshotDate: s.date.toISOString(),
-        weekNumber: Math.ceil((s.date.getDate() - 1) / 7), // Approximate or store explicit week
-        pixelsSummary: {
-            totalPixels: s.pixelCount,
-            completionRate: s.completionRate,
-            domainBreakdown: [] // Need to store this in snapshot if we want it
+    return mapStreak(await prisma.user.findUnique({ where: { id: userId }, select: streakSelect }));
+}
+
+/**
+ * Pixels earned between two dates (inclusive; ISO dates or timestamps, read
+ * as the user's calendar days). No start means all history; no end, today.
+ */
+export async function getPixelSummary(start?: string, end?: string): Promise<PixelSummary | null> {
+    const userId = await getCurrentUserId();
+    if (!userId) return null;
+
+    const user = await prisma.user.findUnique({ where: { id: userId }, select: { timezone: true } });
+    const toDay = (value: string) =>
+        value.length === 10 ? dayNumberFromISO(value) : dayNumber(new Date(value), user?.timezone);
+    return pixelSummary(userId, start ? toDay(start) : null, end ? toDay(end) : dayNumber(new Date(), user?.timezone));
+}
+
+export interface DashboardSnapshot {
+    board: VisionBoard | null;
+    domains: Domain[];
+    goals: GoalType[];
+    journals: Journal[];
+    timeline: TimelineWeek[];
+    streak: StreakData | null;
+}
+
+/**
+ * Everything the dashboard renders, in one server-action round trip; the
+ * client seeds the per-resource query caches from it. The reads are
+ * independent and run concurrently on separate pooled connections, so the
+ * round trip costs the slowest query rather than the sum of all six.
+ */
+export async function getDashboardSnapshot(timelineWeeks: number = 26): Promise<DashboardSnapshot | null> {
+    const userId = await getCurrentUserId();
+    if (!userId) return null;
+
+    const [board, domains, goals, journals, snapshots, streak] = await Promise.all([
+        prisma.visionBoard.findFirst(currentBoardQuery(userId)),
+        prisma.domain.findMany(domainsQuery(userId)),
+        prisma.goal.findMany(activeGoalsQuery(userId)),
+        prisma.dailyJournal.findMany(journalsQuery(userId)),
+        prisma.timelineSnapshot.findMany(timelineQuery(userId, timelineWeeks)),
+        prisma.user.findUnique({ where: { id: userId }, select: streakSelect }),
+    ]);
+
+    return {
+        board: board ? mapBoard(board) : null,
+        domains: domains.map(mapDomain),
+        goals: goals.map(mapGoal),
+        journals: journals.map(mapJournal),
+        timeline: snapshots.map(mapTimelineSnapshot),
+        streak: mapStreak(streak),
+    };
+}
+
+// --- Reminders ---
+
+const reminderSettingsSelect = {
+    timezone: true,
+    bedtimeReminder: true,
+    morningReminder: true,
+    emailNotify: true,
+    pushNotify: true,
+} as const;
+
+export interface ReminderSettingsView extends ReminderSettings {
+    next: Partial<Record<ReminderKind, string>>; // ISO instants, absent when off
+}
+
+export async function getReminderSettings(): Promise<ReminderSettingsView | null> {
+    const userId = await getCurrentUserId();
+    if (!userId) return null;
+
+    const [settings, schedule] = await prisma.$transaction([
+        prisma.user.findUnique({ where: { id: userId }, select: reminderSettingsSelect }),
+        prisma.reminderSchedule.findMany({ where: { userId }, select: { kind: true, nextFireAt: true } }),
+    ]);
+    if (!settings) return null;
+    return {
+        ...settings,
+        next: Object.fromEntries(schedule.map((r) => [r.kind, r.nextFireAt.toISOString()])),
+    };
+}
+
+/** Save reminder settings and move this user's schedule rows; no other user is touched. */
+export async function updateReminderSettings(
+    input: ReminderSettings
+): Promise<{ success: true; settings: ReminderSettingsView } | { success: false; error: string }> {
+    const userId = await getCurrentUserId();
+    if (!userId) return { success: false, error: "Unauthorized" };
+    if (!isValidReminderTime(input.bedtimeReminder) || !isValidReminderTime(input.morningReminder)) {
+        return { success: false, error: "Reminder times must be HH:MM" };
+    }
+    if (!isValidTimeZone(input.timezone)) return { success: false, error: "Unknown timezone" };
+
+    const settings = await prisma.user.update({
+        where: { id: userId },
+        data: {
+            timezone: input.timezone,
+            bedtimeReminder: input.bedtimeReminder,
+            morningReminder: input.morningReminder,
+            emailNotify: input.emailNotify,
+            pushNotify: input.pushNotify,
         },
-        narrativeText: s.narrative || "",
-        highlightImage: s.imageUrl || "/placeholder-board.png",
-        topDomains: []
-    }));
+        select: reminderSettingsSelect,
+    });
+    const next = await rescheduleReminders(userId, settings);
+    return {
+        success: true,
+        settings: {
+            ...settings,
+            next: Object.fromEntries(Object.entries(next).map(([kind, at]) => [kind, at.toISOString()])),
+        },
+    };
 }
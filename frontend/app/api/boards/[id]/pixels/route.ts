@@ -0,0 +1,28 @@
+import { getCurrentUserId } from "@/lib/auth/identity";
+import { getPixelBitmap } from "@/lib/pixels/state";
+import { GRID_COLS, GRID_ROWS } from "@/lib/pixels/grid";
+
+// Raw board bitmap (1 bit per cell, see lib/pixels/bitmap.ts) for the client to blit
+export async function GET(request: Request, { params }: { params: Promise<{ id: string }> }) {
+    const userId = await getCurrentUserId();
+    if (!userId) return new Response(null, { status: 401 });
+
+    const { id } = await params;
+    const result = await getPixelBitmap(userId, id);
+    // No stored bits yet: the client falls back to the fill-order prefix
+    if (!result?.bitmap) return new Response(null, { status: 404 });
+
+    // Bits only change together with coloredPixels
+    const etag = `"${id}:${result.coloredPixels}"`;
+    const headers = {
+        "Content-Type": "application/octet-stream",
+        "Cache-Control": "private, no-cache",
+        ETag: etag,
+        "X-Grid-Cols": String(GRID_COLS),
+        "X-Grid-Rows": String(GRID_ROWS),
+    };
+    if (request.headers.get("if-none-match") === etag) {
+        return new Response(null, { status: 304, headers });
+    }
+    return new Response(result.bitmap, { headers });
+}
@@ -0,0 +1,37 @@
+import { getCurrentUserId } from "@/lib/auth/identity";
+import { getWallpaper } from "@/lib/wallpaper/export";
+import { isWallpaperFormat, isWallpaperPreset, WALLPAPER_MIME } from "@/lib/wallpaper/presets";
+
+// Board wallpaper at a device preset: ?preset=phone|desktop|desktop-4k&format=png|webp
+export async function GET(request: Request, { params }: { params: Promise<{ id: string }> }) {
+    const userId = await getCurrentUserId();
+    if (!userId) return new Response(null, { status: 401 });
+
+    const search = new URL(request.url).searchParams;
+    const preset = search.get("preset") ?? "desktop";
+    const format = search.get("format") ?? "png";
+    if (!isWallpaperPreset(preset) || !isWallpaperFormat(format)) return new Response(null, { status: 400 });
+
+    const { id } = await params;
+    const wallpaper = await getWallpaper(userId, id, preset, format);
+    if (!wallpaper) return new Response(null, { status: 404 });
+
+    // The key hashes every render input, so it only changes with the image
+    const etag = `"${wallpaper.key}"`;
+    const headers = {
+        "Content-Type": WALLPAPER_MIME[format],
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": `${search.has("download") ? "attachment" : "inline"}; filename="vision-board-${preset}.${format}"`,
+        ETag: etag,
+    };
+    if (request.headers.get("if-none-match") === etag) {
+        return new Response(null, { status: 304, headers });
+    }
+
+    try {
+        return new Response(new Uint8Array(await wallpaper.load()), { headers });
+    } catch (error) {
+        console.error("Wallpaper render failed:", error);
+        return new Response(null, { status: 500 });
+    }
+}
@@ -0,0 +1,38 @@
+import { getCurrentUserId } from "@/lib/auth/identity";
+import { sendDueReminders } from "@/lib/reminders/schedule";
+import { FileNotificationSink, getNotificationSink } from "@/lib/reminders/sink";
+import { floorToMinute } from "@/lib/reminders/time";
+
+/**
+ * Local testing hooks for the reminder scheduler (TC012). Only served with
+ * the fake file sink (NOTIFICATION_SINK=file) outside production.
+ *
+ *   POST { at: ISO }  run the scheduler tick for that minute
+ *   GET               notifications the fake sink recorded for the caller
+ */
+function fakeSink() {
+    const sink = getNotificationSink();
+    return process.env.NODE_ENV !== "production" && sink instanceof FileNotificationSink ? sink : null;
+}
+
+export async function POST(request: Request) {
+    if (!fakeSink()) return new Response(null, { status: 404 });
+    if (!(await getCurrentUserId())) return new Response(null, { status: 401 });
+
+    const body = (await request.json().catch(() => ({}))) as { at?: string };
+    const at = new Date(body.at ?? Date.now());
+    if (Number.isNaN(at.getTime())) return Response.json({ error: "Invalid 'at'" }, { status: 400 });
+
+    const minute = floorToMinute(at);
+    return Response.json({ minute: minute.toISOString(), ...(await sendDueReminders(minute)) });
+}
+
+export async function GET() {
+    const sink = fakeSink();
+    if (!sink) return new Response(null, { status: 404 });
+    const userId = await getCurrentUserId();
+    if (!userId) return new Response(null, { status: 401 });
+
+    const notifications = (await sink.read()).filter((n) => n.userId === userId);
+    return Response.json({ notifications });
+}
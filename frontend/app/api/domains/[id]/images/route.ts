@@ -0,0 +1,29 @@
+import { getCurrentUserId } from "@/lib/auth/identity";
+import { addDomainImage } from "@/lib/images/ingest";
+
+const MAX_UPLOAD_BYTES = 20 * 1024 * 1024;
+
+// Refused uploads are the client's to fix, not server errors
+const ERROR_STATUS = { "not-found": 404, "unsupported-format": 415, "too-large": 422, undecodable: 422 } as const;
+
+// Multipart upload (field "file") of an image for one of the user's domains
+export async function POST(request: Request, { params }: { params: Promise<{ id: string }> }) {
+    const userId = await getCurrentUserId();
+    if (!userId) return new Response(null, { status: 401 });
+
+    const form = await request.formData().catch(() => null);
+    const file = form?.get("file");
+    if (!(file instanceof File)) return new Response(null, { status: 400 });
+    if (!file.type.startsWith("image/")) return new Response(null, { status: 415 });
+    if (file.size > MAX_UPLOAD_BYTES) return new Response(null, { status: 413 });
+
+    const { id } = await params;
+    try {
+        const result = await addDomainImage(userId, id, Buffer.from(await file.arrayBuffer()));
+        if (!result.success) return Response.json({ error: result.error }, { status: ERROR_STATUS[result.error] });
+        return Response.json(result.image, { status: 201 });
+    } catch (error) {
+        console.error("Image upload failed:", error);
+        return new Response(null, { status: 500 });
+    }
+}
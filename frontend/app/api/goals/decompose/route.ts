@@ -0,0 +1,43 @@
+import { auth } from "@clerk/nextjs/server";
+import { DomainGoalInputSchema, streamDecomposition, type DecompositionEvent } from "@/lib/ai/decomposition";
+
+const BodySchema = DomainGoalInputSchema;
+
+// Goal breakdown as NDJSON, one DecompositionEvent per line, flushed per element
+export async function POST(request: Request) {
+    // Clerk session only: onboarding runs before our User row exists
+    const { userId } = await auth();
+    if (!userId) return new Response(null, { status: 401 });
+
+    const body = BodySchema.safeParse(await request.json().catch(() => null));
+    if (!body.success) return new Response(null, { status: 400 });
+
+    const events = streamDecomposition(body.data.domain, body.data.goal, request.signal);
+    const encoder = new TextEncoder();
+    const line = (event: DecompositionEvent) => encoder.encode(JSON.stringify(event) + "\n");
+
+    const stream = new ReadableStream<Uint8Array>({
+        async pull(controller) {
+            try {
+                const { value, done } = await events.next();
+                if (done) controller.close();
+                else controller.enqueue(line(value));
+            } catch (error) {
+                console.error("AI Decomposition Error:", error);
+                controller.enqueue(line({ type: "error", error: "Failed to decompose goal." }));
+                controller.close();
+            }
+        },
+        async cancel() {
+            await events.return(undefined);
+        },
+    });
+
+    return new Response(stream, {
+        headers: {
+            "Content-Type": "application/x-ndjson; charset=utf-8",
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no", // don't let a proxy hold the stream back
+        },
+    });
+}
@@ -0,0 +1,26 @@
+import { readFile } from "fs/promises";
+import { isContentHash, variantFile } from "@/lib/images/store";
+import { IMAGE_MIME, IMAGE_VARIANT_WIDTHS, type ImageFormat } from "@/lib/images/variants";
+
+// One stored size of an upload, AVIF when the client accepts it, else WebP
+export async function GET(request: Request, { params }: { params: Promise<{ hash: string; width: string }> }) {
+    const { hash, width } = await params;
+    const w = Number(width);
+    // Variant widths are the board widths, or an original narrower than the largest
+    if (!isContentHash(hash) || !Number.isInteger(w) || w < 1 || w > IMAGE_VARIANT_WIDTHS[IMAGE_VARIANT_WIDTHS.length - 1]) {
+        return new Response(null, { status: 404 });
+    }
+
+    const format: ImageFormat = request.headers.get("accept")?.includes("image/avif") ? "avif" : "webp";
+    const data = await readFile(variantFile(hash, w, format)).catch(() => null);
+    if (!data) return new Response(null, { status: 404 });
+
+    return new Response(new Uint8Array(data), {
+        headers: {
+            "Content-Type": IMAGE_MIME[format],
+            // Content-addressed: the bytes under this URL never change
+            "Cache-Control": "public, max-age=31536000, immutable",
+            Vary: "Accept",
+        },
+    });
+}
@@ -2,11 +2,21 @@ import { serve } from "inngest/next";
 import { inngest } from "@/lib/inngest/client";
 
 // We will import functions here as we create them
-import { generateWeeklyPlan } from "@/app/functions/inngest/weekly-planning";
+import { generateWeeklyPlan, generateUserWeeklyPlan, reportWeeklyPlans } from "@/app/functions/inngest/weekly-planning";
+import { sendReminders } from "@/app/functions/inngest/reminders";
+import { analyzeJournals, sweepPendingJournals } from "@/app/functions/inngest/journal-analysis";
+import { materializeTimeline, materializeUserTimeline } from "@/app/functions/inngest/timeline";
 
 export const { GET, POST, PUT } = serve({
     client: inngest,
     functions: [
-        generateWeeklyPlan
+        generateWeeklyPlan,
+        generateUserWeeklyPlan,
+        reportWeeklyPlans,
+        sendReminders,
+        analyzeJournals,
+        sweepPendingJournals,
+        materializeTimeline,
+        materializeUserTimeline,
     ],
 });
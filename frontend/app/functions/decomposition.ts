@@ -1,46 +1,65 @@
 "use server";
 
-import { generateObject } from "ai";
+import { auth } from "@clerk/nextjs/server";
 import { z } from "zod";
 import { getModel, getFastModel } from "@/lib/ai/model";
+import { cachedGenerateObject } from "@/lib/ai/cache";
+import {
+    DecompositionSchema,
+    decompositionPrompt,
+    decomposeGoals as decomposeGoalsBatch,
+    DomainGoalInputSchema,
+    MAX_DECOMPOSITION_DOMAINS,
+    type DomainGoalInput,
+} from "@/lib/ai/decomposition";
 
-// Schema for the AI Deep Breakdown
-const DecompositionSchema = z.object({
-    milestones: z.array(z.string()).describe("4 Quarterly milestones (Q1, Q2, Q3, Q4)"),
-    monthOneTodos: z.array(z.object({
-        week: z.number().min(1).max(4),
-        task: z.string().describe("Specific actionable task"),
-        effort: z.enum(["Low", "Medium", "High"]).describe("Estimated effort"),
-    })).describe("Detailed breakdown for the first month (4 weeks)"),
-});
+const GoalsSchema = z.array(DomainGoalInputSchema).min(1).max(MAX_DECOMPOSITION_DOMAINS);
 
+// Blocking variant; onboarding streams the same breakdown from /api/goals/decompose
 export async function decomposeGoal(domain: string, goal: string) {
+    // Clerk session only, as in /api/goals/decompose: onboarding runs before our User row exists
+    const { userId } = await auth();
+    if (!userId) return { success: false, error: "Unauthorized" };
+    if (!DomainGoalInputSchema.safeParse({ domain, goal }).success) return { success: false, error: "Invalid goal." };
+
     console.log(`SERVER ACTION: decomposeGoal called for domain: ${domain}`);
     try {
         console.log("SERVER ACTION: Calling AI with Fast Model...");
-        const { object } = await generateObject({
+        const { object, cached } = await cachedGenerateObject({
+            namespace: "decomposition",
             model: getFastModel(), // Switched to Flash for speed & better rate limits
             schema: DecompositionSchema,
-            prompt: `
-        You are a Strategic Planning AI.
-        
-        The user has a goal in the "${domain}" domain: "${goal}".
-        
-        Your task:
-        1. Break this 1-year goal into 4 distinct Quarterly Milestones (Q1, Q2, Q3, Q4).
-        2. Create a detailed weekly action plan for ONLY the first month (Month 1).
-        
-        Guidelines:
-        - Be realistic. A user cannot run a marathon in Week 1.
-        - Start small to build momentum.
-        - Ensure tasks are concrete (e.g., "Research gyms" vs "Get fit").
-      `,
+            prompt: decompositionPrompt(domain, goal),
         });
 
-        console.log("SERVER ACTION: Decomposition Success");
+        console.log(`SERVER ACTION: Decomposition Success${cached ? " (cached)" : ""}`);
         return { success: true, data: object };
     } catch (error) {
         console.error("SERVER ACTION: AI Decomposition Error:", error);
         return { success: false, error: "Failed to decompose goal." };
     }
 }
+
+/**
+ * Every onboarding domain in one model call (see lib/ai/decomposition.ts).
+ * `data` is keyed by domain name, each entry succeeding or failing on its own.
+ * Signed-in callers only, with at most MAX_DECOMPOSITION_DOMAINS bounded goals.
+ */
+export async function decomposeGoals(input: DomainGoalInput[]) {
+    const { userId } = await auth();
+    if (!userId) return { success: false, error: "Unauthorized" };
+    const parsed = GoalsSchema.safeParse(input);
+    if (!parsed.success) return { success: false, error: "Invalid goals." };
+    const goals = parsed.data;
+
+    console.log(`SERVER ACTION: decomposeGoals called for ${goals.length} domains`);
+    try {
+        const data = await decomposeGoalsBatch(goals);
+        const failed = Object.values(data).filter((r) => !r.success).length;
+        console.log(`SERVER ACTION: Batch Decomposition Done (${goals.length - failed}/${goals.length} succeeded)`);
+        return { success: true, data };
+    } catch (error) {
+        console.error("SERVER ACTION: AI Batch Decomposition Error:", error);
+        return { success: false, error: "Failed to decompose goals." };
+    }
+}
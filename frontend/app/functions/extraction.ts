@@ -1,8 +1,8 @@
 "use server";
 
-import { generateObject } from "ai";
 import { z } from "zod";
 import { getFastModel } from "@/lib/ai/model";
+import { cachedGenerateObject } from "@/lib/ai/cache";
 
 // Schema for the AI response
 const DomainSchema = z.object({
@@ -25,7 +25,8 @@ export async function extractDomainsFromVision(visionText: string) {
     console.log("SERVER ACTION: extractDomainsFromVision called with:", visionText.substring(0, 50) + "...");
     try {
         console.log("SERVER ACTION: Calling AI with Fast Model...");
-        const { object } = await generateObject({
+        const { object, cached } = await cachedGenerateObject({
+            namespace: "extraction",
             model: getFastModel(),
             schema: DomainSchema,
             prompt: `
@@ -46,7 +47,7 @@ export async function extractDomainsFromVision(visionText: string) {
       `,
         });
 
-        console.log("SERVER ACTION: AI Extraction Success. Domains found:", object.domains.length);
+        console.log(`SERVER ACTION: AI Extraction Success${cached ? " (cached)" : ""}. Domains found:`, object.domains.length);
         return { success: true, data: object.domains };
     } catch (error) {
         console.error("SERVER ACTION: AI Extraction Error:", error);
@@ -0,0 +1,118 @@
+import { Prisma } from "@prisma/client";
+import { inngest } from "@/lib/inngest/client";
+import { prisma } from "@/lib/prisma";
+import { analyzeJournalEntries } from "@/lib/ai/reflection";
+
+/**
+ * AI analysis of journal entries, off the request path: submitJournal only
+ * writes the entry (analysisStatus PENDING) and emits
+ * "app/journal.submitted"; entries are analyzed here in batches and the
+ * client polls for the result (useJournalAnalysis).
+ */
+
+const BATCH_SIZE = 25;
+// The sweep re-queues an entry pending this long since it was last queued,
+// doubling the wait after every re-queue (15 min, 30 min, 1 h, 2 h)...
+const SWEEP_GRACE_MINUTES = 15;
+// ...and marks it FAILED once it is still pending after this many re-queues
+const MAX_REQUEUES = 4;
+const SWEEP_LIMIT = 500;
+
+/** Queue one entry for analysis. Failures are logged: the sweep picks it up later. */
+export async function requestJournalAnalysis(journalId: string) {
+    try {
+        await inngest.send({ name: "app/journal.submitted", data: { journalId } });
+    } catch (error) {
+        console.error("Failed to queue journal analysis:", error);
+    }
+}
+
+export const analyzeJournals = inngest.createFunction(
+    {
+        id: "analyze-journals",
+        batchEvents: { maxSize: BATCH_SIZE, timeout: "5s" },
+        concurrency: { limit: 5 },
+        retries: 3,
+    },
+    { event: "app/journal.submitted" },
+    async ({ step, events }) => {
+        const ids = [...new Set(events.map((e) => e.data.journalId as string))];
+
+        const entries = await step.run("load-pending", async () => {
+            return prisma.dailyJournal.findMany({
+                where: { id: { in: ids }, analysisStatus: "PENDING" },
+                select: { id: true, text: true },
+            });
+        });
+        if (entries.length === 0) return { analyzed: 0 };
+
+        // One model call for the whole batch
+        const results = await step.run("analyze", async () => {
+            return Object.fromEntries(await analyzeJournalEntries(entries));
+        });
+
+        const analyzed = await step.run("save", async () => {
+            const now = new Date();
+            const updates = entries
+                .filter((e) => results[e.id])
+                .map((e) => {
+                    const r = results[e.id];
+                    // Matching on text: an entry rewritten meanwhile keeps waiting for its own event
+                    return prisma.dailyJournal.updateMany({
+                        where: { id: e.id, text: e.text },
+                        data: {
+                            sentiment: r.sentiment,
+                            effortScore: r.energyLevel,
+                            aiReflection: r.reflection,
+                            analysisStatus: "DONE",
+                            analyzedAt: now,
+                        },
+                    });
+                });
+            const written = await prisma.$transaction(updates);
+            return written.reduce((n, w) => n + w.count, 0);
+        });
+
+        // Left out by the model: stays PENDING for the sweep
+        return { analyzed, missing: entries.length - Object.keys(results).length };
+    }
+);
+
+/**
+ * Re-queue entries whose event was lost or whose batch failed, with
+ * exponential backoff per entry; give up on ones that keep failing.
+ * Entries submitted (or re-queued) less than the grace period ago are left
+ * to the run already on its way.
+ */
+export const sweepPendingJournals = inngest.createFunction(
+    { id: "sweep-pending-journals" },
+    { cron: "*/10 * * * *" },
+    async ({ step }) => {
+        const ids = await step.run("find-pending", async () => {
+            const backoff = Prisma.sql`"analysisQueuedAt" < now() - ${SWEEP_GRACE_MINUTES} * interval '1 minute' * power(2, "analysisAttempts")`;
+            await prisma.$executeRaw`
+                UPDATE "DailyJournal" SET "analysisStatus" = 'FAILED'
+                WHERE "analysisStatus" = 'PENDING' AND "analysisAttempts" >= ${MAX_REQUEUES} AND ${backoff}`;
+            // Claimed by bumping the counter, so an overlapping sweep skips them
+            const requeued = await prisma.$queryRaw<Array<{ id: string }>>`
+                UPDATE "DailyJournal" SET "analysisAttempts" = "analysisAttempts" + 1, "analysisQueuedAt" = now()
+                WHERE "id" IN (
+                    SELECT "id" FROM "DailyJournal"
+                    WHERE "analysisStatus" = 'PENDING' AND "analysisAttempts" < ${MAX_REQUEUES} AND ${backoff}
+                    ORDER BY "date"
+                    LIMIT ${SWEEP_LIMIT}
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING "id"`;
+            return requeued.map((j) => j.id);
+        });
+
+        if (ids.length > 0) {
+            await step.sendEvent(
+                "requeue",
+                ids.map((journalId) => ({ name: "app/journal.submitted", data: { journalId } }))
+            );
+        }
+        return { requeued: ids.length };
+    }
+);
@@ -0,0 +1,23 @@
+import { inngest } from "@/lib/inngest/client";
+import { sendReminderBatch } from "@/lib/reminders/schedule";
+import { floorToMinute } from "@/lib/reminders/time";
+
+// Every minute: send the reminders in that minute's nextFireAt bucket, one step per batch
+export const sendReminders = inngest.createFunction(
+    { id: "send-reminders", concurrency: { limit: 1 } },
+    { cron: "* * * * *" },
+    async ({ step, event }) => {
+        const minute = floorToMinute(new Date(event.ts ?? Date.now())).toISOString();
+
+        let sent = 0;
+        let skipped = 0;
+        for (let batch = 0; ; batch++) {
+            const result = await step.run(`send-batch-${batch}`, () => sendReminderBatch(new Date(minute)));
+            sent += result.sent;
+            skipped += result.skipped;
+            if (!result.more) break;
+        }
+
+        return { minute, sent, skipped };
+    }
+);
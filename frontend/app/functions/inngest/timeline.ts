@@ -0,0 +1,76 @@
+import { inngest } from "@/lib/inngest/client";
+import { prisma } from "@/lib/prisma";
+import { lastCompletedWeek, materializeHistory, materializeWeek } from "@/lib/timeline/snapshots";
+
+/**
+ * Weekly timeline rollup, fanned out like weekly planning: the cron pages
+ * user ids and emits one "app/timeline.user" event per user. The
+ * "app/timeline.backfill" event does the same for every week of every
+ * user's history (or one user, with data.userId). Snapshots are upserted,
+ * so any of these can be re-run.
+ */
+
+const USER_PAGE_SIZE = 500;
+
+export const materializeTimeline = inngest.createFunction(
+    { id: "materialize-timeline" },
+    [
+        { cron: "0 12 * * 1" }, // Monday noon UTC: last week has ended in every timezone
+        { event: "app/timeline.backfill" },
+    ],
+    async ({ step, event }) => {
+        const backfill = event.name === "app/timeline.backfill";
+        const onlyUserId = backfill ? (event.data?.userId as string | undefined) : undefined;
+        const week = await step.run("resolve-week", () => lastCompletedWeek(new Date(event.ts ?? Date.now())));
+
+        let cursor: string | null = null;
+        let total = 0;
+        for (let page = 0; ; page++) {
+            const userIds: string[] = await step.run(`fetch-users-${page}`, async () => {
+                if (onlyUserId) return page === 0 ? [onlyUserId] : [];
+                const users = await prisma.user.findMany({
+                    where: cursor ? { id: { gt: cursor } } : {},
+                    select: { id: true },
+                    orderBy: { id: "asc" },
+                    take: USER_PAGE_SIZE,
+                });
+                return users.map((u) => u.id);
+            });
+            if (userIds.length === 0) break;
+
+            await step.sendEvent(
+                `fan-out-${page}`,
+                userIds.map((userId) => ({
+                    // Dedupes re-sends of a retried step; backfills are never deduped against each other
+                    id: backfill ? undefined : `timeline-${week}-${userId}`,
+                    name: "app/timeline.user",
+                    data: { userId, week, backfill },
+                }))
+            );
+            total += userIds.length;
+            cursor = userIds[userIds.length - 1];
+            if (userIds.length < USER_PAGE_SIZE) break;
+        }
+
+        return { week, backfill, users: total };
+    }
+);
+
+export const materializeUserTimeline = inngest.createFunction(
+    {
+        id: "materialize-user-timeline",
+        concurrency: [{ limit: 10 }, { key: "event.data.userId", limit: 1 }],
+        retries: 3,
+    },
+    { event: "app/timeline.user" },
+    async ({ step, event }) => {
+        const { userId, week, backfill } = event.data as { userId: string; week: number; backfill?: boolean };
+
+        const weeks = await step.run("materialize", async () => {
+            if (backfill) return materializeHistory(userId, week);
+            return (await materializeWeek(userId, week)) ? 1 : 0;
+        });
+
+        return { userId, weeks };
+    }
+);
@@ -1,6 +1,41 @@
 import { inngest } from "@/lib/inngest/client";
 import { getModel } from "@/lib/ai/model";
+import { prisma } from "@/lib/prisma";
 import { generateText } from "ai";
+import type { GetStepTools } from "inngest";
+
+/**
+ * Monday planning, fanned out.
+ *
+ * `generateWeeklyPlan` only pages user ids and emits one
+ * "app/planning.user" event per user; `generateUserWeeklyPlan` does the AI
+ * work for one user under the Gemini limits below, so runs scale out across
+ * workers and a failure retries one user, not the whole week.
+ *
+ * Every per-user run ends by writing its outcome to WeeklyPlan (generated,
+ * skipped or, once retries are spent, failed) and emitting
+ * "app/planning.progress". `reportWeeklyPlans` counts those rows against
+ * the run's WeeklyPlanRun and reports once all of them are in, however long
+ * the throttled runs take.
+ */
+
+const USER_PAGE_SIZE = 500;
+
+// Gemini quota for the planning model; override per deployment tier
+const PLANNING_CONCURRENCY = Number(process.env.PLANNING_CONCURRENCY) || 10;
+const PLANNING_RPM = Number(process.env.PLANNING_RPM) || 60;
+
+// Users with something to plan: at least one active goal
+const activeUserWhere = {
+    domains: { some: { goals: { some: { status: "ACTIVE" } } } },
+};
+
+/** ISO date of the Monday (UTC) of the week containing `instant`. */
+function weekStartOf(instant: Date) {
+    const day = new Date(Date.UTC(instant.getUTCFullYear(), instant.getUTCMonth(), instant.getUTCDate()));
+    day.setUTCDate(day.getUTCDate() - ((day.getUTCDay() + 6) % 7));
+    return day.toISOString().slice(0, 10);
+}
 
 export const generateWeeklyPlan = inngest.createFunction(
     { id: "generate-weekly-plan" },
@@ -9,43 +44,196 @@ export const generateWeeklyPlan = inngest.createFunction(
         { event: "app/planning.requested" }, // Manual trigger
     ],
     async ({ step, event }) => {
+        const weekStart = await step.run("resolve-week", () => weekStartOf(new Date(event.ts ?? Date.now())));
+
+        // Step 1: Page active users by id and fan out one event per user.
+        // Each page is its own step, so a retry resumes from the last cursor.
+        let cursor: string | null = null;
+        let total = 0;
+        for (let page = 0; ; page++) {
+            const userIds: string[] = await step.run(`fetch-users-${page}`, async () => {
+                const users = await prisma.user.findMany({
+                    where: cursor ? { ...activeUserWhere, id: { gt: cursor } } : activeUserWhere,
+                    select: { id: true },
+                    orderBy: { id: "asc" },
+                    take: USER_PAGE_SIZE,
+                });
+                return users.map((u) => u.id);
+            });
+            if (userIds.length === 0) break;
+
+            // Event ids dedupe re-sends when this step is retried
+            await step.sendEvent(
+                `fan-out-${page}`,
+                userIds.map((userId) => ({
+                    id: `weekly-plan-${weekStart}-${userId}`,
+                    name: "app/planning.user",
+                    data: { userId, weekStart },
+                }))
+            );
+            total += userIds.length;
+            cursor = userIds[userIds.length - 1];
+            if (userIds.length < USER_PAGE_SIZE) break;
+        }
 
-        // Step 1: Fetch active users (Mock)
-        const activeUsers = await step.run("fetch-active-users", async () => {
-            // In a real app, db.users.find({ status: 'active' })
-            return [
-                { id: "user_1", name: "Abir", focusDomains: ["Career", "Health"] },
-                { id: "user_2", name: "Demo User", focusDomains: ["Learning"] }
-            ];
+        if (total === 0) return { success: true, weekStart, requested: 0 };
+
+        // Step 2: Record how many outcomes the report waits for. Runs may
+        // already have finished, so check progress once it is recorded.
+        await step.run("record-run", async () => {
+            const date = new Date(weekStart);
+            await prisma.weeklyPlanRun.upsert({
+                where: { weekStart: date },
+                create: { weekStart: date, requested: total },
+                update: { requested: total, reportedAt: null },
+            });
         });
+        await step.sendEvent("check-progress", { name: "app/planning.progress", data: { weekStart } });
 
-        // Step 2: Generate Plans for each user
-        const results = await step.run("generate-plans", async () => {
-            const plans = [];
-
-            for (const user of activeUsers) {
-                // Simulate AI processing
-                // const { text } = await generateText({
-                //   model: getModel(),
-                //   prompt: `Generate a weekly plan for ${user.name} focusing on ${user.focusDomains.join(", ")}`
-                // });
-
-                plans.push({
-                    userId: user.id,
-                    status: "generated",
-                    // plan: text
-                    plan: "Mock Plan Generated"
-                });
-            }
-            return plans;
+        return { success: true, weekStart, requested: total };
+    }
+);
+
+/** Write a user's outcome for the week and let the report know. */
+async function recordOutcome(
+    step: GetStepTools<typeof inngest>,
+    userId: string,
+    weekStart: string,
+    status: "SKIPPED" | "FAILED"
+) {
+    await step.run("record-outcome", async () => {
+        const date = new Date(weekStart);
+        // A failure after save-plan keeps the plan that was saved
+        await prisma.weeklyPlan.upsert({
+            where: { userId_weekStart: { userId, weekStart: date } },
+            create: { userId, weekStart: date, status },
+            update: status === "SKIPPED" ? { status, plan: null } : {},
+        });
+    });
+    await step.sendEvent("report-progress", { name: "app/planning.progress", data: { weekStart } });
+}
+
+export const generateUserWeeklyPlan = inngest.createFunction(
+    {
+        id: "generate-user-weekly-plan",
+        concurrency: [
+            { limit: PLANNING_CONCURRENCY }, // Requests in flight against Gemini
+            { key: "event.data.userId", limit: 1 },
+        ],
+        throttle: { limit: PLANNING_RPM, period: "1m" },
+        idempotency: "event.data.userId + '-' + event.data.weekStart",
+        retries: 3,
+        onFailure: async ({ step, event }) => {
+            const { userId, weekStart } = event.data.event.data as { userId: string; weekStart: string };
+            await recordOutcome(step, userId, weekStart, "FAILED");
+        },
+    },
+    { event: "app/planning.user" },
+    async ({ step, event }) => {
+        const { userId, weekStart } = event.data as { userId: string; weekStart: string };
+
+        const user = await step.run("load-goals", async () => {
+            return prisma.user.findUnique({
+                where: { id: userId },
+                select: {
+                    name: true,
+                    domains: {
+                        select: {
+                            name: true,
+                            goals: {
+                                where: { status: "ACTIVE" },
+                                select: {
+                                    title: true,
+                                    milestones: { where: { isCompleted: false }, select: { title: true } },
+                                },
+                            },
+                        },
+                    },
+                },
+            });
+        });
+        const domains = user?.domains.filter((d) => d.goals.length > 0) ?? [];
+        if (!user || domains.length === 0) {
+            await recordOutcome(step, userId, weekStart, "SKIPPED");
+            return { userId, status: "skipped" };
+        }
+
+        const plan = await step.run("generate-plan", async () => {
+            const goals = domains
+                .map((d) => {
+                    const lines = d.goals.map((g) => {
+                        const next = g.milestones.map((m) => m.title).join("; ");
+                        return `  - ${g.title}${next ? ` (open milestones: ${next})` : ""}`;
+                    });
+                    return `${d.name}:\n${lines.join("\n")}`;
+                })
+                .join("\n");
+            const { text } = await generateText({
+                model: getModel(),
+                prompt: `Generate a weekly plan for ${user.name ?? "the user"} for the week starting ${weekStart}.
+Pick 3-5 concrete actions across these domains and goals, most important first:
+${goals}`,
+            });
+            return text;
         });
 
-        // Step 3: Send Notifications (Mock)
-        await step.run("notify-users", async () => {
-            console.log(`Notified ${results.length} users about their new weekly plans.`);
-            return { sent: results.length };
+        await step.run("save-plan", async () => {
+            const date = new Date(weekStart);
+            await prisma.weeklyPlan.upsert({
+                where: { userId_weekStart: { userId, weekStart: date } },
+                create: { userId, weekStart: date, status: "GENERATED", plan },
+                update: { status: "GENERATED", plan },
+            });
         });
 
-        return { success: true, processed: results.length };
+        // Notifications (Mock)
+        await step.run("notify-user", async () => {
+            console.log(`Notified ${userId} about their weekly plan for ${weekStart}.`);
+            return { sent: 1 };
+        });
+
+        await step.sendEvent("report-progress", { name: "app/planning.progress", data: { weekStart } });
+
+        return { userId, status: "generated" };
+    }
+);
+
+export const reportWeeklyPlans = inngest.createFunction(
+    {
+        id: "report-weekly-plans",
+        // One count per burst of outcomes; the timeout keeps a steady stream reporting
+        debounce: { key: "event.data.weekStart", period: "1m", timeout: "15m" },
+    },
+    { event: "app/planning.progress" },
+    async ({ step, event }) => {
+        const { weekStart } = event.data as { weekStart: string };
+
+        return step.run("count-outcomes", async () => {
+            const date = new Date(weekStart);
+            const run = await prisma.weeklyPlanRun.findUnique({ where: { weekStart: date } });
+            if (!run) return { weekStart, status: "not-started" };
+
+            const rows = await prisma.weeklyPlan.groupBy({
+                by: ["status"],
+                where: { weekStart: date },
+                _count: { _all: true },
+            });
+            const counts = Object.fromEntries(rows.map((row) => [row.status, row._count._all])) as Record<string, number>;
+            const finished = rows.reduce((sum, row) => sum + row._count._all, 0);
+            if (finished < run.requested) return { weekStart, status: "running", finished, requested: run.requested };
+
+            // Only the first check to see the week complete reports it
+            const { count } = await prisma.weeklyPlanRun.updateMany({
+                where: { weekStart: date, reportedAt: null },
+                data: { reportedAt: new Date() },
+            });
+            if (count > 0) {
+                console.log(
+                    `Weekly plans for ${weekStart}: ${counts.GENERATED ?? 0}/${run.requested} generated, ` +
+                        `${counts.SKIPPED ?? 0} skipped, ${counts.FAILED ?? 0} failed.`
+                );
+            }
+            return { weekStart, status: "complete", requested: run.requested, ...counts };
+        });
     }
 );
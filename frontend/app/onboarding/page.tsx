@@ -172,6 +172,14 @@ export default function OnboardingPage() {
 
   const handleOnboardingComplete = () => {
     console.log("OnboardingPage: handleOnboardingComplete started");
+    // One key per completion: a retry or double submit replays it and the
+    // server writes nothing twice
+    let idempotencyKey = localStorage.getItem("onboarding-sync-key");
+    if (!idempotencyKey) {
+      idempotencyKey = crypto.randomUUID();
+      localStorage.setItem("onboarding-sync-key", idempotencyKey);
+    }
+
     // Persist data
     const userData = {
       vision: visionText,
@@ -182,8 +190,10 @@ export default function OnboardingPage() {
       goals,
       reminders: {
         bedtime: bedtimeReminder,
-        morning: morningReminder
+        morning: morningReminder,
+        timezone: Intl.DateTimeFormat().resolvedOptions().timeZone
       },
+      idempotencyKey,
       createdAt: new Date().toISOString()
     };
 
@@ -198,6 +208,7 @@ export default function OnboardingPage() {
           // Clear drafts
           localStorage.removeItem("onboarding-current-step");
           localStorage.removeItem("onboarding-vision-draft");
+          localStorage.removeItem("onboarding-sync-key");
 
           // Force token refresh to get updated metadata
           await user?.reload();
@@ -0,0 +1,72 @@
+"use client";
+
+import { useState } from "react";
+import { Download, Loader2 } from "lucide-react";
+import { SystemButton } from "@/components/shared/SystemButton";
+import { WALLPAPER_PRESETS, wallpaperUrl, type WallpaperPreset } from "@/lib/wallpaper/presets";
+
+// One phone and one desktop size, the two the export is asked for most
+const EXPORT_PRESETS: WallpaperPreset[] = ["phone", "desktop-4k"];
+
+interface WallpaperExportProps {
+  boardId: string;
+}
+
+export function WallpaperExport({ boardId }: WallpaperExportProps) {
+  const [status, setStatus] = useState<"idle" | "rendering" | "ready" | "error">("idle");
+
+  // Rendering happens on the server; requesting each size once warms its
+  // cache so the download links below are served straight from disk.
+  const handleExport = async () => {
+    setStatus("rendering");
+    try {
+      const responses = await Promise.all(
+        EXPORT_PRESETS.map((preset) => fetch(wallpaperUrl(boardId, preset)))
+      );
+      setStatus(responses.every((r) => r.ok) ? "ready" : "error");
+    } catch (error) {
+      console.error("Wallpaper export failed:", error);
+      setStatus("error");
+    }
+  };
+
+  return (
+    <div className="relative">
+      <SystemButton variant="outline" size="sm" onClick={handleExport} disabled={status === "rendering"}>
+        {status === "rendering" ? (
+          <Loader2 className="w-4 h-4 mr-2 animate-spin" />
+        ) : (
+          <Download className="w-4 h-4 mr-2" />
+        )}
+        Export
+      </SystemButton>
+
+      {status === "ready" && (
+        <div
+          data-testid="wallpaper-export"
+          className="absolute right-0 mt-2 w-72 z-10 border border-gray-300 bg-white p-3 font-mono text-xs shadow-lg"
+        >
+          <p className="text-gray-900 mb-2">Export Successful! Your wallpaper is ready for download.</p>
+          <div className="flex flex-col gap-1">
+            {EXPORT_PRESETS.map((preset) => (
+              <a
+                key={preset}
+                href={`${wallpaperUrl(boardId, preset)}&download`}
+                data-preset={preset}
+                className="text-blue-600 hover:underline uppercase"
+              >
+                {WALLPAPER_PRESETS[preset].label} ({WALLPAPER_PRESETS[preset].width}×{WALLPAPER_PRESETS[preset].height})
+              </a>
+            ))}
+          </div>
+        </div>
+      )}
+
+      {status === "error" && (
+        <p className="absolute right-0 mt-2 w-56 z-10 font-mono text-xs text-red-600">
+          Export failed. Please try again.
+        </p>
+      )}
+    </div>
+  );
+}
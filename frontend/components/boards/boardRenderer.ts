@@ -0,0 +1,75 @@
+import { BoardEngine, type BoardEvent, type BoardScene, type EngineHost } from "@/lib/pixels/boardEngine";
+import { CANVAS_HEIGHT, CANVAS_WIDTH } from "@/lib/pixels/grid";
+import type { WorkerCommand } from "./pixelBoard.worker";
+
+export interface BoardRenderer {
+  update(scene: BoardScene): void;
+  dispose(): void;
+}
+
+// Main-thread fallback for browsers without transferControlToOffscreen
+const mainThreadHost: EngineHost = {
+  createLayer(width, height) {
+    const surface = document.createElement("canvas");
+    surface.width = width;
+    surface.height = height;
+    const ctx = surface.getContext("2d");
+    if (!ctx) throw new Error("2D canvas context unavailable");
+    return { surface, ctx };
+  },
+  loadImage: (url) =>
+    new Promise((resolve) => {
+      const image = new window.Image();
+      image.crossOrigin = "anonymous";
+      image.onload = () => resolve(image);
+      image.onerror = () => {
+        console.warn(`Failed to load board image ${url}`);
+        resolve(null);
+      };
+      image.src = url;
+    }),
+  requestFrame: (callback) => requestAnimationFrame(callback),
+  cancelFrame: (id) => cancelAnimationFrame(id),
+};
+
+/**
+ * Mount a board canvas in `container` and drive it from a worker when the
+ * browser can hand the canvas over, otherwise from the main thread. The
+ * canvas is created here rather than rendered by React because a canvas can
+ * be transferred only once, and StrictMode mounts effects twice.
+ */
+export function createBoardRenderer(container: HTMLElement, onEvent: (event: BoardEvent) => void): BoardRenderer {
+  const canvas = document.createElement("canvas");
+  canvas.width = CANVAS_WIDTH;
+  canvas.height = CANVAS_HEIGHT;
+  canvas.className = "w-full h-full object-cover";
+  canvas.style.imageRendering = "pixelated"; // Crisp pixels
+  container.appendChild(canvas);
+
+  if (typeof Worker !== "undefined" && "transferControlToOffscreen" in canvas) {
+    const offscreen = canvas.transferControlToOffscreen();
+    const worker = new Worker(new URL("./pixelBoard.worker.ts", import.meta.url));
+    const send = (command: WorkerCommand, transfer: Transferable[] = []) => worker.postMessage(command, transfer);
+    worker.onmessage = (event: MessageEvent<BoardEvent>) => onEvent(event.data);
+    send({ type: "init", canvas: offscreen }, [offscreen]);
+    return {
+      update: (scene) => send({ type: "scene", scene }),
+      dispose: () => {
+        send({ type: "dispose" });
+        worker.terminate();
+        canvas.remove();
+      },
+    };
+  }
+
+  const ctx = canvas.getContext("2d");
+  if (!ctx) throw new Error("2D canvas context unavailable");
+  const engine = new BoardEngine(ctx, mainThreadHost, onEvent);
+  return {
+    update: (scene) => void engine.setScene(scene),
+    dispose: () => {
+      engine.dispose();
+      canvas.remove();
+    },
+  };
+}
@@ -0,0 +1,54 @@
+import { BoardEngine, type BoardEvent, type BoardScene, type EngineHost } from "@/lib/pixels/boardEngine";
+
+// Board compositing off the main thread; see boardRenderer.ts
+export type WorkerCommand =
+  | { type: "init"; canvas: OffscreenCanvas }
+  | { type: "scene"; scene: BoardScene }
+  | { type: "dispose" };
+
+// `self` is typed as Window under the DOM lib
+const scope = self as unknown as {
+  postMessage(event: BoardEvent): void;
+  onmessage: ((event: MessageEvent<WorkerCommand>) => void) | null;
+  requestAnimationFrame?: (callback: (timestamp: number) => void) => number;
+  cancelAnimationFrame?: (id: number) => void;
+};
+
+const host: EngineHost = {
+  createLayer(width, height) {
+    const surface = new OffscreenCanvas(width, height);
+    const ctx = surface.getContext("2d");
+    if (!ctx) throw new Error("2D canvas context unavailable");
+    return { surface, ctx };
+  },
+  async loadImage(url) {
+    try {
+      const response = await fetch(url, { mode: "cors" });
+      if (!response.ok) return null;
+      return await createImageBitmap(await response.blob());
+    } catch {
+      return null;
+    }
+  },
+  // Workers get rAF in current browsers; fall back to a 60fps timer
+  requestFrame: (callback) =>
+    scope.requestAnimationFrame
+      ? scope.requestAnimationFrame(callback)
+      : (setTimeout(() => callback(performance.now()), 16) as unknown as number),
+  cancelFrame: (id) => (scope.cancelAnimationFrame ? scope.cancelAnimationFrame(id) : clearTimeout(id)),
+};
+
+let engine: BoardEngine | null = null;
+
+scope.onmessage = ({ data }) => {
+  if (data.type === "init") {
+    const ctx = data.canvas.getContext("2d");
+    if (!ctx) return;
+    engine = new BoardEngine(ctx, host, (event) => scope.postMessage(event));
+  } else if (data.type === "scene") {
+    engine?.setScene(data.scene);
+  } else if (data.type === "dispose") {
+    engine?.dispose();
+    engine = null;
+  }
+};
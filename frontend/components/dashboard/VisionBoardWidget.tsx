@@ -4,6 +4,7 @@ import { useState } from "react";
 import { motion, AnimatePresence } from "framer-motion";
 import { Maximize2, Share2, Crown, Calendar } from "lucide-react";
 import { PixelatedBoard } from "@/components/boards/PixelatedBoard";
+import { usePixelBitmap } from "@/lib/hooks/usePixelBitmap";
 import type { VisionBoard, Domain } from "@/lib/types";
 
 interface VisionBoardWidgetProps {
@@ -22,6 +23,7 @@ export function VisionBoardWidget({
     isLoading = false,
 }: VisionBoardWidgetProps) {
     const [isFullscreen, setIsFullscreen] = useState(false);
+    const pixelBitmap = usePixelBitmap(board);
 
     // Transition variants for "Zoom" effect
     const variants = {
@@ -104,6 +106,7 @@ export function VisionBoardWidget({
                                     board={board}
                                     domains={domains}
                                     pixelSize={isFullscreen ? 8 : (currentView === "annual" ? 6 : 12)}
+                                    pixelBitmap={pixelBitmap}
                                 />
                             </motion.div>
                         </AnimatePresence>
@@ -79,10 +79,14 @@ export function ImageUploader({
         <div className="grid grid-cols-3 gap-4 mb-4">
           {existingImages.map((image) => (
             <div key={image.id} className="relative aspect-square rounded-lg overflow-hidden">
+              {/* Uploads are stored pre-sized: show the thumbnail variant as is */}
               <Image
-                src={image.imageUrl}
+                src={image.variants?.[0]?.url ?? image.imageUrl}
                 alt={`Domain image ${image.sortOrder}`}
                 fill
+                unoptimized={!!image.variants?.length}
+                placeholder={image.placeholder ? "blur" : "empty"}
+                blurDataURL={image.placeholder ?? undefined}
                 className="object-cover"
               />
             </div>
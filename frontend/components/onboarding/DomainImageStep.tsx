@@ -13,6 +13,9 @@ interface ExtractedDomain {
   imageKeywords: string[];
 }
 
+// The extraction step's visual keywords, plus the domain name itself
+const searchTerms = (domain: ExtractedDomain) => [...(domain.imageKeywords ?? []), domain.name];
+
 interface DomainImageStepProps {
   domains: ExtractedDomain[];
   domainImages: Record<string, string[]>;
@@ -34,6 +37,7 @@ export function DomainImageStep({
 
   // State for search results
   const [searchResults, setSearchResults] = useState<string[]>([]);
+  const [resultsPage, setResultsPage] = useState({ page: 0, hasMore: false });
 
   const currentDomain = domains[currentDomainIndex];
   // Calculate total images across all domains
@@ -49,10 +53,10 @@ export function DomainImageStep({
       if (!isSearching) {
         setIsSearching(true);
         try {
-          const query = currentDomain.imageKeywords?.join(" ") || currentDomain.name + " aesthetic";
-          const foundImages = await imagesApi.search(query);
-          if (foundImages.length > 0) {
-            setSearchResults(foundImages);
+          const found = await imagesApi.search(searchTerms(currentDomain));
+          if (found.urls.length > 0) {
+            setSearchResults(found.urls);
+            setResultsPage({ page: found.page, hasMore: found.hasMore });
           }
         } catch (e) {
           console.error("Auto-search failed", e);
@@ -76,6 +80,12 @@ export function DomainImageStep({
     );
   }
 
+  const handleLoadMore = async () => {
+    const found = await imagesApi.search(searchTerms(currentDomain), { page: resultsPage.page + 1 });
+    setSearchResults((results) => [...results, ...found.urls]);
+    setResultsPage({ page: found.page, hasMore: found.hasMore });
+  };
+
   const handleSelectImage = (url: string) => {
     const currentImages = domainImages[currentDomain.name] || [];
     // duplicate check
@@ -189,6 +199,14 @@ export function DomainImageStep({
                     </div>
                   </motion.div>
                 ))}
+                {resultsPage.hasMore && (
+                  <button
+                    onClick={handleLoadMore}
+                    className="col-span-2 py-2 text-xs font-mono text-gray-400 hover:text-neon-cyan border border-white/5 hover:border-neon-cyan/50 rounded-lg transition-colors"
+                  >
+                    LOAD MORE
+                  </button>
+                )}
               </div>
             )}
           </div>
@@ -1,10 +1,12 @@
 "use client";
 
-import { useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { motion, AnimatePresence } from "framer-motion";
 import { Check, Edit2, MessageSquare, CheckCircle, Sparkles, Loader2, ChevronDown, ChevronUp, Calendar } from "lucide-react";
 import { SystemButton } from "@/components/shared/SystemButton";
-import { decomposeGoal } from "@/app/functions/decomposition";
+import { api } from "@/lib/api";
+import { decomposeGoals } from "@/app/functions/decomposition";
+import type { DecompositionTodo } from "@/lib/ai/decomposition";
 import { cn } from "@/lib/utils";
 
 interface DomainGoal {
@@ -14,6 +16,8 @@ interface DomainGoal {
   isAIEnriched?: boolean;
 }
 
+const formatTodo = (t: DecompositionTodo) => `Week ${t.week}: ${t.task} (${t.effort} Effort)`;
+
 interface GoalReviewStepProps {
   goals: DomainGoal[];
   onGoalsChange: (goals: DomainGoal[]) => void;
@@ -21,50 +25,110 @@ interface GoalReviewStepProps {
 
 export function GoalReviewStep({ goals, onGoalsChange }: GoalReviewStepProps) {
   const [enrichingDomain, setEnrichingDomain] = useState<string | null>(null);
+  const [batchDomains, setBatchDomains] = useState<Set<string>>(new Set());
   const [expandedDomain, setExpandedDomain] = useState<string | null>(null);
 
   // Chat state
   const [chatMessage, setChatMessage] = useState("");
   const [errorMessage, setErrorMessage] = useState<string | null>(null);
 
+  // Stream events arrive faster than re-renders; always patch the latest list
+  const goalsRef = useRef(goals);
+  goalsRef.current = goals;
+  const streamAbort = useRef<AbortController | null>(null);
+  useEffect(() => () => streamAbort.current?.abort(), []);
+
+  const patchGoal = (domain: string, patch: Partial<DomainGoal>) => {
+    const next = goalsRef.current.map(g => (g.domain === domain ? { ...g, ...patch } : g));
+    goalsRef.current = next;
+    onGoalsChange(next);
+  };
+
   const handleEnrichGoal = async (domain: string, currentGoal: string) => {
     setEnrichingDomain(domain);
     setErrorMessage(null); // Clear previous errors
-    try {
-      // Call Server Action for Deep Decomposition
-      const result = await decomposeGoal(domain, currentGoal);
+    const original = goalsRef.current.find(g => g.domain === domain);
+    const milestones: string[] = [];
+    const todos: string[] = [];
+    let finished = false;
+    const abort = new AbortController();
+    streamAbort.current = abort;
 
-      if (result.success && result.data) {
-        // Update the specific goal in the list
-        const updatedGoals = goals.map(g => {
-          if (g.domain === domain) {
-            return {
-              ...g,
-              milestones: result.data.milestones,
-              // Convert the structured Todo objects to strings for now (or update type later)
-              todos: result.data.monthOneTodos.map(t =>
-                `Week ${t.week}: ${t.task} (${t.effort} Effort)`
-              ),
-              isAIEnriched: true
-            };
-          }
-          return g;
-        });
+    try {
+      // Milestones and todos render as the model produces them
+      await api.goals.streamDecomposition(domain, currentGoal, (event) => {
+        switch (event.type) {
+          case "milestone":
+          case "todo":
+            if (event.type === "milestone") milestones[event.index] = event.milestone;
+            else todos[event.index] = formatTodo(event.todo);
+            if (milestones.length + todos.length === 1) setExpandedDomain(domain);
+            patchGoal(domain, { milestones: [...milestones], todos: [...todos] });
+            break;
+          case "done":
+            patchGoal(domain, {
+              milestones: event.data.milestones,
+              todos: event.data.monthOneTodos.map(formatTodo),
+              isAIEnriched: true,
+            });
+            finished = true;
+            break;
+        }
+      }, abort.signal);
 
-        onGoalsChange(updatedGoals);
-        setExpandedDomain(domain); // Auto-expand the enriched goal
-      } else {
+      // An error event, or a stream cut off before "done"
+      if (!finished) {
+        if (original) patchGoal(domain, original);
         setErrorMessage("AI is currently overloaded. Please try again in a few seconds.");
       }
     } catch (error) {
+      if (abort.signal.aborted) return;
       console.error("Enrichment failed", error);
+      if (original) patchGoal(domain, original);
       setErrorMessage("Connection failed. Please check your network.");
     } finally {
-      setEnrichingDomain(null);
+      if (!abort.signal.aborted) setEnrichingDomain(null);
     }
   };
 
 
+  // All not-yet-enriched domains in one model call instead of one per click
+  const handleEnrichAll = async () => {
+    const pending = goalsRef.current.filter(g => !g.isAIEnriched && g.domain !== enrichingDomain);
+    if (pending.length === 0) return;
+    setBatchDomains(new Set(pending.map(g => g.domain)));
+    setErrorMessage(null);
+    try {
+      const result = await decomposeGoals(pending.map(g => ({ domain: g.domain, goal: g.milestones[0] })));
+      if (!result.success || !result.data) {
+        setErrorMessage("AI is currently overloaded. Please try again in a few seconds.");
+        return;
+      }
+
+      let failed = 0;
+      for (const goal of pending) {
+        const entry = result.data[goal.domain];
+        if (!entry?.success) {
+          failed++;
+          continue;
+        }
+        patchGoal(goal.domain, {
+          milestones: entry.data.milestones,
+          todos: entry.data.monthOneTodos.map(formatTodo),
+          isAIEnriched: true,
+        });
+      }
+      if (failed > 0) {
+        setErrorMessage(`${failed} plan${failed > 1 ? "s" : ""} couldn't be deepened. Try them individually.`);
+      }
+    } catch (error) {
+      console.error("Batch enrichment failed", error);
+      setErrorMessage("Connection failed. Please check your network.");
+    } finally {
+      setBatchDomains(new Set());
+    }
+  };
+
   const [editingGoalId, setEditingGoalId] = useState<string | null>(null);
 
   const updateGoal = (domain: string, field: 'milestones' | 'todos', index: number, value: string) => {
@@ -102,7 +166,7 @@ export function GoalReviewStep({ goals, onGoalsChange }: GoalReviewStepProps) {
         <div className="lg:col-span-8 space-y-4">
           <AnimatePresence mode="popLayout">
             {goals.map((goal, index) => {
-              const isEnriching = enrichingDomain === goal.domain;
+              const isEnriching = enrichingDomain === goal.domain || batchDomains.has(goal.domain);
               const isExpanded = expandedDomain === goal.domain;
               const isEditing = editingGoalId === goal.domain;
               const isEnriched = goal.isAIEnriched;
@@ -280,6 +344,25 @@ export function GoalReviewStep({ goals, onGoalsChange }: GoalReviewStepProps) {
                 </p>
               </div>
 
+              {goals.some(g => !g.isAIEnriched) && (
+                <SystemButton
+                  size="sm"
+                  variant="outline"
+                  onClick={handleEnrichAll}
+                  disabled={batchDomains.size > 0}
+                  className="w-full mb-4 bg-purple-500/10 text-purple-300 border-purple-500/30 hover:bg-purple-500/20 hover:text-white"
+                >
+                  {batchDomains.size > 0 ? (
+                    <Loader2 className="w-4 h-4 animate-spin" />
+                  ) : (
+                    <>
+                      <Sparkles className="w-4 h-4 mr-1.5" />
+                      Deepen All Plans
+                    </>
+                  )}
+                </SystemButton>
+              )}
+
               <div className="relative">
                 <input
                   type="text"
@@ -0,0 +1,133 @@
+"use client";
+
+import { useEffect, useMemo, useState } from "react";
+import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
+import { api } from "@/lib/api";
+import { queryKeys } from "@/lib/query/queryClient";
+import { SystemPanel } from "@/components/shared/SystemPanel";
+import { SystemButton } from "@/components/shared/SystemButton";
+import type { ReminderSettings } from "@/lib/reminders/schedule";
+import type { ReminderKind } from "@/lib/reminders/time";
+
+const browserTimeZone = () => Intl.DateTimeFormat().resolvedOptions().timeZone;
+
+function formatNext(iso: string | undefined, timeZone: string) {
+  if (!iso) return "OFF";
+  return new Date(iso).toLocaleString("en-US", {
+    timeZone,
+    weekday: "short",
+    hour: "2-digit",
+    minute: "2-digit",
+    hourCycle: "h23",
+  });
+}
+
+export function ReminderSettingsPanel() {
+  const queryClient = useQueryClient();
+  const { data: saved, isLoading } = useQuery({
+    queryKey: queryKeys.reminders.settings,
+    queryFn: api.reminders.getSettings,
+  });
+
+  const [form, setForm] = useState<ReminderSettings | null>(null);
+  useEffect(() => {
+    if (saved && !form) setForm(saved);
+  }, [saved, form]);
+
+  const timeZones = useMemo(() => {
+    const zones = typeof Intl.supportedValuesOf === "function" ? Intl.supportedValuesOf("timeZone") : [];
+    const current = form?.timezone ?? browserTimeZone();
+    return zones.includes(current) ? zones : [current, ...zones];
+  }, [form?.timezone]);
+
+  const { mutate: save, isPending, error } = useMutation({
+    mutationFn: api.reminders.updateSettings,
+    onSuccess: (settings) => {
+      queryClient.setQueryData(queryKeys.reminders.settings, settings);
+      setForm(settings);
+    },
+  });
+
+  if (isLoading) return null;
+  if (!saved || !form) {
+    return (
+      <SystemPanel title="REMINDERS">
+        <p className="font-sans text-xs text-foreground-tertiary">Finish onboarding to schedule reminders.</p>
+      </SystemPanel>
+    );
+  }
+
+  const update = (patch: Partial<ReminderSettings>) => setForm({ ...form, ...patch });
+  const row = (kind: ReminderKind, label: string, field: "bedtimeReminder" | "morningReminder") => (
+    <div className="flex items-center justify-between gap-4">
+      <div>
+        <p className="font-mono text-sm text-foreground mb-1">{label}</p>
+        <p className="font-sans text-xs text-foreground-tertiary" data-testid={`reminder-next-${kind}`} data-next={saved.next[kind] ?? ""}>
+          NEXT: {formatNext(saved.next[kind], saved.timezone)}
+        </p>
+      </div>
+      <input
+        type="time"
+        name={field}
+        value={form[field]}
+        onChange={(e) => update({ [field]: e.target.value })}
+        className="bg-background-tertiary border border-gray-200 rounded px-3 py-2 font-mono text-xs text-foreground"
+      />
+    </div>
+  );
+
+  return (
+    <SystemPanel title="REMINDERS">
+      <div className="space-y-4">
+        {row("bedtime", "BEDTIME JOURNAL", "bedtimeReminder")}
+        {row("morning", "MORNING TASKS", "morningReminder")}
+
+        <div className="flex items-center justify-between gap-4">
+          <p className="font-mono text-sm text-foreground">TIMEZONE</p>
+          <select
+            name="timezone"
+            value={form.timezone}
+            onChange={(e) => update({ timezone: e.target.value })}
+            className="bg-background-tertiary border border-gray-200 rounded px-3 py-2 font-mono text-xs text-foreground max-w-[14rem]"
+          >
+            {timeZones.map((zone) => (
+              <option key={zone} value={zone}>
+                {zone}
+              </option>
+            ))}
+          </select>
+        </div>
+
+        <div className="flex items-center gap-6">
+          <label className="flex items-center gap-2 font-mono text-xs text-foreground-secondary">
+            <input type="checkbox" checked={form.emailNotify} onChange={(e) => update({ emailNotify: e.target.checked })} />
+            EMAIL
+          </label>
+          <label className="flex items-center gap-2 font-mono text-xs text-foreground-secondary">
+            <input type="checkbox" checked={form.pushNotify} onChange={(e) => update({ pushNotify: e.target.checked })} />
+            PUSH
+          </label>
+        </div>
+
+        <div className="flex items-center justify-between gap-4">
+          <span className="font-sans text-xs text-red-400">{error ? error.message : ""}</span>
+          <SystemButton
+            variant="outline"
+            isLoading={isPending}
+            onClick={() =>
+              save({
+                timezone: form.timezone,
+                bedtimeReminder: form.bedtimeReminder,
+                morningReminder: form.morningReminder,
+                emailNotify: form.emailNotify,
+                pushNotify: form.pushNotify,
+              })
+            }
+          >
+            SAVE REMINDERS
+          </SystemButton>
+        </div>
+      </div>
+    </SystemPanel>
+  );
+}
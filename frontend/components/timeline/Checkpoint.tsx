@@ -23,7 +23,7 @@ interface CheckpointProps {
 
 export function Checkpoint({ snapshot, index, isMonthly = false, onClick }: CheckpointProps) {
   const completionPercentage = Math.round(snapshot.pixelsSummary.completionRate * 100);
-  const weekNumber = parseInt(snapshot.id.split("_")[2]);
+  const weekNumber = snapshot.weekNumber ?? parseInt(snapshot.id.split("_")[2]);
   const isHighAchievement = completionPercentage >= 75;
 
   // Calculate position (alternating left and right)
@@ -102,6 +102,22 @@ export function Checkpoint({ snapshot, index, isMonthly = false, onClick }: Chec
                   transition={{ duration: 1, delay: 0.3 }}
                 />
               </div>
+
+              {/* Domain Breakdown */}
+              {!!snapshot.pixelsSummary.domainBreakdown?.length && (
+                <div className="mt-3 space-y-1">
+                  <div className="flex w-full h-1.5 rounded-full overflow-hidden">
+                    {snapshot.pixelsSummary.domainBreakdown.map((d) => (
+                      <div key={d.domainId} style={{ width: `${d.percentage * 100}%`, backgroundColor: d.colorHex }} />
+                    ))}
+                  </div>
+                  <div className="flex flex-wrap gap-x-3 text-[10px] text-foreground-tertiary">
+                    {snapshot.pixelsSummary.domainBreakdown.slice(0, 3).map((d) => (
+                      <span key={d.domainId}>{d.domainName} {d.pixels}px</span>
+                    ))}
+                  </div>
+                </div>
+              )}
             </div>
 
             {/* Narrative Preview */}
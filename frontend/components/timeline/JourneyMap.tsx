@@ -147,7 +147,7 @@ export function JourneyMap({ snapshots, onCheckpointClick }: JourneyMapProps) {
         {/* Checkpoints */}
         <div className="relative z-10 w-full max-w-5xl mx-auto">
           {sortedSnapshots.map((snapshot, index) => {
-            const weekNumber = parseInt(snapshot.id.split("_")[2]);
+            const weekNumber = snapshot.weekNumber ?? parseInt(snapshot.id.split("_")[2]);
             const isMonthly = weekNumber % 4 === 0;
             const topOffset = (index * ITEM_HEIGHT) + (ITEM_HEIGHT / 2) - 100;
             const isLeft = index % 2 === 0;
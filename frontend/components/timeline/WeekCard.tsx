@@ -25,7 +25,8 @@ export function WeekCard({ snapshot, onClick }: WeekCardProps) {
   });
 
   // Get the board for this week's snapshot
-  const weekIndex = parseInt(snapshot.id.split("_")[2]) - 1;
+  const weekNumber = snapshot.weekNumber ?? parseInt(snapshot.id.split("_")[2]);
+  const weekIndex = weekNumber - 1;
   const weekBoards = generateWeeklyBoards();
   const weekBoard = weekBoards[weekIndex];
 
@@ -86,7 +87,7 @@ export function WeekCard({ snapshot, onClick }: WeekCardProps) {
         {/* Week Number Badge */}
         <div className="absolute top-4 left-4 bg-gradient-to-r from-blue-600 to-purple-600 text-white px-4 py-2 rounded-full shadow-xl font-bold text-sm z-20 flex items-center gap-2">
           <Calendar className="w-4 h-4" />
-          Week {parseInt(snapshot.id.split("_")[2])}
+          Week {weekNumber}
         </div>
         
         {/* Narrative Overlay on Hover */}
@@ -0,0 +1,292 @@
+import { createHash } from "crypto";
+import { generateObject, zodSchema, type LanguageModel } from "ai";
+import type { z } from "zod";
+import { prisma } from "@/lib/prisma";
+import { LRUCache } from "@/lib/utils/lruCache";
+
+/**
+ * Content-addressed cache for structured AI calls.
+ *
+ * Key = sha256(model, JSON schema, normalized prompt), so resubmitting the
+ * same vision or goal text (onboarding back/forward) is answered from the
+ * store, and any change to the model, the schema or the prompt template is
+ * a new key. Identical concurrent calls share one model request.
+ */
+
+const DEFAULT_TTL_MS = 24 * 60 * 60 * 1000;
+
+export interface CacheEntry {
+    value: unknown;
+    expiresAt: number;
+}
+
+/** Backing store. Implementations must treat expired entries as missing. */
+export interface AiCacheStore {
+    get(key: string): Promise<CacheEntry | null>;
+    set(key: string, namespace: string, value: unknown, ttlMs: number): Promise<void>;
+    delete(key: string): Promise<void>;
+}
+
+/** In-process LRU; the default, and the stand-in for Redis in local dev. */
+export class MemoryCacheStore implements AiCacheStore {
+    private entries: LRUCache<string, CacheEntry>;
+
+    constructor(maxEntries: number = 500) {
+        this.entries = new LRUCache(maxEntries, DEFAULT_TTL_MS);
+    }
+
+    async get(key: string) {
+        return this.entries.get(key) ?? null;
+    }
+
+    async set(key: string, _namespace: string, value: unknown, ttlMs: number) {
+        this.entries.set(key, { value, expiresAt: Date.now() + ttlMs }, ttlMs);
+    }
+
+    async delete(key: string) {
+        this.entries.delete(key);
+    }
+}
+
+/**
+ * AiResponseCache table, shared by every server instance. LRU is
+ * approximated by `lastHitAt`: every `pruneEvery` writes, expired rows and
+ * the least recently hit rows beyond `maxEntries` are deleted.
+ */
+export class PostgresCacheStore implements AiCacheStore {
+    private writes = 0;
+
+    constructor(
+        private readonly maxEntries: number = 10_000,
+        private readonly pruneEvery: number = 100
+    ) {}
+
+    async get(key: string) {
+        const row = await prisma.aiResponseCache.findUnique({ where: { key } });
+        if (!row || row.expiresAt.getTime() <= Date.now()) return null;
+        // Recency only feeds eviction; don't hold up the response for it
+        prisma.aiResponseCache
+            .update({ where: { key }, data: { lastHitAt: new Date() } })
+            .catch(() => undefined);
+        return { value: row.value, expiresAt: row.expiresAt.getTime() };
+    }
+
+    async set(key: string, namespace: string, value: unknown, ttlMs: number) {
+        const expiresAt = new Date(Date.now() + ttlMs);
+        const data = { namespace, value: value as object, expiresAt, lastHitAt: new Date() };
+        await prisma.aiResponseCache.upsert({ where: { key }, create: { key, ...data }, update: data });
+        if (++this.writes % this.pruneEvery === 0) await this.prune();
+    }
+
+    async delete(key: string) {
+        await prisma.aiResponseCache.deleteMany({ where: { key } });
+    }
+
+    async prune() {
+        await prisma.aiResponseCache.deleteMany({ where: { expiresAt: { lte: new Date() } } });
+        await prisma.$executeRaw`
+            DELETE FROM "AiResponseCache" WHERE "key" IN (
+                SELECT "key" FROM "AiResponseCache" ORDER BY "lastHitAt" DESC OFFSET ${this.maxEntries}
+            )`;
+    }
+}
+
+/** The subset of a Redis client (ioredis / node-redis v4 legacy mode) the store needs. */
+export interface RedisLike {
+    get(key: string): Promise<string | null>;
+    set(key: string, value: string, mode: "PX", ttlMs: number): Promise<unknown>;
+    del(key: string): Promise<unknown>;
+}
+
+/** Redis with `maxmemory-policy allkeys-lru` gives TTL + LRU natively. */
+export class RedisCacheStore implements AiCacheStore {
+    constructor(
+        private readonly client: RedisLike,
+        private readonly prefix: string = "ai-cache:"
+    ) {}
+
+    async get(key: string) {
+        const raw = await this.client.get(this.prefix + key);
+        return raw ? (JSON.parse(raw) as CacheEntry) : null;
+    }
+
+    async set(key: string, _namespace: string, value: unknown, ttlMs: number) {
+        const entry: CacheEntry = { value, expiresAt: Date.now() + ttlMs };
+        await this.client.set(this.prefix + key, JSON.stringify(entry), "PX", ttlMs);
+    }
+
+    async delete(key: string) {
+        await this.client.del(this.prefix + key);
+    }
+}
+
+// --- Configuration ---
+
+function defaultStore(): AiCacheStore {
+    const maxEntries = Number(process.env.AI_CACHE_MAX_ENTRIES) || undefined;
+    return process.env.AI_CACHE_STORE === "postgres"
+        ? new PostgresCacheStore(maxEntries)
+        : new MemoryCacheStore(maxEntries);
+}
+
+let store: AiCacheStore | null = null;
+
+/** Swap the backing store, e.g. `setAiCacheStore(new RedisCacheStore(redis))`. */
+export function setAiCacheStore(next: AiCacheStore) {
+    store = next;
+}
+
+function getStore() {
+    return (store ??= defaultStore());
+}
+
+// --- Metrics ---
+
+export interface AiCacheMetrics {
+    hits: number;
+    misses: number;
+    coalesced: number; // served by an identical in-flight request
+    storeErrors: number;
+}
+
+const metrics = new Map<string, AiCacheMetrics>();
+
+function metricsFor(namespace: string) {
+    let entry = metrics.get(namespace);
+    if (!entry) {
+        entry = { hits: 0, misses: 0, coalesced: 0, storeErrors: 0 };
+        metrics.set(namespace, entry);
+    }
+    return entry;
+}
+
+/** Counters per namespace since process start. */
+export function getAiCacheMetrics(): Record<string, AiCacheMetrics & { hitRate: number }> {
+    return Object.fromEntries(
+        [...metrics].map(([namespace, m]) => {
+            const lookups = m.hits + m.misses + m.coalesced;
+            return [namespace, { ...m, hitRate: lookups ? (m.hits + m.coalesced) / lookups : 0 }];
+        })
+    );
+}
+
+// --- Keys ---
+
+/** Whitespace-insensitive: template indentation and trailing spaces don't split the cache. */
+export function normalizePrompt(prompt: string) {
+    return prompt.normalize("NFKC").replace(/\s+/g, " ").trim();
+}
+
+function modelId(model: LanguageModel) {
+    return typeof model === "string" ? model : `${model.provider}:${model.modelId}`;
+}
+
+export async function cacheKey(model: LanguageModel, schema: z.ZodTypeAny, prompt: string) {
+    const jsonSchema = await zodSchema(schema).jsonSchema;
+    return createHash("sha256")
+        .update(JSON.stringify([modelId(model), jsonSchema, normalizePrompt(prompt)]))
+        .digest("hex");
+}
+
+// --- Cached call ---
+
+// Registered before the store lookup, so concurrent identical calls
+// share the lookup as well as the model request
+const inFlight = new Map<string, Promise<{ object: unknown; hit: boolean }>>();
+
+export interface CachedObjectOptions<SCHEMA extends z.ZodTypeAny> {
+    namespace: string; // metrics bucket, e.g. "extraction"
+    model: LanguageModel;
+    schema: SCHEMA;
+    prompt: string;
+    ttlMs?: number;
+}
+
+async function readEntry<SCHEMA extends z.ZodTypeAny>(
+    key: string,
+    { namespace, schema }: CachedObjectOptions<SCHEMA>
+): Promise<z.infer<SCHEMA> | null> {
+    try {
+        const entry = await getStore().get(key);
+        const parsed = entry ? schema.safeParse(entry.value) : null;
+        return parsed?.success ? parsed.data : null;
+    } catch (error) {
+        metricsFor(namespace).storeErrors++;
+        console.warn(`AI cache read failed (${namespace}):`, error);
+        return null;
+    }
+}
+
+async function writeEntry<SCHEMA extends z.ZodTypeAny>(
+    key: string,
+    { namespace, ttlMs = DEFAULT_TTL_MS }: CachedObjectOptions<SCHEMA>,
+    object: z.infer<SCHEMA>
+) {
+    await getStore()
+        .set(key, namespace, object, ttlMs)
+        .catch((error) => {
+            metricsFor(namespace).storeErrors++;
+            console.warn(`AI cache write failed (${namespace}):`, error);
+        });
+}
+
+async function lookupOrGenerate<SCHEMA extends z.ZodTypeAny>(key: string, options: CachedObjectOptions<SCHEMA>) {
+    const hit = await readEntry(key, options);
+    if (hit !== null) return { object: hit as unknown, hit: true };
+
+    const { model, schema, prompt } = options;
+    const { object } = await generateObject({ model, schema, prompt });
+    await writeEntry(key, options, object);
+    return { object: object as unknown, hit: false };
+}
+
+/**
+ * Cache lookup for callers that produce the object themselves (streaming).
+ * Counts a hit or a miss; pair a miss with `writeCachedObject`.
+ */
+export async function readCachedObject<SCHEMA extends z.ZodTypeAny>(
+    options: CachedObjectOptions<SCHEMA>
+): Promise<z.infer<SCHEMA> | null> {
+    const key = await cacheKey(options.model, options.schema, options.prompt);
+    const object = await readEntry(key, options);
+    const stats = metricsFor(options.namespace);
+    if (object !== null) stats.hits++;
+    else stats.misses++;
+    return object;
+}
+
+export async function writeCachedObject<SCHEMA extends z.ZodTypeAny>(
+    options: CachedObjectOptions<SCHEMA>,
+    object: z.infer<SCHEMA>
+) {
+    const key = await cacheKey(options.model, options.schema, options.prompt);
+    await writeEntry(key, options, object);
+}
+
+/**
+ * `generateObject` behind the cache. Store failures degrade to a model call
+ * (counted in `storeErrors`); model failures are not cached and propagate.
+ */
+export async function cachedGenerateObject<SCHEMA extends z.ZodTypeAny>(
+    options: CachedObjectOptions<SCHEMA>
+): Promise<{ object: z.infer<SCHEMA>; cached: boolean }> {
+    const stats = metricsFor(options.namespace);
+    const key = await cacheKey(options.model, options.schema, options.prompt);
+
+    const pending = inFlight.get(key);
+    if (pending) {
+        stats.coalesced++;
+        return { object: (await pending).object as z.infer<SCHEMA>, cached: true };
+    }
+
+    const request = lookupOrGenerate(key, options);
+    inFlight.set(key, request);
+    try {
+        const { object, hit } = await request;
+        if (hit) stats.hits++;
+        else stats.misses++;
+        return { object: object as z.infer<SCHEMA>, cached: hit };
+    } finally {
+        inFlight.delete(key);
+    }
+}
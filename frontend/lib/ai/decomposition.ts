@@ -0,0 +1,240 @@
+import { streamObject } from "ai";
+import { z } from "zod";
+import { mapWithConcurrency } from "@/lib/utils/concurrency";
+import { getFastModel } from "./model";
+import { cachedGenerateObject, readCachedObject, writeCachedObject } from "./cache";
+
+// Schema for the AI Deep Breakdown
+export const MilestoneSchema = z.string();
+
+export const TodoSchema = z.object({
+    week: z.number().min(1).max(4),
+    task: z.string().describe("Specific actionable task"),
+    effort: z.enum(["Low", "Medium", "High"]).describe("Estimated effort"),
+});
+
+export const DecompositionSchema = z.object({
+    milestones: z.array(MilestoneSchema).describe("4 Quarterly milestones (Q1, Q2, Q3, Q4)"),
+    monthOneTodos: z.array(TodoSchema).describe("Detailed breakdown for the first month (4 weeks)"),
+});
+
+export const BatchDecompositionSchema = z.object({
+    domains: z.array(
+        DecompositionSchema.extend({
+            domain: z.string().describe("The domain name exactly as given"),
+        })
+    ),
+});
+
+export type DecompositionTodo = z.infer<typeof TodoSchema>;
+export type Decomposition = z.infer<typeof DecompositionSchema>;
+
+export interface DomainGoalInput {
+    domain: string;
+    goal: string;
+}
+
+// Request bounds for the decomposition endpoints: every domain costs model calls
+export const MAX_DECOMPOSITION_DOMAINS = 12;
+
+export const DomainGoalInputSchema = z.object({
+    domain: z.string().min(1).max(100),
+    goal: z.string().min(1).max(1000),
+});
+
+export type DomainDecompositionResult =
+    | { success: true; data: Decomposition; source: "cache" | "batch" | "single" }
+    | { success: false; error: string };
+
+export function decompositionPrompt(domain: string, goal: string) {
+    return `
+        You are a Strategic Planning AI.
+
+        The user has a goal in the "${domain}" domain: "${goal}".
+
+        Your task:
+        1. Break this 1-year goal into 4 distinct Quarterly Milestones (Q1, Q2, Q3, Q4).
+        2. Create a detailed weekly action plan for ONLY the first month (Month 1).
+
+        Guidelines:
+        - Be realistic. A user cannot run a marathon in Week 1.
+        - Start small to build momentum.
+        - Ensure tasks are concrete (e.g., "Research gyms" vs "Get fit").
+      `;
+}
+
+export function batchDecompositionPrompt(goals: DomainGoalInput[]) {
+    return `
+        You are a Strategic Planning AI.
+
+        The user has one 1-year goal in each of these domains:
+        ${goals.map((g) => `- "${g.domain}": "${g.goal}"`).join("\n        ")}
+
+        Your task, for EVERY domain above (one entry each, "domain" copied exactly):
+        1. Break its 1-year goal into 4 distinct Quarterly Milestones (Q1, Q2, Q3, Q4).
+        2. Create a detailed weekly action plan for ONLY the first month (Month 1).
+
+        Guidelines:
+        - Be realistic. A user cannot run a marathon in Week 1.
+        - Start small to build momentum.
+        - Ensure tasks are concrete (e.g., "Research gyms" vs "Get fit").
+        - Keep the domains' plans compatible: the user does all of them in the same weeks.
+      `;
+}
+
+// Per-goal cache entry, shared by the single, streaming and batch paths
+const singleOptions = ({ domain, goal }: DomainGoalInput) => ({
+    namespace: "decomposition",
+    model: getFastModel(),
+    schema: DecompositionSchema,
+    prompt: decompositionPrompt(domain, goal),
+});
+
+/** One NDJSON line of /api/goals/decompose. */
+export type DecompositionEvent =
+    | { type: "milestone"; index: number; milestone: string }
+    | { type: "todo"; index: number; todo: DecompositionTodo }
+    | { type: "done"; data: Decomposition; cached: boolean }
+    | { type: "error"; error: string };
+
+/**
+ * Elements of a partial array from index `from` on that can no longer change,
+ * validated one by one. The last element is still being written unless
+ * `complete`; stops at the first invalid element (the final object decides).
+ */
+function settledElements<T>(
+    items: readonly unknown[] | undefined,
+    from: number,
+    schema: z.ZodType<T>,
+    complete: boolean
+): T[] {
+    const settled: T[] = [];
+    const end = (items?.length ?? 0) - (complete ? 0 : 1);
+    for (let i = from; i < end; i++) {
+        const parsed = schema.safeParse(items![i]);
+        if (!parsed.success) break;
+        settled.push(parsed.data);
+    }
+    return settled;
+}
+
+/**
+ * `decomposeGoal` as a stream: each milestone and todo is emitted as soon as
+ * the model moves past it, then `done` with the validated whole object.
+ * Shares the decomposition cache with `decomposeGoal`.
+ */
+export async function* streamDecomposition(
+    domain: string,
+    goal: string,
+    abortSignal?: AbortSignal
+): AsyncGenerator<DecompositionEvent> {
+    const cacheOptions = singleOptions({ domain, goal });
+    let milestones = 0;
+    let todos = 0;
+
+    const cached = await readCachedObject(cacheOptions);
+    if (cached) {
+        for (const milestone of cached.milestones) yield { type: "milestone", index: milestones++, milestone };
+        for (const todo of cached.monthOneTodos) yield { type: "todo", index: todos++, todo };
+        yield { type: "done", data: cached, cached: true };
+        return;
+    }
+
+    const result = streamObject({
+        model: cacheOptions.model,
+        schema: DecompositionSchema,
+        prompt: cacheOptions.prompt,
+        abortSignal,
+        onError: ({ error }) => console.error("AI Decomposition Stream Error:", error),
+    });
+
+    for await (const partial of result.partialObjectStream) {
+        // Milestones are final once the model has started on the todos
+        const milestonesDone = partial.monthOneTodos !== undefined;
+        for (const milestone of settledElements(partial.milestones, milestones, MilestoneSchema, milestonesDone)) {
+            yield { type: "milestone", index: milestones++, milestone };
+        }
+        for (const todo of settledElements(partial.monthOneTodos, todos, TodoSchema, false)) {
+            yield { type: "todo", index: todos++, todo };
+        }
+    }
+
+    let data: Decomposition;
+    try {
+        data = await result.object;
+    } catch (error) {
+        console.error("AI Decomposition Error:", error);
+        yield { type: "error", error: "Failed to decompose goal." };
+        return;
+    }
+
+    // Whatever was still open when the stream ended
+    for (const milestone of data.milestones.slice(milestones)) yield { type: "milestone", index: milestones++, milestone };
+    for (const todo of data.monthOneTodos.slice(todos)) yield { type: "todo", index: todos++, todo };
+    await writeCachedObject(cacheOptions, data);
+    yield { type: "done", data, cached: false };
+}
+
+// Per-domain fallback calls in flight at once; keeps under the Flash RPM limit
+const FALLBACK_CONCURRENCY = 2;
+
+/**
+ * Decompose several domains' goals with one model call.
+ *
+ * Domains already in the per-goal cache are skipped; the rest go out as one
+ * batch request. Domains the batch leaves out (or all of them, when the batch
+ * response fails validation) fall back to per-domain calls, at most
+ * FALLBACK_CONCURRENCY at a time. Batch results are written to the per-goal
+ * cache, so a later single decomposition of the same goal is a hit.
+ * Results are keyed by domain name; one domain failing doesn't fail the rest.
+ */
+export async function decomposeGoals(goals: DomainGoalInput[]): Promise<Record<string, DomainDecompositionResult>> {
+    const results: Record<string, DomainDecompositionResult> = {};
+
+    const pending: DomainGoalInput[] = [];
+    for (const goal of goals) {
+        const cached = await readCachedObject(singleOptions(goal));
+        if (cached) results[goal.domain] = { success: true, data: cached, source: "cache" };
+        else pending.push(goal);
+    }
+
+    let missing = pending;
+    if (pending.length > 1) {
+        try {
+            const { object } = await cachedGenerateObject({
+                namespace: "decomposition-batch",
+                model: getFastModel(),
+                schema: BatchDecompositionSchema,
+                prompt: batchDecompositionPrompt(pending),
+            });
+            const byName = new Map(object.domains.map(({ domain, ...data }) => [domain.trim().toLowerCase(), data]));
+            missing = [];
+            for (const goal of pending) {
+                const data = byName.get(goal.domain.trim().toLowerCase());
+                if (!data) {
+                    missing.push(goal);
+                    continue;
+                }
+                results[goal.domain] = { success: true, data, source: "batch" };
+                await writeCachedObject(singleOptions(goal), data);
+            }
+            if (missing.length > 0) {
+                console.warn(`Batch decomposition omitted ${missing.length} domain(s), retrying individually`);
+            }
+        } catch (error) {
+            console.warn("Batch decomposition failed, falling back to per-domain calls:", error);
+        }
+    }
+
+    await mapWithConcurrency(missing, FALLBACK_CONCURRENCY, async (goal) => {
+        try {
+            const { object } = await cachedGenerateObject(singleOptions(goal));
+            results[goal.domain] = { success: true, data: object, source: "single" };
+        } catch (error) {
+            console.error(`AI Decomposition Error (${goal.domain}):`, error);
+            results[goal.domain] = { success: false, error: "Failed to decompose goal." };
+        }
+    });
+
+    return results;
+}
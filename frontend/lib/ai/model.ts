@@ -36,3 +36,9 @@ export const getFastModel = () => {
 
     return google("gemini-2.5-flash");
 }
+
+/**
+ * AI_MOCK_MODEL=true swaps model calls that support it for deterministic
+ * local stand-ins (no key, no network); used by the TC suite.
+ */
+export const isMockModel = () => process.env.AI_MOCK_MODEL === "true";
@@ -0,0 +1,69 @@
+import { generateObject } from "ai";
+import { z } from "zod";
+import { getFastModel, isMockModel } from "./model";
+
+// Schema for the AI journal analysis
+export const SentimentSchema = z.enum(["positive", "neutral", "negative", "mixed"]);
+
+export const JournalAnalysisSchema = z.object({
+    sentiment: SentimentSchema.describe("Overall emotional tone of the entry"),
+    energyLevel: z.number().int().min(1).max(10).describe("Energy the writer reports, 1 (drained) to 10 (energized)"),
+    reflection: z.string().describe("2-3 sentence reflection addressed to the writer"),
+});
+
+const BatchAnalysisSchema = z.object({
+    entries: z.array(JournalAnalysisSchema.extend({ id: z.string().describe("The entry id exactly as given") })),
+});
+
+export type JournalAnalysis = z.infer<typeof JournalAnalysisSchema>;
+
+export interface JournalEntryInput {
+    id: string;
+    text: string;
+}
+
+/**
+ * Sentiment, energy and a short reflection for each entry, in one model
+ * call per batch. Entries the model leaves out are missing from the map.
+ */
+export async function analyzeJournalEntries(entries: JournalEntryInput[]): Promise<Map<string, JournalAnalysis>> {
+    if (entries.length === 0) return new Map();
+    if (isMockModel()) return new Map(entries.map((e) => [e.id, mockAnalysis(e.text)]));
+
+    const { object } = await generateObject({
+        model: getFastModel(),
+        schema: BatchAnalysisSchema,
+        prompt: `
+        You are a supportive performance coach reading nightly journal entries.
+        For EACH entry below (one result per entry, "id" copied exactly):
+        1. Classify the overall sentiment.
+        2. Rate the energy level the writer describes, 1-10.
+        3. Write a 2-3 sentence reflection: name one pattern you notice and one small suggestion for tomorrow.
+
+        Entries:
+        ${entries.map((e) => `[${e.id}]\n"""${e.text}"""`).join("\n\n")}
+      `,
+    });
+
+    const ids = new Set(entries.map((e) => e.id));
+    return new Map(object.entries.filter((e) => ids.has(e.id)).map(({ id, ...analysis }) => [id, analysis]));
+}
+
+// --- Mock model ---
+
+const POSITIVE = /\b(great|good|happy|excited|energi[sz]ed|motivated|focused|proud|progress|positive|calm|grateful)\b/gi;
+const NEGATIVE = /\b(bad|sad|tired|anxious|anxiety|stressed|drained|frustrat\w*|angry|stuck|overwhelmed|exhausted)\b/gi;
+
+/** Deterministic keyword analysis standing in for the model (AI_MOCK_MODEL). */
+export function mockAnalysis(text: string): JournalAnalysis {
+    const positive = text.match(POSITIVE)?.length ?? 0;
+    const negative = text.match(NEGATIVE)?.length ?? 0;
+    const sentiment =
+        positive && negative ? "mixed" : positive ? "positive" : negative ? "negative" : "neutral";
+    const energyLevel = Math.min(10, Math.max(1, 5 + positive - negative));
+    return {
+        sentiment,
+        energyLevel,
+        reflection: `Mock reflection: ${positive} uplifting and ${negative} draining signals today. Keep tomorrow's first task small.`,
+    };
+}
@@ -33,6 +33,13 @@ export const boardsApi = {
     throw new Error("No board found");
   },
 
+  getPixelBitmap: async (boardId: string): Promise<Uint8Array | null> => {
+    // Same-origin route handler; mock boards have no stored bitmap (404)
+    const response = await fetch(`/api/boards/${boardId}/pixels`);
+    if (!response.ok) return null;
+    return new Uint8Array(await response.arrayBuffer());
+  },
+
   getWeekly: async (weekOffset?: number): Promise<VisionBoard> => {
     if (shouldUseMockData()) {
       await new Promise((resolve) => setTimeout(resolve, 300));
@@ -0,0 +1,12 @@
+import { getDashboardSnapshot } from "@/app/actions";
+import type { DashboardSnapshot } from "@/app/actions";
+
+// Number of timeline weeks bundled with the dashboard snapshot
+export const DASHBOARD_TIMELINE_WEEKS = 26;
+
+export const dashboardApi = {
+  getSnapshot: async (): Promise<DashboardSnapshot | null> => {
+    // Single Server Action call for everything the dashboard renders
+    return await getDashboardSnapshot(DASHBOARD_TIMELINE_WEEKS);
+  },
+};
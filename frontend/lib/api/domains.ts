@@ -87,17 +87,11 @@ export const domainsApi = {
       return newImage;
     }
 
+    // Resized, deduplicated and stored by the ingest pipeline (lib/images)
     const formData = new FormData();
     formData.append("file", file);
-    const response = await apiClient.post<DomainImage>(
-      `/domains/${domainId}/images`,
-      formData,
-      {
-        headers: {
-          "Content-Type": "multipart/form-data",
-        },
-      }
-    );
-    return response.data;
+    const response = await fetch(`/api/domains/${domainId}/images`, { method: "POST", body: formData });
+    if (!response.ok) throw new Error(`Image upload failed (HTTP ${response.status})`);
+    return response.json();
   },
 };
\ No newline at end of file
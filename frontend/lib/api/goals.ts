@@ -5,6 +5,7 @@ import type {
   DecomposeResponse,
   ApproveBreakdownRequest,
 } from "@/lib/types";
+import type { DecompositionEvent } from "@/lib/ai/decomposition";
 import { mockGoals6Months } from "@/lib/utils/mockData6Months";
 
 import { getGoals } from "@/app/actions";
@@ -93,6 +94,37 @@ export const goalsApi = {
     return response.data;
   },
 
+  // Streams the AI breakdown of a free-text goal; resolves once the stream ends
+  streamDecomposition: async (
+    domain: string,
+    goal: string,
+    onEvent: (event: DecompositionEvent) => void,
+    signal?: AbortSignal
+  ): Promise<void> => {
+    const response = await fetch("/api/goals/decompose", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ domain, goal }),
+      signal,
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Decomposition failed (${response.status})`);
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = "";
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += value;
+      const lines = buffer.split("\n");
+      buffer = lines.pop()!;
+      for (const line of lines) {
+        if (line) onEvent(JSON.parse(line));
+      }
+    }
+  },
+
   approveBreakdown: async (goalId: string, data: ApproveBreakdownRequest): Promise<Goal> => {
     if (shouldUseMockData()) {
       await new Promise((resolve) => setTimeout(resolve, 500));
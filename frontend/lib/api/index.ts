@@ -8,6 +8,8 @@ export * from "./journals";
 export * from "./boards";
 export * from "./timeline";
 export * from "./pixels";
+export * from "./dashboard";
+export * from "./reminders";
 
 // Re-export as api object for easier imports
 import { authApi } from "./auth";
@@ -18,6 +20,8 @@ import { journalsApi } from "./journals";
 import { boardsApi } from "./boards";
 import { timelineApi } from "./timeline";
 import { pixelsApi } from "./pixels";
+import { dashboardApi } from "./dashboard";
+import { remindersApi } from "./reminders";
 
 export const api = {
   auth: authApi,
@@ -28,4 +32,6 @@ export const api = {
   boards: boardsApi,
   timeline: timelineApi,
   pixels: pixelsApi,
+  dashboard: dashboardApi,
+  reminders: remindersApi,
 };
\ No newline at end of file
@@ -1,7 +1,8 @@
 import { apiClient, shouldUseMockData } from "./client";
 import type { Journal, CreateJournalRequest, CreateJournalResponse } from "@/lib/types";
+import type { StreakData } from "@/lib/utils/streakCalculator";
 import { generateJournalHistory } from "@/lib/utils/generateJournalHistory";
-import { getJournals, submitJournal } from "@/app/actions";
+import { getJournalAnalysis, getJournals, getStreak, submitJournal, type JournalAnalysisView } from "@/app/actions";
 
 // ... existing code ...
 
@@ -17,13 +18,14 @@ export const journalsApi = {
       // For now returning mock-like object using input data 
       return {
         journal: {
-          id: "temp_id",
+          id: result.journalId ?? "temp_id",
           userId: "me",
           journalDate: data.journalDate,
           entryText: data.entryText,
-          emotionalState: "neutral",
-          energyLevel: 5,
+          emotionalState: null,
+          energyLevel: null,
           aiReflection: null,
+          analysisStatus: "pending",
           submittedAt: new Date().toISOString(),
           completedTasks: []
         },
@@ -48,4 +50,14 @@ export const journalsApi = {
     }
     return [];
   },
+
+  // Background AI analysis of one entry (see useJournalAnalysis)
+  getAnalysis: async (journalId: string): Promise<JournalAnalysisView | null> => {
+    return await getJournalAnalysis(journalId);
+  },
+
+  // Persisted streak aggregate; null when signed out (callers fall back to journals)
+  getStreak: async (): Promise<StreakData | null> => {
+    return await getStreak();
+  },
 };
@@ -1,18 +1,18 @@
-import { apiClient, shouldUseMockData } from "./client";
+import { shouldUseMockData } from "./client";
 import type { PixelSummary } from "@/lib/types";
 import { getPixelSummary6Months } from "@/lib/utils/mockData6Months";
+import { getPixelSummary } from "@/app/actions";
 
 export const pixelsApi = {
+  // Ledger rollups (lib/pixels/ledger.ts); null when signed out
   getSummary: async (start?: string, end?: string): Promise<PixelSummary> => {
+    const summary = await getPixelSummary(start, end);
+    if (summary) return summary;
+
     if (shouldUseMockData()) {
       await new Promise((resolve) => setTimeout(resolve, 300));
       return getPixelSummary6Months();
     }
-
-    const params = new URLSearchParams();
-    if (start) params.append("start", start);
-    if (end) params.append("end", end);
-    const response = await apiClient.get<PixelSummary>(`/pixels/summary?${params.toString()}`);
-    return response.data;
+    return { totalPixels: 0, byDomain: [], byDate: [] };
   },
 };
@@ -0,0 +1,15 @@
+import type { ReminderSettings } from "@/lib/reminders/schedule";
+import { getReminderSettings, updateReminderSettings, type ReminderSettingsView } from "@/app/actions";
+
+export const remindersApi = {
+  getSettings: async (): Promise<ReminderSettingsView | null> => {
+    return getReminderSettings();
+  },
+
+  // Reschedules the user's next bedtime/morning reminders server-side
+  updateSettings: async (settings: ReminderSettings): Promise<ReminderSettingsView> => {
+    const result = await updateReminderSettings(settings);
+    if (!result.success) throw new Error(result.error);
+    return result.settings;
+  },
+};
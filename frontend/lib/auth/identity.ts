@@ -0,0 +1,54 @@
+import { cache } from "react";
+import { auth, currentUser } from "@clerk/nextjs/server";
+import { prisma } from "@/lib/prisma";
+import { LRUCache } from "@/lib/utils/lruCache";
+
+/**
+ * Clerk user id -> our User.id.
+ * The mapping never changes once written, the TTL only bounds how long a
+ * deleted user can linger in a warm server instance.
+ */
+const userIdByClerkId = new LRUCache<string, string>(10_000, 5 * 60 * 1000);
+
+async function lookupUserId(clerkId: string): Promise<string | null> {
+    const user = await prisma.user.findUnique({
+        where: { clerkId },
+        select: { id: true },
+    });
+    if (user) return user.id;
+
+    // Users created before clerkId existed: resolve once by email and backfill,
+    // so the next lookup takes the indexed path above.
+    const clerkUser = await currentUser();
+    const email = clerkUser?.emailAddresses[0]?.emailAddress;
+    if (!email) return null;
+
+    const legacy = await prisma.user.findUnique({
+        where: { email },
+        select: { id: true, clerkId: true },
+    });
+    if (!legacy) return null;
+    if (!legacy.clerkId) {
+        await prisma.user.update({ where: { id: legacy.id }, data: { clerkId } });
+    }
+    return legacy.id;
+}
+
+/**
+ * Our User.id for the signed-in Clerk user, or null.
+ *
+ * Memoized per request with React `cache`, so every server action and
+ * server component rendering the same request shares one resolution.
+ * `auth()` reads the verified session token locally, no Clerk API call.
+ */
+export const getCurrentUserId = cache(async (): Promise<string | null> => {
+    const { userId: clerkId } = await auth();
+    if (!clerkId) return null;
+
+    const cached = userIdByClerkId.get(clerkId);
+    if (cached) return cached;
+
+    const userId = await lookupUserId(clerkId);
+    if (userId) userIdByClerkId.set(clerkId, userId);
+    return userId;
+});
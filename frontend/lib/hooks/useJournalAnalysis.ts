@@ -0,0 +1,36 @@
+import { useEffect } from "react";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
+import { api } from "@/lib/api";
+import { queryKeys } from "@/lib/query/queryClient";
+import type { Journal } from "@/lib/types";
+
+const FIRST_POLL_MS = 2000;
+const MAX_POLL_MS = 30000;
+
+// AI analysis of a journal entry, polled with backoff while it is still pending
+export function useJournalAnalysis(journal: Journal | null | undefined) {
+  const queryClient = useQueryClient();
+  const id = journal?.id ?? "";
+  const waiting = journal?.analysisStatus === "pending";
+
+  const { data } = useQuery({
+    queryKey: queryKeys.journals.analysis(id),
+    queryFn: () => api.journals.getAnalysis(id),
+    enabled: waiting,
+    refetchInterval: (query) =>
+      query.state.data?.analysisStatus === "pending"
+        ? Math.min(FIRST_POLL_MS * 2 ** query.state.dataUpdateCount, MAX_POLL_MS)
+        : false,
+  });
+
+  // Finished: refresh the journal list so every view picks up the result
+  const status = data?.analysisStatus;
+  useEffect(() => {
+    if (waiting && status && status !== "pending") {
+      queryClient.invalidateQueries({ queryKey: queryKeys.journals.all, exact: true });
+    }
+  }, [waiting, status, queryClient]);
+
+  if (!journal) return null;
+  return data && data.analysisStatus !== "pending" ? { ...journal, ...data } : journal;
+}
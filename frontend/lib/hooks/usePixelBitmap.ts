@@ -0,0 +1,15 @@
+import { useQuery } from "@tanstack/react-query";
+import { api } from "@/lib/api";
+import { queryKeys } from "@/lib/query/queryClient";
+import type { VisionBoard } from "@/lib/types";
+
+// Stored pixel bitmap of a board, refetched whenever its coloredPixels changes
+export function usePixelBitmap(board: VisionBoard | null | undefined) {
+  const { data } = useQuery({
+    queryKey: queryKeys.boards.pixels(board?.id ?? "", board?.coloredPixels ?? 0),
+    queryFn: () => api.boards.getPixelBitmap(board!.id),
+    enabled: !!board?.id,
+    staleTime: Infinity,
+  });
+  return data ?? null;
+}
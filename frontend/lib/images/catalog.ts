@@ -0,0 +1,99 @@
+/**
+ * Seeded stock-image catalog for onboarding suggestions, searched offline
+ * by lib/images/search.ts. Client-safe: plain data.
+ *
+ * Tags are what the extraction step's imageKeywords (app/functions/
+ * extraction.ts) are matched against, so they favour the visual words a
+ * model reaches for ("desk", "sunrise", "flatlay") over category names.
+ * `vector` is an optional embedding of the image; entries without one are
+ * ranked on tags alone.
+ */
+
+export interface CatalogImage {
+    id: string;
+    url: string;
+    category: string;
+    tags: string[];
+    vector?: number[];
+}
+
+/** Category whose images are suggested when nothing matches. */
+export const FALLBACK_CATEGORY = "default";
+
+const unsplash = (photo: string) => `https://images.unsplash.com/photo-${photo}?w=800&auto=format&fit=crop`;
+
+interface CatalogGroup {
+    tags: string[];
+    photos: { id: string; tags: string[] }[];
+}
+
+const GROUPS: Record<string, CatalogGroup> = {
+    default: {
+        tags: ["aesthetic", "inspiration", "lifestyle", "minimal", "vision", "dream", "calm"],
+        photos: [
+            { id: "1493663284031-b7e3aefcae8e", tags: ["interior", "home", "cozy"] },
+            { id: "1511871893393-82e9c16b81e3", tags: ["mountain", "landscape", "sky"] },
+            { id: "1506784365847-bbad939e9335", tags: ["planner", "journal", "notebook"] },
+            { id: "1481487484168-9b930d55208d", tags: ["coffee", "morning", "desk"] },
+        ],
+    },
+    career: {
+        tags: ["career", "work", "office", "business", "professional", "success", "productivity", "growth", "leadership"],
+        photos: [
+            { id: "1486312338219-ce68d2c6f44d", tags: ["laptop", "coding", "desk", "typing", "tech"] },
+            { id: "1542601906990-b4d3fb7d5c73", tags: ["workspace", "setup", "focus", "minimal"] },
+            { id: "1552664730-d307ca884978", tags: ["team", "meeting", "collaboration", "startup"] },
+            { id: "1519389950473-47ba0277781c", tags: ["team", "laptop", "coding", "tech", "startup"] },
+        ],
+    },
+    health: {
+        tags: ["health", "fitness", "wellness", "body", "strength", "energy", "active", "exercise"],
+        photos: [
+            { id: "1517836357463-d25dfeac3438", tags: ["gym", "weights", "training", "workout"] },
+            { id: "1571019614242-c5c5dee9f50b", tags: ["gym", "workout", "cardio", "training"] },
+            { id: "1544367563-12123d8966cd", tags: ["yoga", "meditation", "mindfulness", "calm", "stretch"] },
+            { id: "1574680096141-1cddd32e04ca", tags: ["run", "running", "outdoor", "cardio"] },
+        ],
+    },
+    travel: {
+        tags: ["travel", "trip", "adventure", "explore", "journey", "wanderlust", "nature", "vacation"],
+        photos: [
+            { id: "1476514525535-07fb3b4ae5f1", tags: ["lake", "mountain", "landscape", "boat"] },
+            { id: "1469854523086-cc02fe5d8800", tags: ["road", "roadtrip", "van", "desert"] },
+            { id: "1488646953014-85cb44e25828", tags: ["map", "planning", "passport", "flatlay"] },
+        ],
+    },
+    finance: {
+        tags: ["finance", "money", "wealth", "savings", "investing", "budget", "abundance", "financial", "freedom"],
+        photos: [
+            { id: "1579621970563-ebec7560ff3e", tags: ["coins", "cash", "growth"] },
+            { id: "1554224155-8d04cb21cd6c", tags: ["calculator", "planning", "desk", "paperwork"] },
+            { id: "1565514020179-0222d7b219fb", tags: ["cash", "bills", "currency"] },
+        ],
+    },
+    relationships: {
+        tags: ["relationship", "love", "family", "friends", "friendship", "connection", "together", "community", "happy"],
+        photos: [
+            { id: "1529156069898-49953e39b3ac", tags: ["friends", "group", "laughing", "outdoor"] },
+            { id: "1511632765486-a01980e01a18", tags: ["family", "kids", "parents", "home"] },
+            { id: "1516589178581-6cd7833ae3b2", tags: ["couple", "romance", "date", "hands"] },
+        ],
+    },
+    creativity: {
+        tags: ["creative", "creativity", "art", "artist", "design", "inspiration", "craft", "expression"],
+        photos: [
+            { id: "1513364776144-60967b0f800f", tags: ["paint", "painting", "brushes", "palette", "colorful"] },
+            { id: "1491245338813-c6832976196e", tags: ["studio", "music", "instrument"] },
+            { id: "1452860606245-08befc0ff44b", tags: ["sketch", "drawing", "pencil", "notebook"] },
+        ],
+    },
+};
+
+export const IMAGE_CATALOG: CatalogImage[] = Object.entries(GROUPS).flatMap(([category, group]) =>
+    group.photos.map((photo) => ({
+        id: photo.id,
+        url: unsplash(photo.id),
+        category,
+        tags: [...new Set([...group.tags, ...photo.tags])],
+    }))
+);
@@ -0,0 +1,100 @@
+/**
+ * Image dimensions read from the file header, without decoding any
+ * pixels, so an upload's size can be checked before the decoder allocates
+ * for it. Covers the formats ingestion accepts; anything else is null.
+ */
+
+export type UploadFormat = "png" | "jpeg" | "gif" | "webp" | "avif";
+
+export interface ImageHeader {
+    format: UploadFormat;
+    width: number;
+    height: number;
+}
+
+// AVIF keeps its `ispe` (image spatial extent) boxes in the leading `meta` box
+const AVIF_SCAN_BYTES = 64 * 1024;
+
+const ascii = (data: Uint8Array, offset: number, text: string) =>
+    offset + text.length <= data.length && [...text].every((char, i) => data[offset + i] === char.charCodeAt(0));
+
+function png(data: Uint8Array, view: DataView): ImageHeader | null {
+    // Signature, then IHDR is always the first chunk
+    if (data.length < 24 || !ascii(data, 12, "IHDR")) return null;
+    return { format: "png", width: view.getUint32(16), height: view.getUint32(20) };
+}
+
+function gif(data: Uint8Array, view: DataView): ImageHeader | null {
+    if (data.length < 10) return null;
+    return { format: "gif", width: view.getUint16(6, true), height: view.getUint16(8, true) };
+}
+
+function jpeg(data: Uint8Array, view: DataView): ImageHeader | null {
+    let offset = 2;
+    while (offset + 4 <= data.length) {
+        if (data[offset] !== 0xff) return null;
+        const marker = data[offset + 1];
+        if (marker === 0xff) {
+            offset++; // Fill byte
+            continue;
+        }
+        // Markers without a length: TEM, RSTn, SOI
+        if (marker === 0x01 || (marker >= 0xd0 && marker <= 0xd8)) {
+            offset += 2;
+            continue;
+        }
+        // SOFn holds the frame size (C4 DHT, C8 JPG and CC DAC share the range)
+        if (marker >= 0xc0 && marker <= 0xcf && marker !== 0xc4 && marker !== 0xc8 && marker !== 0xcc) {
+            if (offset + 9 > data.length) return null;
+            return { format: "jpeg", width: view.getUint16(offset + 7), height: view.getUint16(offset + 5) };
+        }
+        if (marker === 0xd9 || marker === 0xda) return null; // EOI or scan data before any frame
+        offset += 2 + view.getUint16(offset + 2);
+    }
+    return null;
+}
+
+function webp(data: Uint8Array, view: DataView): ImageHeader | null {
+    if (data.length < 30) return null;
+    if (ascii(data, 12, "VP8 ")) {
+        if (data[23] !== 0x9d || data[24] !== 0x01 || data[25] !== 0x2a) return null;
+        return { format: "webp", width: view.getUint16(26, true) & 0x3fff, height: view.getUint16(28, true) & 0x3fff };
+    }
+    if (ascii(data, 12, "VP8L")) {
+        if (data[20] !== 0x2f) return null;
+        const bits = view.getUint32(21, true);
+        return { format: "webp", width: (bits & 0x3fff) + 1, height: ((bits >>> 14) & 0x3fff) + 1 };
+    }
+    if (ascii(data, 12, "VP8X")) {
+        const uint24 = (offset: number) => data[offset] | (data[offset + 1] << 8) | (data[offset + 2] << 16);
+        return { format: "webp", width: uint24(24) + 1, height: uint24(27) + 1 };
+    }
+    return null;
+}
+
+function avif(data: Uint8Array, view: DataView): ImageHeader | null {
+    const major = ascii(data, 8, "avif") || ascii(data, 8, "avis");
+    if (!major) return null;
+    // Grid images carry one ispe per tile plus the canvas; the largest is what gets decoded
+    let width = 0;
+    let height = 0;
+    const end = Math.min(data.length, AVIF_SCAN_BYTES) - 16;
+    for (let offset = 0; offset <= end; offset++) {
+        if (!ascii(data, offset, "ispe")) continue;
+        const w = view.getUint32(offset + 8);
+        const h = view.getUint32(offset + 12);
+        if (w * h > width * height) [width, height] = [w, h];
+    }
+    return width && height ? { format: "avif", width, height } : null;
+}
+
+/** Format and pixel size of an image file, or null when it is not a supported format. */
+export function readImageHeader(data: Uint8Array): ImageHeader | null {
+    const view = new DataView(data.buffer, data.byteOffset, data.byteLength);
+    if (data.length >= 8 && data[0] === 0x89 && ascii(data, 1, "PNG\r\n\x1a\n")) return png(data, view);
+    if (data.length >= 3 && data[0] === 0xff && data[1] === 0xd8 && data[2] === 0xff) return jpeg(data, view);
+    if (ascii(data, 0, "GIF87a") || ascii(data, 0, "GIF89a")) return gif(data, view);
+    if (ascii(data, 0, "RIFF") && ascii(data, 8, "WEBP")) return webp(data, view);
+    if (ascii(data, 4, "ftyp")) return avif(data, view);
+    return null;
+}
@@ -0,0 +1,91 @@
+import { createHash } from "crypto";
+import { Worker } from "worker_threads";
+import { Prisma } from "@prisma/client";
+import { prisma } from "@/lib/prisma";
+import type { DomainImage, ImageVariant } from "@/lib/types";
+import { poolSize, WorkerPool } from "@/lib/workers/pool";
+import { readImageHeader } from "./header";
+import { MAX_PIXELS, processImage, type IngestJob } from "./process";
+import { readManifest, type ImageManifest } from "./store";
+
+/**
+ * Upload ingestion. An upload is addressed by the sha256 of its bytes: if
+ * the store already holds that hash (any user, any domain) nothing is
+ * decoded or encoded again, and concurrent uploads of the same bytes share
+ * one processing run. New images are processed on a worker pool
+ * (IMAGE_WORKERS, see lib/workers/pool.ts).
+ */
+
+export type AddDomainImageResult =
+    | { success: true; image: DomainImage }
+    | { success: false; error: "not-found" | "unsupported-format" | "too-large" | "undecodable" };
+
+let pool: WorkerPool<IngestJob, ImageManifest | null> | null = null;
+const inFlight = new Map<string, Promise<ImageManifest | null>>();
+
+function processOnPool(job: IngestJob) {
+    const size = poolSize("IMAGE_WORKERS");
+    if (size === 0) return processImage(job);
+    pool ??= new WorkerPool(() => new Worker(new URL("./ingest.worker.ts", import.meta.url)), size);
+    return pool.run(job, [job.data.buffer as ArrayBuffer]);
+}
+
+/** Store an image's variants (once per content hash) and return its manifest; null if it does not decode. */
+export function ingestImage(data: Buffer): Promise<ImageManifest | null> {
+    const hash = createHash("sha256").update(data).digest("hex");
+    let pending = inFlight.get(hash);
+    if (!pending) {
+        pending = (async () => {
+            const stored = await readManifest(hash);
+            if (stored) return stored;
+            // Own copy of the bytes, transferred to the worker
+            return processOnPool({ hash, data: new Uint8Array(data) });
+        })().finally(() => inFlight.delete(hash));
+        inFlight.set(hash, pending);
+    }
+    return pending;
+}
+
+/**
+ * Add an uploaded image to one of the user's domains. Uploading bytes the
+ * domain already has returns the existing image. The file's header is
+ * checked before anything is decoded: unknown formats and images over
+ * MAX_PIXELS are refused without allocating for them.
+ */
+export async function addDomainImage(userId: string, domainId: string, data: Buffer): Promise<AddDomainImageResult> {
+    const domain = await prisma.domain.findFirst({ where: { id: domainId, userId }, select: { id: true } });
+    if (!domain) return { success: false, error: "not-found" };
+
+    const header = readImageHeader(data);
+    if (!header) return { success: false, error: "unsupported-format" };
+    if (!header.width || !header.height || header.width * header.height > MAX_PIXELS) {
+        return { success: false, error: "too-large" };
+    }
+
+    const manifest = await ingestImage(data);
+    if (!manifest) return { success: false, error: "undecodable" };
+    const image = await prisma.domainImage.upsert({
+        where: { domainId_contentHash: { domainId, contentHash: manifest.hash } },
+        update: {},
+        create: {
+            domainId,
+            url: manifest.variants[manifest.variants.length - 1].url,
+            contentHash: manifest.hash,
+            variants: manifest.variants as unknown as Prisma.InputJsonValue,
+            placeholder: manifest.placeholder,
+            sortOrder: await prisma.domainImage.count({ where: { domainId } }),
+        },
+    });
+
+    return {
+        success: true,
+        image: {
+            id: image.id,
+            imageUrl: image.url,
+            sortOrder: image.sortOrder,
+            uploadedAt: new Date().toISOString(),
+            variants: image.variants as unknown as ImageVariant[],
+            placeholder: image.placeholder,
+        },
+    };
+}
@@ -0,0 +1,5 @@
+import { serveJobs } from "@/lib/workers/pool";
+import { processImage, type IngestJob } from "./process";
+
+// One upload at a time per worker; see ingest.ts
+serveJobs((job: IngestJob) => processImage(job));
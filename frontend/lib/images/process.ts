@@ -0,0 +1,69 @@
+import { createCanvas, loadImage, type Image } from "@napi-rs/canvas";
+import { mkdir, writeFile } from "fs/promises";
+import type { ImageVariant } from "@/lib/types";
+import { imageDir, variantFile, writeManifest, type ImageManifest } from "./store";
+import { IMAGE_VARIANT_WIDTHS, imageVariantUrl } from "./variants";
+
+export interface IngestJob {
+    hash: string;
+    data: Uint8Array;
+}
+
+const WEBP_QUALITY = 82;
+const AVIF_QUALITY = 60;
+const PLACEHOLDER_WIDTH = 16;
+const PLACEHOLDER_QUALITY = 50;
+// Decoded size cap, against decompression bombs; checked on the header before decoding (ingest.ts)
+export const MAX_PIXELS = 50_000_000;
+
+function resize(image: Image, width: number, height: number) {
+    const canvas = createCanvas(width, height);
+    const ctx = canvas.getContext("2d");
+    ctx.imageSmoothingQuality = "high";
+    ctx.drawImage(image, 0, 0, width, height);
+    return canvas;
+}
+
+/**
+ * Decode an upload and write its variants (AVIF and WebP at each board
+ * width up to the original's) and manifest to the store. CPU-bound: runs
+ * on the ingest worker pool. Null when the bytes do not decode (a corrupt
+ * or truncated file behind a valid header).
+ */
+export async function processImage({ hash, data }: IngestJob): Promise<ImageManifest | null> {
+    const image = await loadImage(Buffer.from(data.buffer, data.byteOffset, data.byteLength)).catch(() => null);
+    if (!image) return null;
+    const { width, height } = image;
+    if (!width || !height || width * height > MAX_PIXELS) return null;
+
+    // Never upscale: sizes below the original, then the original capped at the largest
+    const largest = IMAGE_VARIANT_WIDTHS[IMAGE_VARIANT_WIDTHS.length - 1];
+    const widths = [...IMAGE_VARIANT_WIDTHS.filter((w) => w < width), Math.min(width, largest)];
+
+    await mkdir(imageDir(hash), { recursive: true });
+    const variants: ImageVariant[] = [];
+    for (const w of [...new Set(widths)]) {
+        const h = Math.max(1, Math.round((height * w) / width));
+        const canvas = resize(image, w, h);
+        const [webp, avif] = await Promise.all([
+            canvas.encode("webp", WEBP_QUALITY),
+            canvas.encode("avif", { quality: AVIF_QUALITY }),
+        ]);
+        await Promise.all([writeFile(variantFile(hash, w, "webp"), webp), writeFile(variantFile(hash, w, "avif"), avif)]);
+        variants.push({ width: w, height: h, url: imageVariantUrl(hash, w) });
+    }
+
+    // A few hundred bytes; the browser's upscale (and next/image's blur) does the blurring
+    const placeholderHeight = Math.max(1, Math.round((height * PLACEHOLDER_WIDTH) / width));
+    const placeholder = await resize(image, PLACEHOLDER_WIDTH, placeholderHeight).encode("webp", PLACEHOLDER_QUALITY);
+
+    const manifest: ImageManifest = {
+        hash,
+        width,
+        height,
+        placeholder: `data:image/webp;base64,${placeholder.toString("base64")}`,
+        variants,
+    };
+    await writeManifest(manifest);
+    return manifest;
+}
@@ -0,0 +1,149 @@
+import { FALLBACK_CATEGORY, IMAGE_CATALOG, type CatalogImage } from "./catalog";
+
+/**
+ * In-memory search over the seeded catalog (lib/images/catalog.ts).
+ * Client-safe, offline. Tags are indexed once into posting lists and
+ * queries are ranked with BM25 (every tag counts once per image, so longer
+ * tag lists dilute a match), plus cosine similarity when the caller passes
+ * a query embedding and the image has one. Ranked lists of recent queries
+ * are memoized, so paging and revisiting a domain only slice an array.
+ */
+
+export interface ImageSearchOptions {
+    page?: number; // 0-based
+    pageSize?: number;
+    vector?: number[]; // Query embedding, for images that carry one
+}
+
+export interface ImageSearchPage {
+    images: CatalogImage[];
+    total: number;
+    page: number;
+    hasMore: boolean;
+}
+
+const DEFAULT_PAGE_SIZE = 12;
+const MEMO_SIZE = 256;
+// BM25 parameters; k1 barely matters with term frequency fixed at 1
+const K1 = 1.2;
+const B = 0.75;
+const VECTOR_WEIGHT = 2;
+
+const STOPWORDS = new Set(["a", "an", "and", "the", "of", "for", "with", "in", "on", "to", "my", "your", "at", "by"]);
+
+// Plural folding only: "relationships" finds "relationship", "families" finds "family"
+function stem(word: string) {
+    if (word.length > 4 && word.endsWith("ies")) return `${word.slice(0, -3)}y`;
+    if (word.length > 3 && word.endsWith("s") && !word.endsWith("ss")) return word.slice(0, -1);
+    return word;
+}
+
+/** Normalized, de-duplicated search terms of a query or keyword list. */
+export function tokenize(text: string | string[]): string[] {
+    const words = (Array.isArray(text) ? text.join(" ") : text).toLowerCase().split(/[^a-z0-9]+/);
+    return [...new Set(words.filter((word) => word && !STOPWORDS.has(word)).map(stem))];
+}
+
+interface ImageIndex {
+    postings: Map<string, number[]>; // term -> catalog positions
+    lengths: number[];
+    avgLength: number;
+    fallback: number[];
+}
+
+let index: ImageIndex | null = null;
+
+function buildIndex(): ImageIndex {
+    const postings = new Map<string, number[]>();
+    const lengths = IMAGE_CATALOG.map((image, doc) => {
+        const terms = tokenize(image.tags);
+        for (const term of terms) {
+            const list = postings.get(term);
+            if (list) list.push(doc);
+            else postings.set(term, [doc]);
+        }
+        return terms.length;
+    });
+    return {
+        postings,
+        lengths,
+        avgLength: lengths.reduce((sum, length) => sum + length, 0) / Math.max(1, lengths.length),
+        fallback: IMAGE_CATALOG.flatMap((image, doc) => (image.category === FALLBACK_CATEGORY ? [doc] : [])),
+    };
+}
+
+function cosine(a: number[], b: number[]) {
+    let dot = 0;
+    let normA = 0;
+    let normB = 0;
+    for (let i = 0; i < Math.min(a.length, b.length); i++) {
+        dot += a[i] * b[i];
+        normA += a[i] * a[i];
+        normB += b[i] * b[i];
+    }
+    return normA && normB ? dot / Math.sqrt(normA * normB) : 0;
+}
+
+/** Catalog positions by descending relevance; ties keep catalog order. */
+function rank(terms: string[], vector?: number[]): number[] {
+    index ??= buildIndex();
+    const { postings, lengths, avgLength } = index;
+    const total = lengths.length;
+
+    const scores = new Map<number, number>();
+    for (const term of terms) {
+        const docs = postings.get(term);
+        if (!docs) continue;
+        const idf = Math.log(1 + (total - docs.length + 0.5) / (docs.length + 0.5));
+        for (const doc of docs) {
+            const weight = (idf * (K1 + 1)) / (1 + K1 * (1 - B + (B * lengths[doc]) / avgLength));
+            scores.set(doc, (scores.get(doc) ?? 0) + weight);
+        }
+    }
+
+    if (vector) {
+        for (const [doc, score] of scores) {
+            const embedding = IMAGE_CATALOG[doc].vector;
+            if (embedding) scores.set(doc, score + VECTOR_WEIGHT * cosine(vector, embedding));
+        }
+    }
+
+    if (scores.size === 0) return index.fallback;
+    return [...scores.entries()].sort((a, b) => b[1] - a[1] || a[0] - b[0]).map(([doc]) => doc);
+}
+
+// Insertion-ordered Map as an LRU: a hit is re-inserted at the end
+const memo = new Map<string, number[]>();
+
+function memoizedRank(terms: string[]): number[] {
+    const key = [...terms].sort().join(" ");
+    let ranked = memo.get(key);
+    if (ranked) {
+        memo.delete(key);
+    } else {
+        ranked = rank(terms);
+        if (memo.size >= MEMO_SIZE) memo.delete(memo.keys().next().value!);
+    }
+    memo.set(key, ranked);
+    return ranked;
+}
+
+/**
+ * One page of catalog images for a free-text query or a domain's
+ * imageKeywords, best match first. A query that matches no tag returns the
+ * fallback set, so onboarding always has something to suggest.
+ */
+export function searchImages(query: string | string[], options: ImageSearchOptions = {}): ImageSearchPage {
+    const { page = 0, pageSize = DEFAULT_PAGE_SIZE, vector } = options;
+    const terms = tokenize(query);
+    // Embedding queries are one-off; only term queries repeat
+    const ranked = vector ? rank(terms, vector) : memoizedRank(terms);
+
+    const start = page * pageSize;
+    return {
+        images: ranked.slice(start, start + pageSize).map((doc) => IMAGE_CATALOG[doc]),
+        total: ranked.length,
+        page,
+        hasMore: start + pageSize < ranked.length,
+    };
+}
@@ -0,0 +1,48 @@
+import { mkdir, readFile, rename, writeFile } from "fs/promises";
+import path from "path";
+import type { ImageVariant } from "@/lib/types";
+import type { ImageFormat } from "./variants";
+
+/**
+ * Content-addressed store of processed uploads:
+ * IMAGE_STORE_DIR/<sha256>/<width>.<format> plus a manifest.json, written
+ * last, so an image exists once its manifest does (default .uploads).
+ * Files never change under a hash, so they are served as immutable.
+ */
+
+export interface ImageManifest {
+    hash: string;
+    width: number;
+    height: number;
+    placeholder: string; // data: URL
+    variants: ImageVariant[]; // Smallest first
+}
+
+const storeDir = () => path.resolve(process.env.IMAGE_STORE_DIR || ".uploads");
+
+export const isContentHash = (value: string) => /^[0-9a-f]{64}$/.test(value);
+
+export function imageDir(hash: string) {
+    return path.join(storeDir(), hash);
+}
+
+export function variantFile(hash: string, width: number, format: ImageFormat) {
+    return path.join(imageDir(hash), `${width}.${format}`);
+}
+
+export async function readManifest(hash: string): Promise<ImageManifest | null> {
+    try {
+        return JSON.parse(await readFile(path.join(imageDir(hash), "manifest.json"), "utf8"));
+    } catch {
+        return null;
+    }
+}
+
+export async function writeManifest(manifest: ImageManifest) {
+    const dir = imageDir(manifest.hash);
+    await mkdir(dir, { recursive: true });
+    // Write-then-rename: a reader sees no manifest or a whole one
+    const temp = path.join(dir, `manifest.json.${process.pid}.tmp`);
+    await writeFile(temp, JSON.stringify(manifest));
+    await rename(temp, path.join(dir, "manifest.json"));
+}
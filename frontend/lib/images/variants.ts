@@ -0,0 +1,44 @@
+import type { ImageVariant } from "@/lib/types";
+
+/**
+ * Stored sizes of uploaded images. Client-safe: no Node imports.
+ *
+ * Widths follow the slots the board draws images into on its 1920x1080
+ * canvas: full width (one domain, or strips), half (2x2 domains), quarter
+ * (a 2x2 image grid inside a domain), plus a thumbnail for the uploader.
+ */
+
+export const IMAGE_VARIANT_WIDTHS = [240, 480, 960, 1920] as const;
+
+export const IMAGE_FORMATS = ["avif", "webp"] as const;
+export type ImageFormat = (typeof IMAGE_FORMATS)[number];
+
+export const IMAGE_MIME: Record<ImageFormat, string> = {
+    avif: "image/avif",
+    webp: "image/webp",
+};
+
+/** One size of an upload; the route picks AVIF or WebP from the Accept header. */
+export function imageVariantUrl(hash: string, width: number) {
+    return `/api/images/${hash}/${width}`;
+}
+
+/**
+ * Smallest variant that still covers a `width` x `height` slot (the board
+ * draws images with cover scaling), or the largest when none does.
+ */
+export function pickVariant(variants: ImageVariant[], width: number, height: number): ImageVariant | null {
+    let best: ImageVariant | null = null;
+    for (const variant of variants) {
+        const covers = variant.width >= width && variant.height >= height;
+        const bestCovers = best !== null && best.width >= width && best.height >= height;
+        if (
+            best === null ||
+            (covers && (!bestCovers || variant.width < best.width)) ||
+            (!covers && !bestCovers && variant.width > best.width)
+        ) {
+            best = variant;
+        }
+    }
+    return best;
+}
@@ -0,0 +1,71 @@
+import { GRID_CELLS } from "./grid";
+
+/**
+ * Board pixel state: one bit per grid cell, row-major.
+ *
+ * Bit numbering matches Postgres `get_bit`/`set_bit` on bytea: cell `i`
+ * lives in byte `i >> 3`, bit `i & 7` counted from the least significant
+ * bit, so the column can be inspected or patched in SQL directly.
+ */
+export type PixelBitmap = Uint8Array;
+
+export const BITMAP_BYTES = Math.ceil(GRID_CELLS / 8); // 2592
+
+// Set bits per byte value
+const POPCOUNT = new Uint8Array(256);
+for (let i = 1; i < 256; i++) POPCOUNT[i] = (i & 1) + POPCOUNT[i >> 1];
+
+export function createBitmap(): PixelBitmap {
+  return new Uint8Array(BITMAP_BYTES);
+}
+
+/** Copy a stored value into a bitmap of the current grid size (missing or short -> padded with 0). */
+export function toBitmap(data: Uint8Array | null | undefined): PixelBitmap {
+  const bitmap = createBitmap();
+  if (data) bitmap.set(data.subarray(0, BITMAP_BYTES));
+  return bitmap;
+}
+
+export function getBit(bitmap: PixelBitmap, index: number): boolean {
+  return (bitmap[index >> 3] & (1 << (index & 7))) !== 0;
+}
+
+export function setBit(bitmap: PixelBitmap, index: number) {
+  bitmap[index >> 3] |= 1 << (index & 7);
+}
+
+export function countBits(bitmap: PixelBitmap): number {
+  let count = 0;
+  for (let i = 0; i < bitmap.length; i++) count += POPCOUNT[bitmap[i]];
+  return count;
+}
+
+/** The lit cells of `bitmap`, in the order they appear in `order`. */
+export function litCellsInOrder(bitmap: PixelBitmap, order: Uint32Array): Uint32Array {
+  const cells = new Uint32Array(countBits(bitmap));
+  let n = 0;
+  for (let i = 0; i < order.length && n < cells.length; i++) {
+    if (getBit(bitmap, order[i])) cells[n++] = order[i];
+  }
+  return cells.subarray(0, n);
+}
+
+/**
+ * Light the next `count` unlit cells of `order` (see fillOrder.ts),
+ * mutating `bitmap`. Returns how many cells were lit (less once full).
+ */
+export function colorInOrder(bitmap: PixelBitmap, order: Uint32Array, count: number): number {
+  let colored = 0;
+  for (let i = 0; i < order.length && colored < count; i++) {
+    if (getBit(bitmap, order[i])) continue;
+    setBit(bitmap, order[i]);
+    colored++;
+  }
+  return colored;
+}
+
+/** Grid cells that should be lit for a board's pixel counters. */
+export function cellsForProgress(coloredPixels: number, totalPixels: number): number {
+  if (totalPixels <= 0) return 0;
+  return Math.floor((GRID_CELLS * Math.min(coloredPixels, totalPixels)) / totalPixels);
+}
@@ -0,0 +1,398 @@
+import type { Domain, DomainImage, VisionBoard } from "@/lib/types";
+import { pickVariant } from "@/lib/images/variants";
+import { calculateLayout, CANVAS_HEIGHT, CANVAS_WIDTH, CELL_SIZE, GRID_COLS, GRID_ROWS, type LayoutItem } from "./grid";
+import { litCellsInOrder } from "./bitmap";
+import { boardFillOrder, fillDomains, seedFromId } from "./fillOrder";
+
+/**
+ * PixelatedBoard's compositing and reveal animation, independent of where it
+ * runs: inside pixelBoard.worker.ts on an OffscreenCanvas, or on the main
+ * thread when the browser cannot transfer a canvas. Only phase changes leave
+ * the engine, so the React component re-renders a handful of times per cycle
+ * instead of every frame. The compositing steps are also exported for still
+ * renders (renderBoardStill, used by the wallpaper exporter in lib/wallpaper).
+ */
+
+export type Ctx2D = CanvasRenderingContext2D | OffscreenCanvasRenderingContext2D;
+export type Surface = HTMLCanvasElement | OffscreenCanvas;
+export type BoardImage = ImageBitmap | HTMLImageElement;
+export type BoardPhase = "init" | "filling" | "holding" | "blinking" | "resetting";
+
+export interface BoardScene {
+  board: Pick<
+    VisionBoard,
+    "id" | "boardType" | "layoutMetadata" | "totalPixels" | "coloredPixels" | "fillSeed" | "fillDomainIds"
+  >;
+  domains: Array<Pick<Domain, "id" | "name" | "colorHex"> & { images: Array<Pick<DomainImage, "imageUrl" | "sortOrder" | "variants">> }>;
+  pixelSize: number;
+  pixelBitmap: Uint8Array | null;
+}
+
+export type BoardEvent = { type: "ready" } | { type: "phase"; phase: BoardPhase };
+
+export interface Layer {
+  surface: Surface;
+  ctx: Ctx2D;
+}
+
+export interface EngineHost {
+  createLayer(width: number, height: number): Layer;
+  loadImage(url: string): Promise<BoardImage | null>;
+  requestFrame(callback: (timestamp: number) => void): number;
+  cancelFrame(id: number): void;
+}
+
+const HOLD_DURATION = 3000; // ms
+const BLINK_DURATION = 400; // ms (Quick flash of future)
+
+export class BoardEngine {
+  private images = new Map<string, Promise<BoardImage | null>>();
+  private sceneVersion = 0;
+  private frameId: number | null = null;
+
+  // Layers: grayscale base (the "faded" reality), full color target (the
+  // "vision"), the progress mask and a scratch layer for masking color
+  private gray: Layer;
+  private color: Layer;
+  private mask: Layer;
+  private comp: Layer;
+
+  // Animation state
+  private cells: Uint32Array = new Uint32Array(0);
+  private targetCount = 0;
+  private phase: BoardPhase = "init";
+  private visible = 0;
+  private lastRendered = 0;
+  private holdStart = 0;
+  private blinkStart = 0;
+
+  constructor(
+    private readonly ctx: Ctx2D,
+    private readonly host: EngineHost,
+    private readonly emit: (event: BoardEvent) => void
+  ) {
+    this.gray = host.createLayer(CANVAS_WIDTH, CANVAS_HEIGHT);
+    this.color = host.createLayer(CANVAS_WIDTH, CANVAS_HEIGHT);
+    this.mask = host.createLayer(CANVAS_WIDTH, CANVAS_HEIGHT);
+    this.comp = host.createLayer(CANVAS_WIDTH, CANVAS_HEIGHT);
+    ctx.imageSmoothingEnabled = false;
+  }
+
+  async setScene(scene: BoardScene) {
+    const version = ++this.sceneVersion;
+    const loaded = await this.loadImages(scene);
+    if (version !== this.sceneVersion) return; // superseded while decoding
+
+    this.composeLayers(scene, loaded);
+    this.prepareReveal(scene);
+    this.emit({ type: "ready" });
+    if (this.frameId === null) this.frameId = this.host.requestFrame(this.frame);
+  }
+
+  dispose() {
+    this.sceneVersion++;
+    if (this.frameId !== null) this.host.cancelFrame(this.frameId);
+    this.frameId = null;
+  }
+
+  // Decoded once per URL for the engine's lifetime, so progress updates
+  // only recompose and never refetch.
+  private async loadImages(scene: BoardScene) {
+    const sources = imageSources(scene);
+    for (const source of sources.values()) {
+      if (!this.images.has(source)) this.images.set(source, this.host.loadImage(source));
+    }
+    const entries = await Promise.all(
+      [...sources].map(async ([url, source]) => [url, await this.images.get(source)!] as const)
+    );
+    return new Map(entries);
+  }
+
+  private composeLayers(scene: BoardScene, loaded: Map<string, BoardImage | null>) {
+    composeBoardLayers(this.gray.ctx, this.color.ctx, scene, loaded);
+  }
+
+  private prepareReveal(scene: BoardScene) {
+    const { cells, targetCount } = revealPlan(scene);
+    this.cells = cells;
+    this.targetCount = targetCount;
+    this.restart();
+  }
+
+  private restart() {
+    this.setPhase("filling");
+    this.visible = 0;
+    this.lastRendered = 0;
+    this.mask.ctx.clearRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+  }
+
+  private setPhase(phase: BoardPhase) {
+    if (phase === this.phase) return;
+    this.phase = phase;
+    this.emit({ type: "phase", phase });
+  }
+
+  private frame = (timestamp: number) => {
+    // A. State updates
+    if (this.phase === "filling") {
+      this.visible += Math.ceil((GRID_COLS * GRID_ROWS) / 120); // Finish in ~2 seconds (at 60fps)
+      if (this.visible >= this.targetCount) {
+        this.visible = this.targetCount;
+        this.setPhase("holding");
+        this.holdStart = timestamp;
+      }
+    } else if (this.phase === "holding") {
+      if (timestamp - this.holdStart > HOLD_DURATION) {
+        this.setPhase("blinking");
+        this.blinkStart = timestamp;
+      }
+    } else if (this.phase === "blinking") {
+      if (timestamp - this.blinkStart > BLINK_DURATION) this.setPhase("resetting");
+    } else if (this.phase === "resetting") {
+      this.restart();
+    }
+
+    // B. Extend the persistent mask with the cells revealed since last frame
+    if (this.visible > this.lastRendered) {
+      paintCells(this.mask.ctx, this.cells, this.lastRendered, this.visible);
+      this.lastRendered = this.visible;
+    }
+
+    // C. Composition: gray base, then color where the mask is
+    const ctx = this.ctx;
+    ctx.drawImage(this.gray.surface, 0, 0);
+    if (this.phase === "blinking") {
+      // Future Glimpse Mode!
+      ctx.save();
+      ctx.globalAlpha = 0.9 + Math.random() * 0.1; // Slight flicker
+      ctx.drawImage(this.color.surface, 0, 0);
+      if (timestamp - this.blinkStart < 50) {
+        ctx.fillStyle = "white";
+        ctx.globalAlpha = 0.3;
+        ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+      }
+      ctx.restore();
+    } else {
+      compositeRevealed(ctx, this.color, this.mask, this.comp);
+    }
+
+    this.frameId = this.host.requestFrame(this.frame);
+  };
+}
+
+/**
+ * Grayscale base (the "faded" reality) and full color target (the
+ * "vision") of a scene, from already decoded images.
+ */
+export function composeBoardLayers(
+  grayCtx: Ctx2D,
+  colorCtx: Ctx2D,
+  { board, domains, pixelSize }: BoardScene,
+  loaded: Map<string, BoardImage | null>
+) {
+  grayCtx.clearRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+  colorCtx.clearRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+
+  const layout = calculateLayout(board.boardType, domains, CANVAS_WIDTH, CANVAS_HEIGHT);
+  layout.forEach((item) => {
+    const domain = domains.find((d) => d.id === item.domainId);
+    if (!domain) return;
+
+    if (board.boardType === "weekly" || domain.images.length === 1) {
+      const img = domain.images[0] && loaded.get(domain.images[0].imageUrl);
+      if (img) {
+        drawImageToContext(colorCtx, img, item.x, item.y, item.width, item.height);
+        drawImageToContext(grayCtx, img, item.x, item.y, item.width, item.height, true); // grayscale
+      } else {
+        // Fallback placeholder
+        drawPlaceholder(colorCtx, item, domain.colorHex, false);
+        drawPlaceholder(grayCtx, item, domain.colorHex, true);
+      }
+    } else {
+      // Multi-image layout
+      const imageCount = Math.min(domain.images.length, 4);
+      const subCols = Math.max(1, Math.ceil(Math.sqrt(imageCount)));
+      const subRows = Math.ceil(imageCount / subCols);
+      const subWidth = item.width / subCols;
+      const subHeight = item.height / subRows;
+
+      domain.images.slice(0, imageCount).forEach((imgObj, imgIdx) => {
+        const subX = item.x + (imgIdx % subCols) * subWidth;
+        const subY = item.y + Math.floor(imgIdx / subCols) * subHeight;
+        const source = domain.images[imgObj.sortOrder - 1];
+        const img = source && loaded.get(source.imageUrl);
+        if (img) {
+          drawImageToContext(colorCtx, img, subX, subY, subWidth, subHeight);
+          drawImageToContext(grayCtx, img, subX, subY, subWidth, subHeight, true);
+        }
+      });
+    }
+  });
+
+  drawPixelatedGrid(grayCtx, CANVAS_WIDTH, CANVAS_HEIGHT, pixelSize, "rgba(255,255,255,0.05)");
+  drawPixelatedGrid(colorCtx, CANVAS_WIDTH, CANVAS_HEIGHT, pixelSize, "rgba(255,255,255,0.1)");
+}
+
+/**
+ * What to download for each board image (keyed by imageUrl, as
+ * composeBoardLayers looks them up): for uploads, the smallest variant that
+ * covers the slot the image is drawn into; otherwise the image URL itself.
+ */
+export function imageSources({ board, domains }: BoardScene): Map<string, string> {
+  const sources = new Map<string, string>();
+  const slots = new Map(
+    calculateLayout(board.boardType, domains, CANVAS_WIDTH, CANVAS_HEIGHT).map((item) => [item.domainId, item])
+  );
+  for (const domain of domains) {
+    const item = slots.get(domain.id);
+    // Same split as composeBoardLayers: one image per domain, or up to a 2x2 grid
+    const single = board.boardType === "weekly" || domain.images.length <= 1;
+    const count = single ? 1 : Math.min(domain.images.length, 4);
+    const subCols = Math.max(1, Math.ceil(Math.sqrt(count)));
+    const subRows = Math.ceil(count / subCols);
+    for (const image of domain.images) {
+      const variant =
+        item && image.variants?.length ? pickVariant(image.variants, item.width / subCols, item.height / subRows) : null;
+      sources.set(image.imageUrl, variant?.url ?? image.imageUrl);
+    }
+  }
+  return sources;
+}
+
+/**
+ * Cells reveal in the board's seeded fill order (fillOrder.ts), the same
+ * sequence the server lights. A stored bitmap says exactly which cells are
+ * lit; otherwise take the prefix of the order matching the completion rate.
+ */
+export function revealPlan({ board, domains, pixelBitmap }: BoardScene) {
+  const order = boardFillOrder(
+    board.fillSeed ?? seedFromId(board.id),
+    board.boardType,
+    board.layoutMetadata,
+    fillDomains(board.fillDomainIds, domains)
+  );
+  const completion = board.totalPixels > 0 ? board.coloredPixels / board.totalPixels : 0;
+  const cells = pixelBitmap ? litCellsInOrder(pixelBitmap, order) : order;
+  const targetCount = pixelBitmap ? cells.length : Math.floor(GRID_COLS * GRID_ROWS * completion);
+  return { cells, targetCount };
+}
+
+/** Add `cells[from..to)` to a progress mask. */
+export function paintCells(maskCtx: Ctx2D, cells: Uint32Array, from: number, to: number) {
+  maskCtx.fillStyle = "#000000"; // Color doesn't matter for masking, fully opaque
+  maskCtx.beginPath();
+  const end = Math.min(to, cells.length);
+  for (let i = from; i < end; i++) {
+    const idx = cells[i];
+    maskCtx.rect((idx % GRID_COLS) * CELL_SIZE, Math.floor(idx / GRID_COLS) * CELL_SIZE, CELL_SIZE, CELL_SIZE);
+  }
+  maskCtx.fill();
+}
+
+/** Draw the color layer onto `ctx` wherever the mask is set, using `comp` as scratch. */
+export function compositeRevealed(ctx: Ctx2D, color: Layer, mask: Layer, comp: Layer) {
+  const compCtx = comp.ctx;
+  compCtx.clearRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+  compCtx.drawImage(mask.surface, 0, 0);
+  compCtx.globalCompositeOperation = "source-in"; // ONLY keep color where mask exists
+  compCtx.drawImage(color.surface, 0, 0);
+  compCtx.globalCompositeOperation = "source-over";
+  ctx.drawImage(comp.surface, 0, 0);
+}
+
+/**
+ * The board as it stands, without animation: gray base with every lit cell
+ * in color, drawn onto `ctx` (CANVAS_WIDTH x CANVAS_HEIGHT). What the
+ * engine shows in its "holding" phase.
+ */
+export async function renderBoardStill(ctx: Ctx2D, host: Pick<EngineHost, "createLayer" | "loadImage">, scene: BoardScene) {
+  const loaded = new Map(
+    await Promise.all([...imageSources(scene)].map(async ([url, source]) => [url, await host.loadImage(source)] as const))
+  );
+
+  const gray = host.createLayer(CANVAS_WIDTH, CANVAS_HEIGHT);
+  const color = host.createLayer(CANVAS_WIDTH, CANVAS_HEIGHT);
+  const mask = host.createLayer(CANVAS_WIDTH, CANVAS_HEIGHT);
+  const comp = host.createLayer(CANVAS_WIDTH, CANVAS_HEIGHT);
+  composeBoardLayers(gray.ctx, color.ctx, scene, loaded);
+
+  const { cells, targetCount } = revealPlan(scene);
+  paintCells(mask.ctx, cells, 0, targetCount);
+
+  ctx.imageSmoothingEnabled = false;
+  ctx.drawImage(gray.surface, 0, 0);
+  compositeRevealed(ctx, color, mask, comp);
+}
+
+// Helpers
+export function drawImageToContext(
+  ctx: Ctx2D,
+  image: BoardImage,
+  x: number,
+  y: number,
+  width: number,
+  height: number,
+  grayscale: boolean = false
+) {
+  ctx.save();
+
+  // Aspect Ratio "Cover" Logic
+  const imgAspect = image.width / image.height;
+  const rectAspect = width / height;
+  let drawWidth = width;
+  let drawHeight = height;
+  let drawX = 0;
+  let drawY = 0;
+
+  if (imgAspect > rectAspect) {
+    drawHeight = height;
+    drawWidth = height * imgAspect;
+    drawX = (width - drawWidth) / 2;
+  } else {
+    drawWidth = width;
+    drawHeight = width / imgAspect;
+    drawY = (height - drawHeight) / 2;
+  }
+
+  // Clip to region
+  ctx.beginPath();
+  ctx.rect(x, y, width, height);
+  ctx.clip();
+
+  ctx.drawImage(image, x + drawX, y + drawY, drawWidth, drawHeight);
+
+  if (grayscale) {
+    // Desaturate with a composite fill instead of per-pixel work
+    ctx.globalCompositeOperation = "saturation";
+    ctx.fillStyle = "hsl(0,0%,50%)";
+    ctx.fillRect(x, y, width, height);
+    ctx.globalCompositeOperation = "source-over";
+
+    // Darken gray layer slightly for drama
+    ctx.fillStyle = "rgba(0,0,0,0.4)";
+    ctx.fillRect(x, y, width, height);
+  }
+
+  ctx.restore();
+}
+
+export function drawPlaceholder(ctx: Ctx2D, item: Omit<LayoutItem, "domainId">, color: string, grayscale: boolean) {
+  ctx.fillStyle = grayscale ? "#222" : color;
+  ctx.fillRect(item.x, item.y, item.width, item.height);
+
+  // Grid pattern
+  ctx.strokeStyle = "rgba(255,255,255,0.1)";
+  ctx.beginPath();
+  ctx.moveTo(item.x, item.y);
+  ctx.lineTo(item.x + item.width, item.y + item.height);
+  ctx.stroke();
+}
+
+export function drawPixelatedGrid(ctx: Ctx2D, w: number, h: number, size: number, color: string) {
+  ctx.strokeStyle = color;
+  ctx.lineWidth = 0.5;
+  ctx.beginPath();
+  for (let x = 0; x <= w; x += size * 2) { ctx.moveTo(x, 0); ctx.lineTo(x, h); } // Less dense grid
+  for (let y = 0; y <= h; y += size * 2) { ctx.moveTo(0, y); ctx.lineTo(w, y); }
+  ctx.stroke();
+}
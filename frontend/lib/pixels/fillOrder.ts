@@ -0,0 +1,170 @@
+import { LRUCache } from "@/lib/utils/lruCache";
+import type { Domain, VisionBoardLayout } from "@/lib/types";
+import { cellOwners, domainCellRegions, GRID_CELLS, type CellRegion } from "./grid";
+
+/**
+ * Deterministic pixel fill order.
+ *
+ * A board stores only a 32-bit `fillSeed`; the client, the server-side
+ * award engine and any renderer expand it into the same permutation of
+ * grid cells, so the reveal is identical everywhere and nothing but the
+ * seed is persisted or shipped.
+ */
+
+export interface WeightedRegion {
+  region: CellRegion;
+  // Relative reveal speed; 1 = in step with the rest of the board
+  weight?: number;
+}
+
+/** mulberry32: small, fast, good enough for shuffling. Returns floats in [0, 1). */
+export function seededRandom(seed: number) {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/** Stable seed for boards that have no stored one (mock data): FNV-1a of the id. */
+export function seedFromId(id: string): number {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < id.length; i++) {
+    hash ^= id.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+}
+
+function shuffle(cells: Uint32Array, random: () => number) {
+  for (let i = cells.length - 1; i > 0; i--) {
+    const j = Math.floor(random() * (i + 1));
+    const temp = cells[i];
+    cells[i] = cells[j];
+    cells[j] = temp;
+  }
+}
+
+/**
+ * Permutation of every grid cell for `seed`.
+ *
+ * Without regions this is a plain seeded shuffle. With regions, each region
+ * (plus the cells no region covers) is shuffled on its own and the lists are
+ * interleaved so every region's revealed fraction advances together, scaled
+ * by its weight; cells covered by several regions belong to the first.
+ */
+export function computeFillOrder(seed: number, regions: WeightedRegion[] = []): Uint32Array {
+  const random = seededRandom(seed);
+
+  if (regions.length === 0) {
+    const order = new Uint32Array(GRID_CELLS);
+    for (let i = 0; i < GRID_CELLS; i++) order[i] = i;
+    shuffle(order, random);
+    return order;
+  }
+
+  // Group cells by owning region; the last group holds uncovered cells
+  const owner = cellOwners(regions.map((r) => r.region));
+  const sizes = new Uint32Array(regions.length + 1);
+  for (let i = 0; i < GRID_CELLS; i++) sizes[owner[i]]++;
+  const groups = Array.from(sizes, (size) => new Uint32Array(size));
+  const fill = new Uint32Array(regions.length + 1);
+  for (let i = 0; i < GRID_CELLS; i++) groups[owner[i]][fill[owner[i]]++] = i;
+  groups.forEach((group) => shuffle(group, random));
+
+  const weights = [...regions.map((r) => Math.max(r.weight ?? 1, 1e-6)), 1];
+  const taken = new Uint32Array(groups.length);
+  const order = new Uint32Array(GRID_CELLS);
+  for (let n = 0; n < GRID_CELLS; n++) {
+    // Next cell comes from the group furthest behind its weighted share
+    let pick = -1;
+    let lowest = Infinity;
+    for (let g = 0; g < groups.length; g++) {
+      if (taken[g] === groups[g].length) continue;
+      const progress = taken[g] / (groups[g].length * weights[g]);
+      if (progress < lowest) {
+        lowest = progress;
+        pick = g;
+      }
+    }
+    order[n] = groups[pick][taken[pick]++];
+  }
+  return order;
+}
+
+// Orders are 80KB each; keep the few boards on screen
+const orders = new LRUCache<string, Uint32Array>(16, 30 * 60 * 1000);
+
+/** Memoized `computeFillOrder`. Callers must not mutate the result. */
+export function fillOrder(seed: number, regions: WeightedRegion[] = []): Uint32Array {
+  const key = `${seed >>> 0}|${regions
+    .map(({ region: r, weight }) => `${r.col},${r.row},${r.cols},${r.rows},${weight ?? 1}`)
+    .join(";")}`;
+  const cached = orders.get(key);
+  if (cached) return cached;
+  const order = computeFillOrder(seed, regions);
+  orders.set(key, order);
+  return order;
+}
+
+/**
+ * Domains a board's fill order is built from when it has no layoutMetadata:
+ * the ids frozen on the board (VisionBoard.fillDomainIds), so adding or
+ * removing a domain later cannot reorder cells it has already lit, or the
+ * caller's `domains` (in DOMAIN_ORDER) for boards without any (mock data).
+ */
+export function fillDomains(
+  fillDomainIds: string[] | null | undefined,
+  domains: Array<Pick<Domain, "id">>
+): Array<Pick<Domain, "id">> {
+  return fillDomainIds?.length ? fillDomainIds.map((id) => ({ id })) : domains;
+}
+
+/** Fill order of a board: its domain regions, weighted by layoutMetadata when set. */
+export function boardFillOrder(
+  seed: number,
+  boardType: string,
+  layoutMetadata: VisionBoardLayout | null | undefined,
+  domains: Array<Pick<Domain, "id">>
+): Uint32Array {
+  const weights = new Map<string, number | undefined>(
+    layoutMetadata?.domains?.map((d) => [d.domainId, d.weight]) ?? []
+  );
+  const regions = domainCellRegions(boardType, layoutMetadata, domains).map(({ domainId, region }) => ({
+    region,
+    weight: weights.get(domainId),
+  }));
+  return fillOrder(seed, regions);
+}
+
+/**
+ * Cells a board lit while going from `fromCells` to `toCells` lit cells,
+ * counted per domain. Lit cells are always a prefix of the fill order, so
+ * those are exactly `order[fromCells..toCells)`; cells outside every domain
+ * region are not counted.
+ */
+export function domainCellsInRange(
+  seed: number,
+  boardType: string,
+  layoutMetadata: VisionBoardLayout | null | undefined,
+  domains: Array<Pick<Domain, "id">>,
+  fromCells: number,
+  toCells: number
+): Map<string, number> {
+  const counts = new Map<string, number>();
+  if (toCells <= fromCells) return counts;
+
+  const regions = domainCellRegions(boardType, layoutMetadata, domains);
+  const owner = cellOwners(regions.map((r) => r.region));
+  const order = boardFillOrder(seed, boardType, layoutMetadata, domains);
+  for (let i = Math.max(0, fromCells); i < Math.min(toCells, order.length); i++) {
+    const r = owner[order[i]];
+    if (r === regions.length) continue;
+    const domainId = regions[r].domainId;
+    counts.set(domainId, (counts.get(domainId) ?? 0) + 1);
+  }
+  return counts;
+}
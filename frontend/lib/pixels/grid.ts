@@ -0,0 +1,114 @@
+import type { Domain, VisionBoardLayout } from "@/lib/types";
+
+// Board canvas and the pixel grid stored for it (10px cells on 1920x1080)
+export const CANVAS_WIDTH = 1920;
+export const CANVAS_HEIGHT = 1080;
+export const CELL_SIZE = 10;
+export const GRID_COLS = CANVAS_WIDTH / CELL_SIZE; // 192
+export const GRID_ROWS = CANVAS_HEIGHT / CELL_SIZE; // 108
+export const GRID_CELLS = GRID_COLS * GRID_ROWS;
+
+export interface LayoutItem {
+  domainId: string;
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+// Rectangle in grid cells, end-exclusive
+export interface CellRegion {
+  col: number;
+  row: number;
+  cols: number;
+  rows: number;
+}
+
+export function calculateLayout(type: string, domains: Array<Pick<Domain, "id">>, w: number, h: number) {
+  // Reuse existing layout logic simplified or just return array
+  const domainCount = domains.length;
+  const layout: LayoutItem[] = [];
+
+  if (type === "weekly" || true) { // Force clean layout for now
+    if (domainCount === 4) {
+      // 2x2 Grid is usually more aesthetic than strips for a "Picture" look
+      // User asked for "Vision Board" - usually a collage.
+      const halfW = w / 2;
+      const halfH = h / 2;
+      layout.push({ domainId: domains[0].id, x: 0, y: 0, width: halfW, height: halfH });
+      layout.push({ domainId: domains[1].id, x: halfW, y: 0, width: halfW, height: halfH });
+      layout.push({ domainId: domains[2].id, x: 0, y: halfH, width: halfW, height: halfH });
+      layout.push({ domainId: domains[3].id, x: halfW, y: halfH, width: halfW, height: halfH });
+    } else {
+      // Fallback Vertical Strips
+      const stripHeight = h / domains.length;
+      domains.forEach((d, i) => {
+        layout.push({ domainId: d.id, x: 0, y: i * stripHeight, width: w, height: stripHeight });
+      });
+    }
+  }
+  return layout;
+}
+
+/** Canvas-space rectangle -> the grid cells it covers, clamped to the grid. */
+export function toCellRegion(item: Pick<LayoutItem, "x" | "y" | "width" | "height">): CellRegion {
+  const col = Math.max(0, Math.floor(item.x / CELL_SIZE));
+  const row = Math.max(0, Math.floor(item.y / CELL_SIZE));
+  const endCol = Math.min(GRID_COLS, Math.ceil((item.x + item.width) / CELL_SIZE));
+  const endRow = Math.min(GRID_ROWS, Math.ceil((item.y + item.height) / CELL_SIZE));
+  return { col, row, cols: Math.max(0, endCol - col), rows: Math.max(0, endRow - row) };
+}
+
+/** layoutMetadata region (percent of the board) -> grid cells. */
+export function percentToCellRegion(region: VisionBoardLayout["domains"][number]["region"]): CellRegion {
+  return toCellRegion({
+    x: (region.x / 100) * CANVAS_WIDTH,
+    y: (region.y / 100) * CANVAS_HEIGHT,
+    width: (region.width / 100) * CANVAS_WIDTH,
+    height: (region.height / 100) * CANVAS_HEIGHT,
+  });
+}
+
+/**
+ * Order every board reader and writer loads a user's domains in (Prisma
+ * `orderBy`). Without layoutMetadata, regions are assigned in domain order,
+ * so the server lighting cells and the client revealing them must agree.
+ */
+export const DOMAIN_ORDER: Array<{ name?: "asc"; id?: "asc" }> = [{ name: "asc" }, { id: "asc" }];
+
+/**
+ * Cell regions per domain for a board: the stored layoutMetadata when the
+ * board has one, otherwise the same layout PixelatedBoard draws. `domains`
+ * must be in DOMAIN_ORDER.
+ */
+export function domainCellRegions(
+  boardType: string,
+  layoutMetadata: VisionBoardLayout | null | undefined,
+  domains: Array<Pick<Domain, "id">>
+): Array<{ domainId: string; region: CellRegion }> {
+  if (layoutMetadata?.domains?.length) {
+    return layoutMetadata.domains.map((d) => ({ domainId: d.domainId, region: percentToCellRegion(d.region) }));
+  }
+  if (domains.length === 0) return [];
+  return calculateLayout(boardType, domains, CANVAS_WIDTH, CANVAS_HEIGHT).map((item) => ({
+    domainId: item.domainId,
+    region: toCellRegion(item),
+  }));
+}
+
+/**
+ * Owning region index of every grid cell: the first region that covers it,
+ * or `regions.length` for cells no region covers.
+ */
+export function cellOwners(regions: CellRegion[]): Int32Array {
+  const owner = new Int32Array(GRID_CELLS).fill(regions.length);
+  regions.forEach((region, r) => {
+    for (let row = region.row; row < region.row + region.rows; row++) {
+      for (let col = region.col; col < region.col + region.cols; col++) {
+        const index = row * GRID_COLS + col;
+        if (owner[index] === regions.length) owner[index] = r;
+      }
+    }
+  });
+  return owner;
+}
@@ -0,0 +1,183 @@
+import { Prisma } from "@prisma/client";
+import { prisma } from "@/lib/prisma";
+import type { PixelSummary } from "@/lib/types";
+import { dayNumber, dayToDate, dayToISO, weekStartDay } from "@/lib/utils/streakCalculator";
+
+/**
+ * Pixel history.
+ *
+ * Every award appends PixelEvent rows (one per domain it lit) and, in the
+ * same transaction, adds the deltas into per-domain daily and weekly
+ * rollups. Summaries read only the rollups: a range costs at most one row
+ * per domain per day for short ranges, or per week plus two partial weeks
+ * of days for long ones, however much history the user has.
+ *
+ * Days are the user's calendar days (streakCalculator day numbers).
+ */
+
+export type PixelSource = "journal" | "task";
+
+export interface PixelAward {
+    source: PixelSource;
+    sourceId?: string;
+    day: number;
+}
+
+// Domain of pixels whose cells fall outside every domain region
+export const UNASSIGNED_DOMAIN = "";
+
+// Longer ranges are summarized per week rather than per day
+const DAILY_SERIES_MAX_DAYS = 92;
+
+/**
+ * Split an award over domains in proportion to the cells it lit in each
+ * (largest remainder, so the parts add up to `pixels`). Cells outside every
+ * region, or an award too small to light a cell, count as unassigned.
+ */
+export function splitByDomain(pixels: number, cellsByDomain: Map<string, number>, cells: number): Map<string, number> {
+    const split = new Map<string, number>();
+    if (cells <= 0) return split.set(UNASSIGNED_DOMAIN, pixels);
+
+    let assigned = 0;
+    for (const count of cellsByDomain.values()) assigned += count;
+    const shares = [...cellsByDomain, [UNASSIGNED_DOMAIN, cells - assigned] as const]
+        .filter(([, count]) => count > 0)
+        .map(([domainId, count]) => ({ domainId, exact: (pixels * count) / cells }));
+
+    let rest = pixels;
+    for (const share of shares) {
+        const whole = Math.floor(share.exact);
+        split.set(share.domainId, whole);
+        rest -= whole;
+    }
+    shares.sort((a, b) => (b.exact % 1) - (a.exact % 1));
+    for (let i = 0; i < rest; i++) {
+        const { domainId } = shares[i % shares.length];
+        split.set(domainId, split.get(domainId)! + 1);
+    }
+    return split;
+}
+
+/** Append an award to the ledger and its rollups. Call inside the awarding transaction. */
+export async function recordPixelAward(
+    tx: Prisma.TransactionClient,
+    userId: string,
+    boardId: string,
+    award: PixelAward,
+    byDomain: Map<string, number>
+) {
+    const rows = [...byDomain].filter(([, delta]) => delta !== 0);
+    if (rows.length === 0) return;
+
+    await tx.pixelEvent.createMany({
+        data: rows.map(([domainId, delta]) => ({
+            userId,
+            boardId,
+            domainId,
+            day: dayToDate(award.day),
+            delta,
+            source: award.source,
+            sourceId: award.sourceId,
+        })),
+    });
+
+    const day = dayToISO(award.day);
+    const week = dayToISO(weekStartDay(award.day));
+    await tx.$executeRaw`
+        INSERT INTO "PixelDailyRollup" ("userId", "day", "domainId", "pixels")
+        VALUES ${Prisma.join(rows.map(([domainId, delta]) => Prisma.sql`(${userId}, ${day}::date, ${domainId}, ${delta})`))}
+        ON CONFLICT ("userId", "day", "domainId") DO UPDATE SET "pixels" = "PixelDailyRollup"."pixels" + EXCLUDED."pixels"`;
+    await tx.$executeRaw`
+        INSERT INTO "PixelWeeklyRollup" ("userId", "weekStart", "domainId", "pixels")
+        VALUES ${Prisma.join(rows.map(([domainId, delta]) => Prisma.sql`(${userId}, ${week}::date, ${domainId}, ${delta})`))}
+        ON CONFLICT ("userId", "weekStart", "domainId") DO UPDATE SET "pixels" = "PixelWeeklyRollup"."pixels" + EXCLUDED."pixels"`;
+}
+
+type Buckets = Map<number, Map<string, number>>;
+
+function addTo(buckets: Buckets, key: number, domainId: string, pixels: number) {
+    let bucket = buckets.get(key);
+    if (!bucket) buckets.set(key, (bucket = new Map()));
+    bucket.set(domainId, (bucket.get(domainId) ?? 0) + pixels);
+}
+
+/**
+ * Pixels a user earned from `fromDay` (null: all history) through `toDay`,
+ * inclusive. `byDate` has one entry per day for ranges up to
+ * DAILY_SERIES_MAX_DAYS and one per week (dated its Monday) beyond that.
+ * Unassigned pixels count toward the totals but are not listed per domain.
+ */
+export async function pixelSummary(userId: string, fromDay: number | null, toDay: number): Promise<PixelSummary> {
+    const buckets: Buckets = new Map();
+    const domainsQuery = () => prisma.domain.findMany({ where: { userId }, select: { id: true, name: true, colorHex: true } });
+    let domains: Awaited<ReturnType<typeof domainsQuery>>;
+
+    if (fromDay !== null && toDay - fromDay < DAILY_SERIES_MAX_DAYS) {
+        const [days, userDomains] = await Promise.all([
+            prisma.pixelDailyRollup.findMany({
+                where: { userId, day: { gte: dayToDate(fromDay), lte: dayToDate(toDay) } },
+                select: { day: true, domainId: true, pixels: true },
+            }),
+            domainsQuery(),
+        ]);
+        domains = userDomains;
+        for (const row of days) addTo(buckets, dayNumber(row.day, "UTC"), row.domainId, row.pixels);
+    } else {
+        // Whole weeks from the weekly rollup, the partial weeks at either end from days
+        const firstWeek = fromDay === null ? null : weekStartDay(fromDay + 6);
+        const endWeek = weekStartDay(toDay + 1);
+        const edges: Prisma.PixelDailyRollupWhereInput[] = [{ day: { gte: dayToDate(endWeek), lte: dayToDate(toDay) } }];
+        if (fromDay !== null && firstWeek! > fromDay) edges.push({ day: { gte: dayToDate(fromDay), lt: dayToDate(firstWeek!) } });
+
+        const [weeks, days, userDomains] = await Promise.all([
+            prisma.pixelWeeklyRollup.findMany({
+                where: { userId, weekStart: { ...(firstWeek !== null && { gte: dayToDate(firstWeek) }), lt: dayToDate(endWeek) } },
+                select: { weekStart: true, domainId: true, pixels: true },
+            }),
+            prisma.pixelDailyRollup.findMany({
+                where: { userId, OR: edges },
+                select: { day: true, domainId: true, pixels: true },
+            }),
+            domainsQuery(),
+        ]);
+        domains = userDomains;
+        for (const row of weeks) addTo(buckets, dayNumber(row.weekStart, "UTC"), row.domainId, row.pixels);
+        for (const row of days) addTo(buckets, weekStartDay(dayNumber(row.day, "UTC")), row.domainId, row.pixels);
+    }
+
+    let totalPixels = 0;
+    const pixelsByDomain = new Map<string, number>();
+    const byDate: PixelSummary["byDate"] = [...buckets.keys()]
+        .sort((a, b) => a - b)
+        .map((key) => {
+            const bucket = buckets.get(key)!;
+            let dayTotal = 0;
+            for (const [domainId, pixels] of bucket) {
+                dayTotal += pixels;
+                pixelsByDomain.set(domainId, (pixelsByDomain.get(domainId) ?? 0) + pixels);
+            }
+            totalPixels += dayTotal;
+            return {
+                date: dayToISO(key),
+                totalPixels: dayTotal,
+                byDomain: [...bucket]
+                    .filter(([domainId]) => domainId !== UNASSIGNED_DOMAIN)
+                    .map(([domainId, pixels]) => ({ domainId, pixels })),
+            };
+        });
+
+    return {
+        totalPixels,
+        byDomain: domains.map((d) => {
+            const pixels = pixelsByDomain.get(d.id) ?? 0;
+            return {
+                domainId: d.id,
+                domainName: d.name,
+                colorHex: d.colorHex,
+                totalPixels: pixels,
+                percentage: totalPixels ? pixels / totalPixels : 0,
+            };
+        }),
+        byDate,
+    };
+}
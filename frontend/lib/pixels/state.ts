@@ -0,0 +1,108 @@
+import { prisma } from "@/lib/prisma";
+import type { VisionBoardLayout } from "@/lib/types";
+import { cellsForProgress, colorInOrder, toBitmap } from "./bitmap";
+import { boardFillOrder, domainCellsInRange, fillDomains } from "./fillOrder";
+import { DOMAIN_ORDER } from "./grid";
+import { recordPixelAward, splitByDomain, type PixelAward } from "./ledger";
+import { invalidateWallpapers } from "@/lib/wallpaper/cache";
+
+// Pixels awarded for the first journal of a day (submitJournal)
+export const JOURNAL_PIXELS = 50;
+
+interface LockedBoard {
+    userId: string;
+    type: string;
+    layoutMetadata: VisionBoardLayout | null;
+    fillSeed: number;
+    fillDomainIds: string[];
+    pixelBits: Buffer | null;
+    totalPixels: number;
+    coloredPixels: number;
+}
+
+/**
+ * Award `pixels` to a board: bump coloredPixels and light the matching
+ * number of grid cells in its bitmap, following the board's fill order.
+ *
+ * Awards are board-wide, not aimed at one domain's region: the fill order
+ * already interleaves every region at its weighted pace, and the cells an
+ * award lights decide which domains it credits. Lighting cells inside a
+ * chosen region instead would break the invariant the rest of the pixel
+ * code relies on, that lit cells are a prefix of the fill order (bitmap
+ * backfill, readers of boards with no stored bits, the ledger's per-domain
+ * split in domainCellsInRange).
+ *
+ * The row is locked for the read-modify-write so concurrent awards cannot
+ * overwrite each other's bits; the bitmap is ~2.6KB, so the update is one
+ * small bytea write instead of re-serializing a JSON grid.
+ *
+ * The award is appended to the pixel ledger in the same transaction, split
+ * per domain by the cells it lit (see ledger.ts).
+ *
+ * Boards from before the bitmap column have no stored bits; their lit
+ * cells are the first `fromCells` of the fill order, so those are lit
+ * first and the stored bitmap starts out matching coloredPixels.
+ *
+ * The order comes from the board's frozen fillDomainIds, never the user's
+ * current domain list, so the stored bits stay a prefix of it.
+ */
+export async function awardPixels(boardId: string, pixels: number, award: PixelAward) {
+    const result = await prisma.$transaction(async (tx) => {
+        const [board] = await tx.$queryRaw<LockedBoard[]>`
+            SELECT "userId", "type", "layoutMetadata", "fillSeed", "fillDomainIds", "pixelBits", "totalPixels", "coloredPixels"
+            FROM "VisionBoard" WHERE "id" = ${boardId} FOR UPDATE`;
+        if (!board) return null;
+
+        const coloredPixels = board.coloredPixels + pixels;
+        const bitmap = toBitmap(board.pixelBits);
+        const fromCells = cellsForProgress(board.coloredPixels, board.totalPixels);
+        const toCells = cellsForProgress(coloredPixels, board.totalPixels);
+        const newCells = toCells - fromCells;
+
+        const backfill = board.pixelBits === null ? fromCells : 0;
+
+        let cellsByDomain = new Map<string, number>();
+        let fillDomainIds = board.fillDomainIds ?? [];
+        if (newCells > 0 || backfill > 0) {
+            // A board created without domains fixes its fill order at the first cells it lights
+            if (!board.layoutMetadata?.domains?.length && fillDomainIds.length === 0) {
+                const current = await tx.domain.findMany({
+                    where: { userId: board.userId },
+                    select: { id: true },
+                    orderBy: DOMAIN_ORDER,
+                });
+                fillDomainIds = current.map((d) => d.id);
+            }
+            const domains = fillDomains(fillDomainIds, []);
+            const boardType = board.type.toLowerCase();
+            // Same order the client reveals in, so lit cells are always a prefix of it
+            const order = boardFillOrder(board.fillSeed, boardType, board.layoutMetadata, domains);
+            colorInOrder(bitmap, order, backfill + Math.max(0, newCells));
+            cellsByDomain = domainCellsInRange(board.fillSeed, boardType, board.layoutMetadata, domains, fromCells, toCells);
+        }
+        await recordPixelAward(tx, board.userId, boardId, award, splitByDomain(pixels, cellsByDomain, newCells));
+
+        return tx.visionBoard.update({
+            where: { id: boardId },
+            data: { coloredPixels, pixelBits: Buffer.from(bitmap), fillDomainIds },
+            select: { id: true, coloredPixels: true, totalPixels: true },
+        });
+    });
+    // Exported wallpapers show the old pixels now
+    if (result) await invalidateWallpapers(boardId).catch(() => undefined);
+    return result;
+}
+
+/**
+ * Raw bitmap of a board owned by `userId`, or null when not found. A board
+ * with no stored bits yet gets a null bitmap: readers then reveal the
+ * fill-order prefix for its coloredPixels, which is what awardPixels stores.
+ */
+export async function getPixelBitmap(userId: string, boardId: string) {
+    const board = await prisma.visionBoard.findFirst({
+        where: { id: boardId, userId },
+        select: { pixelBits: true, coloredPixels: true },
+    });
+    if (!board) return null;
+    return { bitmap: board.pixelBits ? toBitmap(board.pixelBits) : null, coloredPixels: board.coloredPixels };
+}
@@ -0,0 +1,25 @@
+import type { QueryClient } from "@tanstack/react-query";
+import type { DashboardSnapshot } from "@/app/actions";
+import { DASHBOARD_TIMELINE_WEEKS } from "@/lib/api/dashboard";
+import { queryKeys } from "./queryClient";
+
+/**
+ * Seed the per-resource query caches from one dashboard snapshot, so the
+ * widgets' own queries resolve from cache instead of each issuing a server
+ * action. Empty resources are left unseeded so the API layer's mock
+ * fallbacks still apply.
+ */
+export function seedDashboardQueries(queryClient: QueryClient, snapshot: DashboardSnapshot) {
+  if (snapshot.board) {
+    queryClient.setQueryData([...queryKeys.boards.current, "weekly"], snapshot.board);
+  }
+  if (snapshot.domains.length > 0) {
+    queryClient.setQueryData(queryKeys.domains.all, snapshot.domains);
+  }
+  if (snapshot.goals.length > 0) {
+    queryClient.setQueryData(queryKeys.goals.all, snapshot.goals);
+  }
+  queryClient.setQueryData(queryKeys.journals.all, snapshot.journals);
+  queryClient.setQueryData(queryKeys.journals.streak, snapshot.streak);
+  queryClient.setQueryData(queryKeys.timeline.weeks(DASHBOARD_TIMELINE_WEEKS), snapshot.timeline);
+}
@@ -13,6 +13,9 @@ export const queryKeys = {
   auth: {
     me: ["auth", "me"] as const,
   },
+  dashboard: {
+    snapshot: ["dashboard", "snapshot"] as const,
+  },
   domains: {
     all: ["domains"] as const,
     detail: (id: string) => ["domains", id] as const,
@@ -29,18 +32,25 @@ export const queryKeys = {
   },
   journals: {
     all: ["journals"] as const,
+    streak: ["journals", "streak"] as const,
     byDate: (date: string) => ["journals", "date", date] as const,
     range: (start: string, end: string) => ["journals", "range", start, end] as const,
+    analysis: (id: string) => ["journals", "analysis", id] as const,
   },
   boards: {
     current: ["boards", "current"] as const,
     weekly: (offset: number = 0) => ["boards", "weekly", offset] as const,
     monthly: (offset: number = 0) => ["boards", "monthly", offset] as const,
     annual: ["boards", "annual"] as const,
+    // Keyed by coloredPixels: the bitmap only changes when the count does
+    pixels: (id: string, coloredPixels: number) => ["boards", "pixels", id, coloredPixels] as const,
   },
   timeline: {
     weeks: (count: number) => ["timeline", "weeks", count] as const,
   },
+  reminders: {
+    settings: ["reminders", "settings"] as const,
+  },
   pixels: {
     summary: (start?: string, end?: string) =>
       start && end
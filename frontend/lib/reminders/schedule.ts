@@ -0,0 +1,166 @@
+import { prisma } from "@/lib/prisma";
+import { getNotificationSink, type ReminderNotification } from "./sink";
+import { isValidReminderTime, isValidTimeZone, nextFireAt, REMINDER_KINDS, type ReminderKind } from "./time";
+
+/**
+ * Reminder scheduling.
+ *
+ * Each (user, kind) has one ReminderSchedule row holding the next UTC minute
+ * it fires. The per-minute tick reads only rows due by that minute through
+ * the nextFireAt index, and a settings change rewrites just that user's
+ * rows; nothing ever scans all users.
+ *
+ * A tick leases due rows (claimedAt), sends them, and only then moves each
+ * one to its next occurrence. A send that fails leaves the lease to lapse,
+ * so a retry or a later tick sends those reminders again instead of
+ * losing them: delivery is at least once.
+ */
+
+export interface ReminderSettings {
+    timezone: string;
+    bedtimeReminder: string;
+    morningReminder: string;
+    emailNotify: boolean;
+    pushNotify: boolean;
+}
+
+const BATCH_SIZE = 500;
+// A reminder due longer ago than this (tick outage) is rescheduled, not sent
+const MAX_LATENESS_MS = 15 * 60 * 1000;
+// A claimed row whose send has not finished after this is claimable again
+const CLAIM_LEASE_MS = 2 * 60 * 1000;
+
+function reminderTime(settings: ReminderSettings, kind: ReminderKind) {
+    return kind === "bedtime" ? settings.bedtimeReminder : settings.morningReminder;
+}
+
+function channels(settings: ReminderSettings): ReminderNotification["channels"] {
+    return [...(settings.emailNotify ? ["email" as const] : []), ...(settings.pushNotify ? ["push" as const] : [])];
+}
+
+/** Next fire instant of `kind`, or null when the user gets no such reminder. */
+function nextFire(settings: ReminderSettings, kind: ReminderKind, after: Date) {
+    const time = reminderTime(settings, kind);
+    if (channels(settings).length === 0 || !isValidReminderTime(time) || !isValidTimeZone(settings.timezone)) {
+        return null;
+    }
+    return nextFireAt(time, settings.timezone, after);
+}
+
+/** Rewrite a user's schedule rows after their reminder settings changed. */
+export async function rescheduleReminders(
+    userId: string,
+    settings: ReminderSettings,
+    now: Date = new Date()
+): Promise<Partial<Record<ReminderKind, Date>>> {
+    const next: Partial<Record<ReminderKind, Date>> = {};
+    await prisma.$transaction(
+        REMINDER_KINDS.map((kind) => {
+            const at = nextFire(settings, kind, now);
+            if (!at) return prisma.reminderSchedule.deleteMany({ where: { userId, kind } });
+            next[kind] = at;
+            return prisma.reminderSchedule.upsert({
+                where: { userId_kind: { userId, kind } },
+                create: { userId, kind, nextFireAt: at },
+                update: { nextFireAt: at, claimedAt: null },
+            });
+        })
+    );
+    return next;
+}
+
+/**
+ * Send one batch of reminders due at or before `minute`.
+ *
+ * Rows are claimed with a compare-and-set on the nextFireAt and claimedAt
+ * values read, so overlapping ticks never send the same reminder
+ * together. Rows that need no send (no next occurrence, or too late) are
+ * advanced right away; the others are advanced once the sink accepted the
+ * batch. `more` is set while due rows may remain.
+ */
+export async function sendReminderBatch(minute: Date, batchSize: number = BATCH_SIZE) {
+    const claimedAt = new Date();
+    const leaseExpired = new Date(claimedAt.getTime() - CLAIM_LEASE_MS);
+    const due = await prisma.reminderSchedule.findMany({
+        where: {
+            nextFireAt: { lte: minute },
+            OR: [{ claimedAt: null }, { claimedAt: { lt: leaseExpired } }],
+        },
+        orderBy: { nextFireAt: "asc" },
+        take: batchSize,
+        select: {
+            userId: true,
+            kind: true,
+            nextFireAt: true,
+            claimedAt: true,
+            user: {
+                select: {
+                    email: true,
+                    timezone: true,
+                    bedtimeReminder: true,
+                    morningReminder: true,
+                    emailNotify: true,
+                    pushNotify: true,
+                },
+            },
+        },
+    });
+    if (due.length === 0) return { sent: 0, skipped: 0, more: false };
+
+    const claims = due.map((row) => {
+        const kind = row.kind as ReminderKind;
+        const next = nextFire(row.user, kind, minute);
+        const send = next !== null && minute.getTime() - row.nextFireAt.getTime() <= MAX_LATENESS_MS;
+        return { row, kind, next, send };
+    });
+    type Claim = (typeof claims)[number];
+    // The row as read (or as this tick leased it), so a changed row is left alone
+    const unchanged = ({ row }: Claim, claim: Date | null) => ({
+        userId: row.userId,
+        kind: row.kind,
+        nextFireAt: row.nextFireAt,
+        claimedAt: claim,
+    });
+    const advance = (claim: Claim, held: Date | null) =>
+        claim.next
+            ? prisma.reminderSchedule.updateMany({ where: unchanged(claim, held), data: { nextFireAt: claim.next, claimedAt: null } })
+            : prisma.reminderSchedule.deleteMany({ where: unchanged(claim, held) });
+
+    const results = await prisma.$transaction(
+        claims.map((claim) =>
+            claim.send
+                ? prisma.reminderSchedule.updateMany({ where: unchanged(claim, claim.row.claimedAt), data: { claimedAt } })
+                : advance(claim, claim.row.claimedAt)
+        )
+    );
+
+    const held = claims.filter((_, i) => results[i].count > 0); // the rest went to another tick
+    const toSend = held.filter((claim) => claim.send);
+    await getNotificationSink().send(
+        toSend.map(({ row, kind }) => ({
+            userId: row.userId,
+            email: row.user.email,
+            kind,
+            fireAt: row.nextFireAt.toISOString(),
+            localTime: reminderTime(row.user, kind),
+            timeZone: row.user.timezone,
+            channels: channels(row.user),
+        }))
+    );
+    // Delivered: move each row on. A settings change meanwhile already rewrote (and released) its row.
+    if (toSend.length > 0) await prisma.$transaction(toSend.map((claim) => advance(claim, claimedAt)));
+
+    return { sent: toSend.length, skipped: held.length - toSend.length, more: due.length === batchSize };
+}
+
+/** Drain every reminder due by `minute` (the Inngest tick does this one step per batch). */
+export async function sendDueReminders(minute: Date) {
+    let sent = 0;
+    let skipped = 0;
+    for (;;) {
+        const result = await sendReminderBatch(minute);
+        sent += result.sent;
+        skipped += result.skipped;
+        if (!result.more) return { sent, skipped };
+    }
+}
@@ -0,0 +1,65 @@
+import { appendFile, readFile } from "fs/promises";
+import path from "path";
+import type { ReminderKind } from "./time";
+
+export interface ReminderNotification {
+    userId: string;
+    email: string;
+    kind: ReminderKind;
+    fireAt: string; // ISO, the UTC minute the reminder was due
+    localTime: string; // "HH:MM" in `timeZone`
+    timeZone: string;
+    channels: Array<"email" | "push">;
+}
+
+/** Delivery backend. Receives a whole batch so providers can use bulk APIs. */
+export interface NotificationSink {
+    send(batch: ReminderNotification[]): Promise<void>;
+}
+
+/** Logs only; the default until an email/push provider is wired in. */
+export class ConsoleNotificationSink implements NotificationSink {
+    async send(batch: ReminderNotification[]) {
+        for (const n of batch) {
+            console.log(`REMINDER: ${n.kind} for ${n.userId} at ${n.localTime} ${n.timeZone} via ${n.channels.join("+")}`);
+        }
+    }
+}
+
+/**
+ * Local fake: appends one JSON line per notification to a file, so tests
+ * (TC012) and developers can inspect exactly what would have been sent.
+ */
+export class FileNotificationSink implements NotificationSink {
+    constructor(readonly file: string) {}
+
+    async send(batch: ReminderNotification[]) {
+        if (batch.length === 0) return;
+        await appendFile(this.file, batch.map((n) => JSON.stringify(n) + "\n").join(""));
+    }
+
+    async read(): Promise<ReminderNotification[]> {
+        const text = await readFile(this.file, "utf8").catch(() => "");
+        return text
+            .split("\n")
+            .filter(Boolean)
+            .map((line) => JSON.parse(line) as ReminderNotification);
+    }
+}
+
+let sink: NotificationSink | null = null;
+
+/** NOTIFICATION_SINK=file writes to NOTIFICATION_SINK_FILE (default .notifications.jsonl). */
+export function getNotificationSink(): NotificationSink {
+    if (!sink) {
+        sink =
+            process.env.NOTIFICATION_SINK === "file"
+                ? new FileNotificationSink(path.resolve(process.env.NOTIFICATION_SINK_FILE || ".notifications.jsonl"))
+                : new ConsoleNotificationSink();
+    }
+    return sink;
+}
+
+export function setNotificationSink(next: NotificationSink) {
+    sink = next;
+}
@@ -0,0 +1,88 @@
+/**
+ * Wall-clock reminder times ("HH:MM" in the user's IANA zone) to UTC
+ * instants. Reminders fire on whole minutes, so every instant here is
+ * truncated to the minute.
+ */
+
+export type ReminderKind = "bedtime" | "morning";
+
+export const REMINDER_KINDS: ReminderKind[] = ["bedtime", "morning"];
+
+const MS_PER_MINUTE = 60_000;
+const MS_PER_DAY = 86_400_000;
+
+const TIME_PATTERN = /^([01]\d|2[0-3]):([0-5]\d)$/;
+
+export function isValidReminderTime(time: string) {
+    return TIME_PATTERN.test(time);
+}
+
+export function isValidTimeZone(timeZone: string) {
+    try {
+        new Intl.DateTimeFormat("en-US", { timeZone });
+        return true;
+    } catch {
+        return false;
+    }
+}
+
+export function floorToMinute(instant: Date) {
+    return new Date(Math.floor(instant.getTime() / MS_PER_MINUTE) * MS_PER_MINUTE);
+}
+
+const partFormatters = new Map<string, Intl.DateTimeFormat>();
+
+function partFormatter(timeZone: string) {
+    let formatter = partFormatters.get(timeZone);
+    if (!formatter) {
+        formatter = new Intl.DateTimeFormat("en-US", {
+            timeZone,
+            hourCycle: "h23",
+            year: "numeric",
+            month: "numeric",
+            day: "numeric",
+            hour: "numeric",
+            minute: "numeric",
+        });
+        partFormatters.set(timeZone, formatter);
+    }
+    return formatter;
+}
+
+// Wall clock of `instant` in `timeZone`, as if that wall clock were UTC
+function wallClockMs(instant: number, timeZone: string) {
+    const p: Record<string, number> = {};
+    for (const part of partFormatter(timeZone).formatToParts(instant)) {
+        if (part.type !== "literal") p[part.type] = Number(part.value);
+    }
+    return Date.UTC(p.year, p.month - 1, p.day, p.hour, p.minute);
+}
+
+/**
+ * UTC instant of a wall-clock time in `timeZone`. Two passes settle the
+ * offset across DST changes; a time skipped by spring-forward lands just
+ * after the gap, a repeated one fires once, on one of its occurrences.
+ */
+function zonedToUtc(wallMs: number, timeZone: string) {
+    const first = wallMs - (wallClockMs(wallMs, timeZone) - wallMs);
+    const second = wallMs - (wallClockMs(first, timeZone) - first);
+    if (wallClockMs(second, timeZone) === wallMs) return second;
+    // In the gap neither offset round-trips; the later one is past the gap
+    return Math.max(first, second);
+}
+
+/** First instant strictly after `after` at which it is `time` in `timeZone`. */
+export function nextFireAt(time: string, timeZone: string, after: Date): Date {
+    const match = TIME_PATTERN.exec(time);
+    if (!match) throw new RangeError(`Invalid reminder time "${time}"`);
+    const minutes = Number(match[1]) * 60 + Number(match[2]);
+
+    const afterMs = floorToMinute(after).getTime();
+    const localDay = Math.floor(wallClockMs(afterMs, timeZone) / MS_PER_DAY) * MS_PER_DAY;
+    // Today's occurrence, or tomorrow's once it has passed
+    for (let day = 0; day < 3; day++) {
+        const fire = zonedToUtc(localDay + day * MS_PER_DAY + minutes * MS_PER_MINUTE, timeZone);
+        if (fire > afterMs) return new Date(fire);
+    }
+    throw new Error(`No reminder occurrence for ${time} in ${timeZone}`);
+}
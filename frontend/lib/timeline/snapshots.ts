@@ -0,0 +1,92 @@
+import { Prisma } from "@prisma/client";
+import { prisma } from "@/lib/prisma";
+import { dayNumber, dayToDate, weekStartDay } from "@/lib/utils/streakCalculator";
+
+/**
+ * Weekly TimelineSnapshot materialization.
+ *
+ * One row per (user, week) rolls up that week's journals, the pixels earned
+ * per domain and the share of days journaled, so the timeline is a single
+ * indexed read. Pixels come from the ledger's weekly rollup (lib/pixels/
+ * ledger.ts), the same source as the pixel summaries.
+ * Rows are upserted, so re-running a week or a whole backfill is safe.
+ *
+ * Weeks run Monday to Sunday over the user's calendar days, the same days
+ * DailyJournal.date stores; `weekStart` is a day number (streakCalculator).
+ */
+
+export const SNAPSHOT_TYPE = "weekly";
+
+export interface DomainBreakdownEntry {
+    domainId: string;
+    domainName: string;
+    colorHex: string;
+    pixels: number;
+    percentage: number; // 0-1 of the week's pixels
+}
+
+/** Latest week that has ended in every timezone at `now`: Sunday is over everywhere by Monday 12:00 UTC. */
+export function lastCompletedWeek(now: Date = new Date()) {
+    return weekStartDay(dayNumber(new Date(now.getTime() - 12 * 60 * 60 * 1000), "UTC")) - 7;
+}
+
+/** Recompute and upsert the snapshot of one user's week. Returns null for unknown users. */
+export async function materializeWeek(userId: string, weekStart: number) {
+    const from = dayToDate(weekStart);
+    const to = dayToDate(weekStart + 7);
+
+    const [user, journalCount, domains, rollups] = await Promise.all([
+        prisma.user.findUnique({ where: { id: userId }, select: { createdAt: true, timezone: true } }),
+        prisma.dailyJournal.count({ where: { userId, date: { gte: from, lt: to } } }),
+        prisma.domain.findMany({ where: { userId }, select: { id: true, name: true, colorHex: true } }),
+        prisma.pixelWeeklyRollup.findMany({ where: { userId, weekStart: from }, select: { domainId: true, pixels: true } }),
+    ]);
+    if (!user) return null;
+
+    // Unassigned pixels (and those of since-deleted domains) count toward the total only
+    const pixelCount = rollups.reduce((sum, r) => sum + r.pixels, 0);
+    const pixelsByDomain = new Map(rollups.map((r) => [r.domainId, r.pixels]));
+    const domainBreakdown: DomainBreakdownEntry[] = domains
+        .filter((d) => (pixelsByDomain.get(d.id) ?? 0) > 0)
+        .map((d) => {
+            const pixels = pixelsByDomain.get(d.id)!;
+            return { domainId: d.id, domainName: d.name, colorHex: d.colorHex, pixels, percentage: pixelCount ? pixels / pixelCount : 0 };
+        })
+        .sort((a, b) => b.pixels - a.pixels);
+
+    const firstWeek = weekStartDay(dayNumber(user.createdAt, user.timezone));
+    const data = {
+        weekNumber: Math.max(1, (weekStart - firstWeek) / 7 + 1),
+        journalCount,
+        pixelCount,
+        completionRate: journalCount / 7,
+        domainBreakdown: domainBreakdown as unknown as Prisma.InputJsonValue,
+    };
+
+    return prisma.timelineSnapshot.upsert({
+        where: { userId_type_date: { userId, type: SNAPSHOT_TYPE, date: from } },
+        create: { userId, type: SNAPSHOT_TYPE, date: from, ...data },
+        update: data,
+    });
+}
+
+/**
+ * Materialize every week of a user's history up to `throughWeek`, from the
+ * week of their first journal (or sign-up, if earlier). Used for backfill.
+ */
+export async function materializeHistory(userId: string, throughWeek: number) {
+    const [user, first] = await Promise.all([
+        prisma.user.findUnique({ where: { id: userId }, select: { createdAt: true, timezone: true } }),
+        prisma.dailyJournal.findFirst({ where: { userId }, orderBy: { date: "asc" }, select: { date: true } }),
+    ]);
+    if (!user) return 0;
+
+    const signUp = dayNumber(user.createdAt, user.timezone);
+    const start = weekStartDay(first ? Math.min(signUp, dayNumber(first.date, "UTC")) : signUp);
+    let weeks = 0;
+    for (let week = start; week <= throughWeek; week += 7) {
+        await materializeWeek(userId, week);
+        weeks++;
+    }
+    return weeks;
+}
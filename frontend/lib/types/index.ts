@@ -32,11 +32,20 @@ export interface LoginRequest {
 }
 
 // Domain Types
+// One stored size of an uploaded image (lib/images); the URL serves AVIF or WebP by Accept
+export interface ImageVariant {
+  width: number;
+  height: number;
+  url: string;
+}
+
 export interface DomainImage {
   id: string;
   imageUrl: string;
   sortOrder: number;
   uploadedAt: string;
+  variants?: ImageVariant[]; // Uploads only, smallest first
+  placeholder?: string | null; // Tiny blurred data URL shown while loading
 }
 
 export interface Domain {
@@ -169,6 +178,8 @@ export interface Journal {
   emotionalState: string | null;
   energyLevel: number | null;
   aiReflection: string | null;
+  // Background AI analysis state; absent on mock data
+  analysisStatus?: "pending" | "done" | "failed" | "skipped";
   submittedAt: string;
   completedTasks: JournalTaskCompletion[];
 }
@@ -214,6 +225,8 @@ export interface VisionBoardLayout {
       height: number;
     };
     pixels: Array<[number, number]>;
+    // Relative reveal speed of this region (lib/pixels/fillOrder.ts), default 1
+    weight?: number;
   }>;
 }
 
@@ -229,6 +242,10 @@ export interface VisionBoard {
   currentImageUrl: string;
   totalPixels: number;
   coloredPixels: number;
+  // Seed of the pixel fill order; mock boards fall back to a hash of the id
+  fillSeed?: number;
+  // Domains the fill order was built from (see fillDomains in lib/pixels/fillOrder.ts)
+  fillDomainIds?: string[];
   lastUpdated: string;
   createdAt: string;
 }
@@ -283,13 +300,23 @@ export interface TimelineSnapshot {
   id: string;
   snapshotDate: string;
   snapshotType: "daily" | "weekly" | "monthly" | "quarterly";
+  weekNumber?: number; // 1 = the user's first week
   boardImageUrl: string;
   narrativeText: string | null;
   animationUrl: string | null;
   pixelsSummary: {
     totalPixels: number;
     completionRate: number;
+    domainBreakdown?: Array<{
+      domainId: string;
+      domainName: string;
+      colorHex: string;
+      pixels: number;
+      percentage: number;
+    }>;
   };
+  journalCount?: number;
+  topDomains?: string[]; // Domain ids, most pixels first
   createdAt: string;
 }
 
@@ -1,20 +1,84 @@
-import { format, differenceInDays, parseISO, startOfDay, isBefore, isAfter, subDays } from "date-fns";
-
 export interface JournalEntry {
   journalDate: string; // ISO date string
 }
 
-/**
- * Calculate current streak from journal entries
- * Streak doesn't break - it "pauses" if user misses a day
- */
-export function calculateStreak(entries: JournalEntry[]): {
+export interface StreakData {
   currentStreak: number;
   longestStreak: number;
   totalJournals: number;
   streakStartDate: string | null;
   isActive: boolean;
-} {
+}
+
+/**
+ * Running streak totals persisted on the user (User.streak* columns), so a
+ * new journal updates them in O(1) instead of re-reading history.
+ * `currentStreak` is the run ending at `lastDay`.
+ */
+export interface StreakAggregate {
+  currentStreak: number;
+  longestStreak: number;
+  lastDay: number | null;
+  totalJournals: number;
+}
+
+// Days are integers: calendar days since 1970-01-01
+const MS_PER_DAY = 86_400_000;
+
+const dayFormatters = new Map<string, Intl.DateTimeFormat>();
+
+function dayFormatter(timeZone: string | undefined) {
+  const key = timeZone ?? "";
+  let formatter = dayFormatters.get(key);
+  if (!formatter) {
+    try {
+      formatter = new Intl.DateTimeFormat("en-US", { timeZone, year: "numeric", month: "numeric", day: "numeric" });
+    } catch {
+      // Unknown IANA zone in the user's settings
+      formatter = new Intl.DateTimeFormat("en-US", { timeZone: "UTC", year: "numeric", month: "numeric", day: "numeric" });
+    }
+    dayFormatters.set(key, formatter);
+  }
+  return formatter;
+}
+
+/** Calendar day of `instant` in `timeZone` (runtime zone when omitted). */
+export function dayNumber(instant: Date, timeZone?: string): number {
+  let year = 0, month = 0, day = 0;
+  for (const part of dayFormatter(timeZone).formatToParts(instant)) {
+    if (part.type === "year") year = Number(part.value);
+    else if (part.type === "month") month = Number(part.value);
+    else if (part.type === "day") day = Number(part.value);
+  }
+  return Date.UTC(year, month - 1, day) / MS_PER_DAY;
+}
+
+/** Day number of a "YYYY-MM-DD..." string; the date is taken as written. */
+export function dayNumberFromISO(iso: string): number {
+  return Date.UTC(Number(iso.slice(0, 4)), Number(iso.slice(5, 7)) - 1, Number(iso.slice(8, 10))) / MS_PER_DAY;
+}
+
+/** UTC midnight of a day, the value Prisma stores in a @db.Date column. */
+export function dayToDate(day: number): Date {
+  return new Date(day * MS_PER_DAY);
+}
+
+export function dayToISO(day: number): string {
+  return dayToDate(day).toISOString().slice(0, 10);
+}
+
+/** Monday of the week containing `day`. Day 0 (1970-01-01) was a Thursday. */
+export function weekStartDay(day: number): number {
+  return day - ((day % 7) + 10) % 7;
+}
+
+/**
+ * Streaks from journal entries in one pass over integer days.
+ * Entries are expected newest first (as the API returns them); other
+ * orders are sorted numerically first. The current streak is the run of
+ * consecutive days ending today or yesterday.
+ */
+export function calculateStreak(entries: JournalEntry[], today: number = dayNumber(new Date())): StreakData {
   if (entries.length === 0) {
     return {
       currentStreak: 0,
@@ -25,87 +89,68 @@ export function calculateStreak(entries: JournalEntry[]): {
     };
   }
 
-  // Sort entries by date (newest first)
-  const sortedEntries = [...entries].sort(
-    (a, b) => new Date(b.journalDate).getTime() - new Date(a.journalDate).getTime()
-  );
-
-  const today = startOfDay(new Date());
-  const totalJournals = sortedEntries.length;
-
-  // Calculate current streak (consecutive days with journal entries)
-  let currentStreak = 0;
-  let streakStartDate: string | null = null;
-  let expectedDate = startOfDay(new Date());
-
-  // Check if there's an entry today
-  const todayEntry = sortedEntries.find(
-    (entry) => format(parseISO(entry.journalDate), "yyyy-MM-dd") === format(today, "yyyy-MM-dd")
-  );
-
-  if (todayEntry) {
-    currentStreak = 1;
-    streakStartDate = todayEntry.journalDate;
-    expectedDate = subDays(expectedDate, 1);
-  } else {
-    // Check yesterday
-    const yesterday = subDays(today, 1);
-    const yesterdayEntry = sortedEntries.find(
-      (entry) => format(parseISO(entry.journalDate), "yyyy-MM-dd") === format(yesterday, "yyyy-MM-dd")
-    );
-
-    if (yesterdayEntry) {
-      currentStreak = 1;
-      streakStartDate = yesterdayEntry.journalDate;
-      expectedDate = subDays(yesterday, 1);
-    }
-  }
-
-  // Count backwards for consecutive days
-  for (const entry of sortedEntries) {
-    const entryDate = startOfDay(parseISO(entry.journalDate));
-    const expectedDateStr = format(expectedDate, "yyyy-MM-dd");
-    const entryDateStr = format(entryDate, "yyyy-MM-dd");
-
-    if (entryDateStr === expectedDateStr) {
-      currentStreak++;
-      expectedDate = subDays(expectedDate, 1);
-    } else if (isBefore(entryDate, expectedDate)) {
-      // Found a gap, but streak continues if we're still counting from recent entries
-      break;
-    }
+  let days = new Int32Array(entries.length);
+  let newestFirst = true;
+  for (let i = 0; i < entries.length; i++) {
+    days[i] = dayNumberFromISO(entries[i].journalDate);
+    if (i > 0 && days[i] > days[i - 1]) newestFirst = false;
   }
+  if (!newestFirst) days = days.sort().reverse();
 
-  // Calculate longest streak
   let longestStreak = 0;
-  let tempStreak = 1;
-
-  for (let i = 1; i < sortedEntries.length; i++) {
-    const prevDate = startOfDay(parseISO(sortedEntries[i - 1].journalDate));
-    const currDate = startOfDay(parseISO(sortedEntries[i].journalDate));
-    const daysDiff = differenceInDays(prevDate, currDate);
-
-    if (daysDiff === 1) {
-      tempStreak++;
+  let run = 0;
+  let headRun = 0; // run starting at the newest day
+  let headEnded = false;
+  let prev = Number.NaN;
+  for (let i = 0; i < days.length; i++) {
+    const day = days[i];
+    if (day === prev) continue; // several entries on one day
+    if (day === prev - 1) {
+      run++;
     } else {
-      longestStreak = Math.max(longestStreak, tempStreak);
-      tempStreak = 1;
+      if (i > 0) headEnded = true;
+      run = 1;
     }
+    if (!headEnded) headRun = run;
+    if (run > longestStreak) longestStreak = run;
+    prev = day;
   }
 
-  longestStreak = Math.max(longestStreak, tempStreak);
+  const isActive = days[0] >= today - 1;
+  const currentStreak = isActive ? headRun : 0;
+  return {
+    currentStreak,
+    longestStreak,
+    totalJournals: entries.length,
+    streakStartDate: isActive ? dayToISO(days[0] - headRun + 1) : null,
+    isActive,
+  };
+}
 
-  // Check if streak is active (has entry today or yesterday)
-  const isActive = todayEntry !== undefined || 
-    sortedEntries.some(
-      (entry) => format(parseISO(entry.journalDate), "yyyy-MM-dd") === format(subDays(today, 1), "yyyy-MM-dd")
-    );
+/** Fold one newly journaled day into the aggregate. O(1). */
+export function advanceStreak(aggregate: StreakAggregate, day: number): StreakAggregate {
+  const totalJournals = aggregate.totalJournals + 1;
+  // Same day again or a backfilled past day: the run ending at lastDay stands
+  if (aggregate.lastDay !== null && day <= aggregate.lastDay) return { ...aggregate, totalJournals };
 
+  const currentStreak = aggregate.lastDay === day - 1 ? aggregate.currentStreak + 1 : 1;
   return {
     currentStreak,
-    longestStreak,
+    longestStreak: Math.max(aggregate.longestStreak, currentStreak),
+    lastDay: day,
     totalJournals,
-    streakStartDate,
+  };
+}
+
+/** The aggregate as seen on `today`: a run that ended before yesterday is over. */
+export function streakAsOf(aggregate: StreakAggregate, today: number): StreakData {
+  const isActive = aggregate.lastDay !== null && aggregate.lastDay >= today - 1;
+  const currentStreak = isActive ? aggregate.currentStreak : 0;
+  return {
+    currentStreak,
+    longestStreak: aggregate.longestStreak,
+    totalJournals: aggregate.totalJournals,
+    streakStartDate: isActive ? dayToISO(aggregate.lastDay! - currentStreak + 1) : null,
     isActive,
   };
 }
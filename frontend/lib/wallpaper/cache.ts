@@ -0,0 +1,74 @@
+import { createHash } from "crypto";
+import { mkdir, readdir, readFile, rename, rm, unlink, writeFile } from "fs/promises";
+import path from "path";
+import type { BoardScene } from "@/lib/pixels/boardEngine";
+import type { WallpaperFormat, WallpaperPreset } from "./presets";
+
+/**
+ * Rendered wallpapers on disk, keyed by a hash of everything the render
+ * reads: board counters, layout, fill seed, pixel bitmap and domain images.
+ * When pixels change the key changes, so a stale file is never served; the
+ * superseded file is pruned on the next write, and awardPixels drops a
+ * board's files outright (invalidateWallpapers).
+ *
+ * Files live at WALLPAPER_CACHE_DIR/<boardId>/<preset>.<key>.<format>
+ * (default .wallpapers).
+ */
+
+// Bump when the rendered output changes, so older files stop matching
+const RENDER_VERSION = 2;
+
+const cacheDir = () => path.resolve(process.env.WALLPAPER_CACHE_DIR || ".wallpapers");
+const boardDir = (boardId: string) => path.join(cacheDir(), boardId);
+
+export function wallpaperKey(scene: BoardScene, preset: WallpaperPreset, format: WallpaperFormat) {
+    const { board, domains, pixelSize } = scene;
+    const hash = createHash("sha256").update(
+        JSON.stringify({
+            v: RENDER_VERSION,
+            preset,
+            format,
+            pixelSize,
+            board,
+            domains: domains.map((d) => ({ id: d.id, colorHex: d.colorHex, images: d.images })),
+        })
+    );
+    if (scene.pixelBitmap) hash.update(scene.pixelBitmap);
+    return hash.digest("hex").slice(0, 32);
+}
+
+export async function readCachedWallpaper(
+    boardId: string,
+    preset: WallpaperPreset,
+    format: WallpaperFormat,
+    key: string
+): Promise<Buffer | null> {
+    return readFile(path.join(boardDir(boardId), `${preset}.${key}.${format}`)).catch(() => null);
+}
+
+export async function writeCachedWallpaper(
+    boardId: string,
+    preset: WallpaperPreset,
+    format: WallpaperFormat,
+    key: string,
+    data: Buffer
+) {
+    const dir = boardDir(boardId);
+    const name = `${preset}.${key}.${format}`;
+    await mkdir(dir, { recursive: true });
+    // Write-then-rename: readers never see a partial file
+    const temp = path.join(dir, `${name}.${process.pid}.tmp`);
+    await writeFile(temp, data);
+    await rename(temp, path.join(dir, name));
+
+    // Older renders of this preset and format are for pixel states that are gone
+    const stale = (await readdir(dir)).filter(
+        (file) => file !== name && file.startsWith(`${preset}.`) && file.endsWith(`.${format}`)
+    );
+    await Promise.all(stale.map((file) => unlink(path.join(dir, file)).catch(() => undefined)));
+}
+
+/** Drop every cached wallpaper of a board. */
+export async function invalidateWallpapers(boardId: string) {
+    await rm(boardDir(boardId), { recursive: true, force: true });
+}
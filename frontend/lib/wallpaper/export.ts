@@ -0,0 +1,125 @@
+import { prisma } from "@/lib/prisma";
+import type { BoardScene } from "@/lib/pixels/boardEngine";
+import { toBitmap } from "@/lib/pixels/bitmap";
+import { DOMAIN_ORDER } from "@/lib/pixels/grid";
+import type { ImageVariant, VisionBoard, VisionBoardLayout } from "@/lib/types";
+import { mapWithConcurrency } from "@/lib/utils/concurrency";
+import { readCachedWallpaper, wallpaperKey, writeCachedWallpaper } from "./cache";
+import { renderOnPool } from "./pool";
+import type { WallpaperFormat, WallpaperPreset } from "./presets";
+
+// Same cell grid the dashboard board draws with
+const PIXEL_SIZE = 10;
+
+/**
+ * A board's render scene, built from the same rows and mapping the client
+ * receives (getCurrentBoard / getDomains), so the export matches the
+ * on-screen board. Null when the board is not the user's.
+ */
+async function loadBoardScene(userId: string, boardId: string): Promise<BoardScene | null> {
+    const [board, domains] = await Promise.all([
+        prisma.visionBoard.findFirst({
+            where: { id: boardId, userId },
+            select: {
+                id: true,
+                type: true,
+                layoutMetadata: true,
+                totalPixels: true,
+                coloredPixels: true,
+                fillSeed: true,
+                fillDomainIds: true,
+                pixelBits: true,
+            },
+        }),
+        prisma.domain.findMany({
+            where: { userId },
+            orderBy: DOMAIN_ORDER,
+            select: {
+                id: true,
+                name: true,
+                colorHex: true,
+                images: { orderBy: { sortOrder: "asc" }, select: { url: true, sortOrder: true, variants: true } },
+            },
+        }),
+    ]);
+    if (!board) return null;
+
+    return {
+        board: {
+            id: board.id,
+            boardType: board.type as VisionBoard["boardType"], // As mapBoard passes it to the client
+            layoutMetadata: board.layoutMetadata as unknown as VisionBoardLayout,
+            totalPixels: board.totalPixels,
+            coloredPixels: board.coloredPixels,
+            fillSeed: board.fillSeed,
+            fillDomainIds: board.fillDomainIds,
+        },
+        domains: domains.map((d) => ({
+            id: d.id,
+            name: d.name,
+            colorHex: d.colorHex,
+            images: d.images.map((img) => ({
+                imageUrl: img.url,
+                sortOrder: img.sortOrder,
+                variants: (img.variants as unknown as ImageVariant[] | null) ?? undefined,
+            })),
+        })),
+        pixelSize: PIXEL_SIZE,
+        pixelBitmap: board.pixelBits ? toBitmap(board.pixelBits) : null,
+    };
+}
+
+// Concurrent requests for the same render share one
+const inFlight = new Map<string, Promise<Buffer>>();
+
+function renderCached(boardId: string, scene: BoardScene, preset: WallpaperPreset, format: WallpaperFormat, key: string) {
+    const id = `${boardId}/${key}`;
+    let pending = inFlight.get(id);
+    if (!pending) {
+        pending = (async () => {
+            const cached = await readCachedWallpaper(boardId, preset, format, key);
+            if (cached) return cached;
+            const data = await renderOnPool({ scene, preset, format });
+            await writeCachedWallpaper(boardId, preset, format, key, data);
+            return data;
+        })().finally(() => inFlight.delete(id));
+        inFlight.set(id, pending);
+    }
+    return pending;
+}
+
+/**
+ * Wallpaper of one of the user's boards. Returns the content key right
+ * away (an ETag) and the image lazily, so unchanged exports skip even the
+ * cache read. Null when the board is not the user's.
+ */
+export async function getWallpaper(userId: string, boardId: string, preset: WallpaperPreset, format: WallpaperFormat) {
+    const scene = await loadBoardScene(userId, boardId);
+    if (!scene) return null;
+    const key = wallpaperKey(scene, preset, format);
+    return { key, load: () => renderCached(boardId, scene, preset, format, key) };
+}
+
+/**
+ * Render (or confirm cached) wallpapers for many boards, e.g. to warm the
+ * cache after a batch of pixel awards. Parallelism is bounded by the pool.
+ */
+export async function prerenderWallpapers(
+    boards: Array<{ userId: string; boardId: string }>,
+    presets: WallpaperPreset[],
+    format: WallpaperFormat = "png"
+) {
+    const jobs = boards.flatMap((b) => presets.map((preset) => ({ ...b, preset })));
+    const results = await mapWithConcurrency(jobs, 16, async ({ userId, boardId, preset }) => {
+        try {
+            const wallpaper = await getWallpaper(userId, boardId, preset, format);
+            if (wallpaper) await wallpaper.load();
+            return !!wallpaper;
+        } catch (error) {
+            console.error(`Wallpaper render failed for board ${boardId} (${preset}):`, error);
+            return false;
+        }
+    });
+    const rendered = results.filter(Boolean).length;
+    return { rendered, failed: results.length - rendered };
+}
@@ -0,0 +1,21 @@
+import { Worker } from "worker_threads";
+import { poolSize, WorkerPool } from "@/lib/workers/pool";
+import { renderWallpaper, type RenderJob } from "./render";
+
+/**
+ * Wallpaper renders on a worker pool. Rendering a 4K wallpaper is a few
+ * hundred ms of CPU-bound canvas work, so renders run off the request
+ * thread and many boards render in parallel, one per worker.
+ *
+ * WALLPAPER_WORKERS sets the pool size (see lib/workers/pool.ts).
+ */
+
+let pool: WorkerPool<RenderJob, Uint8Array> | null = null;
+
+/** Render on the shared worker pool (or inline when WALLPAPER_WORKERS=0). */
+export async function renderOnPool(job: RenderJob): Promise<Buffer> {
+    const size = poolSize("WALLPAPER_WORKERS");
+    if (size === 0) return renderWallpaper(job);
+    pool ??= new WorkerPool(() => new Worker(new URL("./render.worker.ts", import.meta.url)), size);
+    return Buffer.from(await pool.run(job));
+}
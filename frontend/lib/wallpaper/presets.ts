@@ -0,0 +1,29 @@
+/** Wallpaper export targets. Client-safe: no Node imports. */
+
+export const WALLPAPER_PRESETS = {
+    phone: { label: "Phone", width: 1179, height: 2556 },
+    desktop: { label: "Desktop", width: 1920, height: 1080 },
+    "desktop-4k": { label: "4K Desktop", width: 3840, height: 2160 },
+} as const;
+
+export type WallpaperPreset = keyof typeof WALLPAPER_PRESETS;
+
+export const WALLPAPER_FORMATS = ["png", "webp"] as const;
+export type WallpaperFormat = (typeof WALLPAPER_FORMATS)[number];
+
+export const WALLPAPER_MIME: Record<WallpaperFormat, string> = {
+    png: "image/png",
+    webp: "image/webp",
+};
+
+export function isWallpaperPreset(value: string): value is WallpaperPreset {
+    return Object.hasOwn(WALLPAPER_PRESETS, value);
+}
+
+export function isWallpaperFormat(value: string): value is WallpaperFormat {
+    return (WALLPAPER_FORMATS as readonly string[]).includes(value);
+}
+
+export function wallpaperUrl(boardId: string, preset: WallpaperPreset, format: WallpaperFormat = "png") {
+    return `/api/boards/${boardId}/wallpaper?preset=${preset}&format=${format}`;
+}
@@ -0,0 +1,128 @@
+import { createCanvas, loadImage } from "@napi-rs/canvas";
+import { readFile } from "fs/promises";
+import path from "path";
+import {
+    drawImageToContext,
+    renderBoardStill,
+    type BoardImage,
+    type BoardScene,
+    type Ctx2D,
+    type Surface,
+} from "@/lib/pixels/boardEngine";
+import { CANVAS_HEIGHT, CANVAS_WIDTH } from "@/lib/pixels/grid";
+import { variantFile } from "@/lib/images/store";
+import { WALLPAPER_PRESETS, type WallpaperFormat, type WallpaperPreset } from "./presets";
+
+export interface RenderJob {
+    scene: BoardScene;
+    preset: WallpaperPreset;
+    format: WallpaperFormat;
+}
+
+const WEBP_QUALITY = 90;
+const PUBLIC_DIR = path.join(process.cwd(), "public");
+
+// Board image URLs come from clients (onboarding sync), so remote images are
+// only fetched over https from the stock-image hosts, bounded in time and size
+const REMOTE_IMAGE_HOSTS = new Set(
+    (process.env.WALLPAPER_IMAGE_HOSTS || "images.unsplash.com").split(",").map((host) => host.trim().toLowerCase())
+);
+const FETCH_TIMEOUT_MS = 10_000;
+const MAX_IMAGE_BYTES = 20 * 1024 * 1024;
+
+function isAllowedRemote(url: string) {
+    let parsed: URL;
+    try {
+        parsed = new URL(url);
+    } catch {
+        return false;
+    }
+    return (
+        parsed.protocol === "https:" &&
+        !parsed.username &&
+        !parsed.password &&
+        (parsed.port === "" || parsed.port === "443") &&
+        REMOTE_IMAGE_HOSTS.has(parsed.hostname)
+    );
+}
+
+async function fetchRemoteImage(url: string): Promise<Buffer | null> {
+    if (!isAllowedRemote(url)) return null;
+    // No redirects: an allowed host must not bounce the fetch somewhere else
+    const response = await fetch(url, { redirect: "error", signal: AbortSignal.timeout(FETCH_TIMEOUT_MS) });
+    if (!response.ok || !response.body) return null;
+    if (Number(response.headers.get("content-length") ?? 0) > MAX_IMAGE_BYTES) {
+        await response.body.cancel();
+        return null;
+    }
+
+    const chunks: Uint8Array[] = [];
+    let size = 0;
+    const reader = response.body.getReader();
+    for (let chunk = await reader.read(); !chunk.done; chunk = await reader.read()) {
+        size += chunk.value.byteLength;
+        if (size > MAX_IMAGE_BYTES) {
+            await reader.cancel();
+            return null;
+        }
+        chunks.push(chunk.value);
+    }
+    return Buffer.concat(chunks);
+}
+
+async function readImageSource(url: string): Promise<Buffer | null> {
+    // Uploads straight from the image store, in the format every decoder reads
+    const upload = url.match(/^\/api\/images\/([0-9a-f]{64})\/(\d+)$/);
+    if (upload) return readFile(variantFile(upload[1], Number(upload[2]), "webp"));
+    // Other site-relative URLs are files under public/
+    if (url.startsWith("/")) {
+        const file = path.join(PUBLIC_DIR, url);
+        if (!file.startsWith(PUBLIC_DIR + path.sep)) return null;
+        return readFile(file);
+    }
+    return fetchRemoteImage(url);
+}
+
+// @napi-rs/canvas implements the 2D API the engine draws with; the casts
+// only bridge its type names to the DOM ones boardEngine is written against.
+const nodeHost = {
+    createLayer(width: number, height: number) {
+        const surface = createCanvas(width, height);
+        return { surface: surface as unknown as Surface, ctx: surface.getContext("2d") as unknown as Ctx2D };
+    },
+    async loadImage(url: string): Promise<BoardImage | null> {
+        try {
+            const source = await readImageSource(url);
+            return source ? ((await loadImage(source)) as unknown as BoardImage) : null;
+        } catch (error) {
+            console.warn(`Failed to load board image ${url}:`, error);
+            return null;
+        }
+    },
+};
+
+/**
+ * Render a board as a wallpaper: the same still frame PixelatedBoard holds
+ * on (lib/pixels/boardEngine.ts), centered on the preset's canvas over a
+ * darkened, cropped copy of itself where the aspect ratios differ.
+ */
+export async function renderWallpaper({ scene, preset, format }: RenderJob): Promise<Buffer> {
+    const board = createCanvas(CANVAS_WIDTH, CANVAS_HEIGHT);
+    await renderBoardStill(board.getContext("2d") as unknown as Ctx2D, nodeHost, scene);
+
+    const { width, height } = WALLPAPER_PRESETS[preset];
+    const out = createCanvas(width, height);
+    const ctx = out.getContext("2d");
+
+    drawImageToContext(ctx as unknown as Ctx2D, board as unknown as BoardImage, 0, 0, width, height);
+    ctx.fillStyle = "rgba(0,0,0,0.6)";
+    ctx.fillRect(0, 0, width, height);
+
+    const scale = Math.min(width / CANVAS_WIDTH, height / CANVAS_HEIGHT);
+    const drawWidth = CANVAS_WIDTH * scale;
+    const drawHeight = CANVAS_HEIGHT * scale;
+    ctx.imageSmoothingEnabled = false; // Crisp pixels, as on screen
+    ctx.drawImage(board, (width - drawWidth) / 2, (height - drawHeight) / 2, drawWidth, drawHeight);
+
+    return format === "webp" ? out.encode("webp", WEBP_QUALITY) : out.encode("png");
+}
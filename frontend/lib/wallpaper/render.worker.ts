@@ -0,0 +1,9 @@
+import { serveJobs } from "@/lib/workers/pool";
+import { renderWallpaper, type RenderJob } from "./render";
+
+// One render at a time per worker; see pool.ts
+serveJobs(
+    // Copy into a standalone buffer so it can be transferred, not cloned
+    async (job: RenderJob) => new Uint8Array(await renderWallpaper(job)),
+    (data) => [data.buffer as ArrayBuffer]
+);
@@ -0,0 +1,112 @@
+import os from "os";
+import { parentPort, type TransferListItem, type Worker } from "worker_threads";
+
+/**
+ * Fixed-size pool of worker threads for CPU-bound jobs (wallpaper renders,
+ * image ingestion). One job runs per worker at a time; jobs queue when all
+ * workers are busy, and a crashed worker is replaced on the next job.
+ *
+ * The worker side calls `serveJobs` with its handler. Workers are created
+ * by the caller's `spawnWorker`, so `new Worker(new URL("./x.worker.ts",
+ * import.meta.url))` stays next to the worker file, where the bundler
+ * looks for it.
+ */
+
+export type JobResult<R> = { ok: true; data: R } | { ok: false; error: string };
+
+interface Task<J, R> {
+    job: J;
+    transfer: TransferListItem[];
+    resolve: (data: R) => void;
+    reject: (error: Error) => void;
+}
+
+export class WorkerPool<J, R> {
+    private idle: Worker[] = [];
+    private running = 0;
+    private queue: Task<J, R>[] = [];
+    private active = new Map<Worker, Task<J, R>>();
+
+    constructor(
+        private readonly spawnWorker: () => Worker,
+        private readonly size: number
+    ) {}
+
+    run(job: J, transfer: TransferListItem[] = []): Promise<R> {
+        return new Promise((resolve, reject) => {
+            this.queue.push({ job, transfer, resolve, reject });
+            this.drain();
+        });
+    }
+
+    private drain() {
+        while (this.queue.length > 0) {
+            const worker = this.idle.pop() ?? (this.running < this.size ? this.spawn() : null);
+            if (!worker) return;
+            this.dispatch(worker, this.queue.shift()!);
+        }
+    }
+
+    // Listeners live as long as the worker, so one that dies while idle is
+    // dropped too, instead of being handed the next job
+    private spawn() {
+        this.running++;
+        const worker = this.spawnWorker();
+        worker.unref(); // Idle workers must not keep the process alive
+
+        worker.on("message", (result: JobResult<R>) => {
+            const task = this.active.get(worker);
+            if (!task) return;
+            this.active.delete(worker);
+            this.idle.push(worker);
+            if (result.ok) task.resolve(result.data);
+            else task.reject(new Error(result.error));
+            this.drain();
+        });
+        worker.on("error", (error: Error) => {
+            this.active.get(worker)?.reject(error);
+            this.active.delete(worker);
+            void worker.terminate(); // "exit" follows and does the bookkeeping
+        });
+        // A crashed worker is dropped; the next job spawns a fresh one
+        worker.on("exit", (code: number) => {
+            this.active.get(worker)?.reject(new Error(`Worker exited with code ${code}`));
+            this.active.delete(worker);
+            this.idle = this.idle.filter((w) => w !== worker);
+            this.running--;
+            this.drain();
+        });
+        return worker;
+    }
+
+    private dispatch(worker: Worker, task: Task<J, R>) {
+        this.active.set(worker, task);
+        worker.postMessage(task.job, task.transfer);
+    }
+}
+
+/**
+ * Pool size from an env var (e.g. WALLPAPER_WORKERS): default cores - 1,
+ * at most 4; 0 means run inline, for environments without worker threads.
+ */
+export function poolSize(envVar: string) {
+    const configured = process.env[envVar];
+    if (configured !== undefined && configured !== "") return Math.max(0, Number(configured) || 0);
+    return Math.max(1, Math.min(4, os.availableParallelism() - 1));
+}
+
+/**
+ * Worker side: answer each job with `handler`'s result. `transfer` lists
+ * buffers of the result to move instead of copy.
+ */
+export function serveJobs<J, R>(handler: (job: J) => Promise<R>, transfer: (data: R) => TransferListItem[] = () => []) {
+    parentPort?.on("message", async (job: J) => {
+        let result: JobResult<R>;
+        try {
+            result = { ok: true, data: await handler(job) };
+        } catch (error) {
+            result = { ok: false, error: error instanceof Error ? error.message : String(error) };
+        }
+        parentPort!.postMessage(result, result.ok ? transfer(result.data) : []);
+    });
+}
@@ -1,5 +1,7 @@
 /** @type {import('next').NextConfig} */
 const nextConfig = {
+  // Native canvas bindings for the wallpaper renderer (lib/wallpaper) load at runtime
+  serverExternalPackages: ['@napi-rs/canvas'],
   images: {
     remotePatterns: [
       {
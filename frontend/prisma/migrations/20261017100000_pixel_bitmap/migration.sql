@@ -0,0 +1,9 @@
+/*
+  Warnings:
+
+  - You are about to drop the column `pixelState` on the `VisionBoard` table. All the data in the column will be lost.
+
+*/
+-- AlterTable
+ALTER TABLE "VisionBoard" DROP COLUMN "pixelState",
+ADD COLUMN     "pixelBits" BYTEA;
@@ -0,0 +1,2 @@
+-- AlterTable
+ALTER TABLE "VisionBoard" ADD COLUMN     "fillSeed" INTEGER NOT NULL DEFAULT (floor((random() * (2147483647)::double precision)))::integer;
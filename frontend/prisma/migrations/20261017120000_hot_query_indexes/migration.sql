@@ -0,0 +1,51 @@
+/*
+  Warnings:
+
+  - The `date` column on the `DailyJournal` table becomes a DATE. Entries written on the same day by one user are merged into the latest one (texts joined oldest first) so the unique day key can be added.
+  - A unique constraint covering the columns `[userId,date]` on the table `DailyJournal` will be added.
+
+*/
+-- Merge same-day journals into the latest entry of that day
+UPDATE "DailyJournal" AS j
+SET "text" = merged."text"
+FROM (
+    SELECT DISTINCT ON ("userId", "date"::date)
+        "id",
+        string_agg("text", E'\n\n') OVER (PARTITION BY "userId", "date"::date ORDER BY "date", "id"
+            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING) AS "text",
+        count(*) OVER (PARTITION BY "userId", "date"::date) AS "entries"
+    FROM "DailyJournal"
+    ORDER BY "userId", "date"::date, "date" DESC, "id" DESC
+) AS merged
+WHERE j."id" = merged."id" AND merged."entries" > 1;
+
+DELETE FROM "DailyJournal" AS j
+USING (
+    SELECT "id", row_number() OVER (PARTITION BY "userId", "date"::date ORDER BY "date" DESC, "id" DESC) AS "rank"
+    FROM "DailyJournal"
+) AS ranked
+WHERE j."id" = ranked."id" AND ranked."rank" > 1;
+
+-- AlterTable
+ALTER TABLE "DailyJournal" ALTER COLUMN "date" SET DATA TYPE DATE;
+
+-- CreateIndex
+CREATE INDEX "Domain_userId_idx" ON "Domain"("userId");
+
+-- CreateIndex
+CREATE INDEX "DomainImage_domainId_sortOrder_idx" ON "DomainImage"("domainId", "sortOrder");
+
+-- CreateIndex
+CREATE INDEX "Goal_domainId_status_idx" ON "Goal"("domainId", "status");
+
+-- CreateIndex
+CREATE INDEX "Milestone_goalId_idx" ON "Milestone"("goalId");
+
+-- CreateIndex
+CREATE INDEX "VisionBoard_userId_startDate_endDate_idx" ON "VisionBoard"("userId", "startDate" DESC, "endDate");
+
+-- CreateIndex
+CREATE INDEX "TimelineSnapshot_userId_date_idx" ON "TimelineSnapshot"("userId", "date");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "DailyJournal_userId_date_key" ON "DailyJournal"("userId", "date");
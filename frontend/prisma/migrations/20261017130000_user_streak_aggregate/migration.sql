@@ -0,0 +1,31 @@
+-- AlterTable
+ALTER TABLE "User" ADD COLUMN     "journalCount" INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN     "streakCurrent" INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN     "streakLastDay" DATE,
+ADD COLUMN     "streakLongest" INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill from journal history: consecutive days share "date" - row_number
+WITH "islands" AS (
+    SELECT "userId", max("date") AS "lastDay", count(*)::integer AS "length"
+    FROM (
+        SELECT "userId", "date", "date" - (row_number() OVER (PARTITION BY "userId" ORDER BY "date"))::integer AS "island"
+        FROM "DailyJournal"
+    ) AS "days"
+    GROUP BY "userId", "island"
+), "aggregates" AS (
+    SELECT
+        "userId",
+        (array_agg("length" ORDER BY "lastDay" DESC))[1] AS "current",
+        max("length") AS "longest",
+        max("lastDay") AS "lastDay",
+        sum("length")::integer AS "total"
+    FROM "islands"
+    GROUP BY "userId"
+)
+UPDATE "User" AS u
+SET "streakCurrent" = a."current",
+    "streakLongest" = a."longest",
+    "streakLastDay" = a."lastDay",
+    "journalCount" = a."total"
+FROM "aggregates" AS a
+WHERE u."id" = a."userId";
@@ -0,0 +1,17 @@
+-- CreateTable
+CREATE TABLE "AiResponseCache" (
+    "key" TEXT NOT NULL,
+    "namespace" TEXT NOT NULL,
+    "value" JSONB NOT NULL,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "expiresAt" TIMESTAMP(3) NOT NULL,
+    "lastHitAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "AiResponseCache_pkey" PRIMARY KEY ("key")
+);
+
+-- CreateIndex
+CREATE INDEX "AiResponseCache_expiresAt_idx" ON "AiResponseCache"("expiresAt");
+
+-- CreateIndex
+CREATE INDEX "AiResponseCache_lastHitAt_idx" ON "AiResponseCache"("lastHitAt");
@@ -0,0 +1,16 @@
+-- CreateTable
+CREATE TABLE "WeeklyPlan" (
+    "id" TEXT NOT NULL,
+    "userId" TEXT NOT NULL,
+    "weekStart" DATE NOT NULL,
+    "plan" TEXT NOT NULL,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "WeeklyPlan_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "WeeklyPlan_userId_weekStart_key" ON "WeeklyPlan"("userId", "weekStart");
+
+-- AddForeignKey
+ALTER TABLE "WeeklyPlan" ADD CONSTRAINT "WeeklyPlan_userId_fkey" FOREIGN KEY ("userId") REFERENCES "User"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
@@ -0,0 +1,35 @@
+-- CreateTable
+CREATE TABLE "ReminderSchedule" (
+    "userId" TEXT NOT NULL,
+    "kind" TEXT NOT NULL,
+    "nextFireAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "ReminderSchedule_pkey" PRIMARY KEY ("userId","kind")
+);
+
+-- CreateIndex
+CREATE INDEX "ReminderSchedule_nextFireAt_idx" ON "ReminderSchedule"("nextFireAt");
+
+-- AddForeignKey
+ALTER TABLE "ReminderSchedule" ADD CONSTRAINT "ReminderSchedule_userId_fkey" FOREIGN KEY ("userId") REFERENCES "User"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
+
+-- Backfill: next local occurrence of each reminder, stored as a UTC timestamp.
+-- Settings are validated first (MATERIALIZED), so no bad zone or time is ever cast.
+WITH "valid" AS MATERIALIZED (
+    SELECT u."id" AS "userId", r."kind", r."time", u."timezone"
+    FROM "User" u
+    CROSS JOIN LATERAL (VALUES ('bedtime', u."bedtimeReminder"), ('morning', u."morningReminder")) AS r("kind", "time")
+    WHERE (u."emailNotify" OR u."pushNotify")
+      AND r."time" ~ '^([01][0-9]|2[0-3]):[0-5][0-9]$'
+      AND u."timezone" IN (SELECT "name" FROM pg_timezone_names)
+), "local" AS (
+    SELECT "userId", "kind", "timezone", "time"::time AS "time", (now() AT TIME ZONE "timezone")::date AS "day"
+    FROM "valid"
+)
+INSERT INTO "ReminderSchedule" ("userId", "kind", "nextFireAt")
+SELECT "userId", "kind",
+       CASE WHEN (("day" + "time") AT TIME ZONE "timezone") > now()
+            THEN (("day" + "time") AT TIME ZONE "timezone") AT TIME ZONE 'UTC'
+            ELSE (("day" + 1 + "time") AT TIME ZONE "timezone") AT TIME ZONE 'UTC'
+       END
+FROM "local";
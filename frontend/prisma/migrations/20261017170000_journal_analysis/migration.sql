@@ -0,0 +1,15 @@
+-- AlterTable
+ALTER TABLE "DailyJournal" ADD COLUMN     "aiReflection" TEXT,
+ADD COLUMN     "analysisStatus" TEXT NOT NULL DEFAULT 'PENDING',
+ADD COLUMN     "analyzedAt" TIMESTAMP(3);
+
+-- Entries so far only carry the submit-time placeholders ('neutral', 5): clear
+-- them, queue the last week for analysis and leave older history unanalyzed
+UPDATE "DailyJournal" SET "sentiment" = NULL, "effortScore" = NULL
+WHERE "sentiment" = 'neutral' AND "effortScore" = 5;
+
+UPDATE "DailyJournal" SET "analysisStatus" = 'SKIPPED'
+WHERE "date" < CURRENT_DATE - 7;
+
+-- CreateIndex
+CREATE INDEX "DailyJournal_analysisStatus_date_idx" ON "DailyJournal"("analysisStatus", "date");
@@ -0,0 +1,17 @@
+-- DropIndex
+DROP INDEX "TimelineSnapshot_userId_date_idx";
+
+-- AlterTable
+ALTER TABLE "TimelineSnapshot" ADD COLUMN     "domainBreakdown" JSONB NOT NULL DEFAULT '[]',
+ADD COLUMN     "journalCount" INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN     "updatedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ADD COLUMN     "weekNumber" INTEGER NOT NULL DEFAULT 0;
+
+-- One row per (user, type, period): drop duplicates so the unique index
+-- builds. History is (re)computed by the "app/timeline.backfill" event.
+DELETE FROM "TimelineSnapshot" a
+USING "TimelineSnapshot" b
+WHERE a."userId" = b."userId" AND a."type" = b."type" AND a."date" = b."date" AND a."id" < b."id";
+
+-- CreateIndex
+CREATE UNIQUE INDEX "TimelineSnapshot_userId_type_date_key" ON "TimelineSnapshot"("userId", "type", "date");
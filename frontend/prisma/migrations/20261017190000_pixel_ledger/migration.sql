@@ -0,0 +1,85 @@
+-- CreateTable
+CREATE TABLE "PixelEvent" (
+    "id" TEXT NOT NULL,
+    "userId" TEXT NOT NULL,
+    "boardId" TEXT NOT NULL,
+    "domainId" TEXT NOT NULL,
+    "day" DATE NOT NULL,
+    "delta" INTEGER NOT NULL,
+    "source" TEXT NOT NULL,
+    "sourceId" TEXT,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "PixelEvent_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "PixelDailyRollup" (
+    "userId" TEXT NOT NULL,
+    "day" DATE NOT NULL,
+    "domainId" TEXT NOT NULL,
+    "pixels" INTEGER NOT NULL,
+
+    CONSTRAINT "PixelDailyRollup_pkey" PRIMARY KEY ("userId","day","domainId")
+);
+
+-- CreateTable
+CREATE TABLE "PixelWeeklyRollup" (
+    "userId" TEXT NOT NULL,
+    "weekStart" DATE NOT NULL,
+    "domainId" TEXT NOT NULL,
+    "pixels" INTEGER NOT NULL,
+
+    CONSTRAINT "PixelWeeklyRollup_pkey" PRIMARY KEY ("userId","weekStart","domainId")
+);
+
+-- CreateIndex
+CREATE INDEX "PixelEvent_userId_day_idx" ON "PixelEvent"("userId", "day");
+
+-- AddForeignKey
+ALTER TABLE "PixelEvent" ADD CONSTRAINT "PixelEvent_userId_fkey" FOREIGN KEY ("userId") REFERENCES "User"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
+
+-- Backfill: every journal so far earned 50 pixels (submitJournal's fixed
+-- reward before the ledger, JOURNAL_PIXELS in lib/pixels/state.ts) on the
+-- latest board running that day. The historical domain split is not
+-- recoverable here, so those events are unattributed ('').
+-- Board days are taken in the user's timezone; a zone Postgres does not know
+-- falls back to UTC, as dayNumber does at runtime.
+DO $$
+DECLARE
+    fallback bigint;
+BEGIN
+    SELECT count(*) INTO fallback FROM "User"
+    WHERE "timezone" NOT IN (SELECT "name" FROM pg_timezone_names);
+    IF fallback > 0 THEN
+        RAISE NOTICE 'Pixel ledger backfill: % users have an unknown timezone, using UTC days', fallback;
+    END IF;
+END $$;
+
+INSERT INTO "PixelEvent" ("id", "userId", "boardId", "domainId", "day", "delta", "source", "sourceId")
+SELECT gen_random_uuid()::text, j."userId", b."id", '', j."date", 50, 'journal', j."id"
+FROM "DailyJournal" j
+JOIN (
+    SELECT "id",
+           CASE WHEN "timezone" IN (SELECT "name" FROM pg_timezone_names) THEN "timezone" ELSE 'UTC' END AS "zone"
+    FROM "User"
+) u ON u."id" = j."userId"
+CROSS JOIN LATERAL (
+    SELECT vb."id"
+    FROM "VisionBoard" vb
+    WHERE vb."userId" = j."userId"
+      AND ((vb."startDate" AT TIME ZONE 'UTC') AT TIME ZONE u."zone")::date <= j."date"
+      AND ((vb."endDate" AT TIME ZONE 'UTC') AT TIME ZONE u."zone")::date >= j."date"
+    ORDER BY vb."startDate" DESC
+    LIMIT 1
+) b;
+
+INSERT INTO "PixelDailyRollup" ("userId", "day", "domainId", "pixels")
+SELECT "userId", "day", "domainId", SUM("delta")
+FROM "PixelEvent"
+GROUP BY "userId", "day", "domainId";
+
+INSERT INTO "PixelWeeklyRollup" ("userId", "weekStart", "domainId", "pixels")
+SELECT "userId", date_trunc('week', "day")::date, "domainId", SUM("delta")
+FROM "PixelEvent"
+GROUP BY "userId", date_trunc('week', "day")::date, "domainId";
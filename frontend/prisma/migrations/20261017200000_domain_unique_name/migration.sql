@@ -0,0 +1,26 @@
+-- Replayed onboarding syncs left duplicate domains (same user and name).
+-- Merging them is scripts/cleanup-domains.ts's job (batched, resumable);
+-- run it before `prisma migrate deploy` rather than holding locks across a
+-- deploy. It works whether or not 20261017190000_pixel_ledger has been
+-- applied yet. Checked before any change, so a refused run leaves nothing
+-- half-applied: `prisma migrate resolve --rolled-back
+-- 20261017200000_domain_unique_name`, run the script, deploy again.
+DO $$
+DECLARE
+    duplicates bigint;
+BEGIN
+    SELECT count(*) INTO duplicates
+    FROM (SELECT 1 FROM "Domain" GROUP BY "userId", "name" HAVING count(*) > 1) d;
+    IF duplicates > 0 THEN
+        RAISE EXCEPTION '% duplicate (userId, name) domain groups remain; run scripts/cleanup-domains.ts, mark this migration rolled back and deploy again', duplicates;
+    END IF;
+END $$;
+
+-- AlterTable
+ALTER TABLE "User" ADD COLUMN     "onboardingSyncKey" TEXT;
+
+-- DropIndex
+DROP INDEX "Domain_userId_idx";
+
+-- CreateIndex
+CREATE UNIQUE INDEX "Domain_userId_name_key" ON "Domain"("userId", "name");
@@ -0,0 +1,7 @@
+-- AlterTable
+ALTER TABLE "DomainImage" ADD COLUMN     "contentHash" TEXT,
+ADD COLUMN     "placeholder" TEXT,
+ADD COLUMN     "variants" JSONB;
+
+-- CreateIndex
+CREATE UNIQUE INDEX "DomainImage_domainId_contentHash_key" ON "DomainImage"("domainId", "contentHash");
@@ -0,0 +1,2 @@
+-- AlterTable
+ALTER TABLE "ReminderSchedule" ADD COLUMN     "claimedAt" TIMESTAMP(3);
@@ -0,0 +1,3 @@
+-- AlterTable
+ALTER TABLE "DailyJournal" ADD COLUMN     "analysisAttempts" INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN     "analysisQueuedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP;
@@ -0,0 +1,16 @@
+-- AlterTable
+ALTER TABLE "WeeklyPlan" ADD COLUMN     "status" TEXT NOT NULL DEFAULT 'GENERATED',
+ALTER COLUMN "plan" DROP NOT NULL;
+
+-- CreateTable
+CREATE TABLE "WeeklyPlanRun" (
+    "weekStart" DATE NOT NULL,
+    "requested" INTEGER NOT NULL,
+    "reportedAt" TIMESTAMP(3),
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "WeeklyPlanRun_pkey" PRIMARY KEY ("weekStart")
+);
+
+-- CreateIndex
+CREATE INDEX "WeeklyPlan_weekStart_status_idx" ON "WeeklyPlan"("weekStart", "status");
@@ -0,0 +1,14 @@
+-- AlterTable
+ALTER TABLE "VisionBoard" ADD COLUMN     "fillDomainIds" TEXT[] DEFAULT ARRAY[]::TEXT[];
+
+-- Existing boards were ordered from the user's current domains (name, id:
+-- DOMAIN_ORDER in lib/pixels/grid.ts); freeze that list so their lit cells
+-- stay a prefix of the order when domains change.
+UPDATE "VisionBoard" b
+SET "fillDomainIds" = d."ids"
+FROM (
+    SELECT "userId", array_agg("id" ORDER BY "name", "id") AS "ids"
+    FROM "Domain"
+    GROUP BY "userId"
+) d
+WHERE d."userId" = b."userId";
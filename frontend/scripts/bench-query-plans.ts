@@ -0,0 +1,196 @@
+import { PrismaClient } from "@prisma/client";
+
+/**
+ * Query-plan benchmark for the per-user hot queries.
+ *
+ *   BENCH_JOURNALS=1000000 npx tsx scripts/bench-query-plans.ts
+ *
+ * Clones the tables (with their migrated indexes) into a scratch schema,
+ * seeds ~BENCH_JOURNALS journals plus matching boards, snapshots, domains,
+ * goals and pixel rollups, VACUUM ANALYZEs, then EXPLAINs each query shape the app issues
+ * and fails if a plan seq-scans a seeded table, sorts, or misses an
+ * index-only scan where the query reads indexed columns only. The scratch
+ * schema is dropped afterwards; nothing in the app tables is touched.
+ */
+
+const prisma = new PrismaClient();
+
+const SCHEMA = process.env.BENCH_SCHEMA || "query_plan_bench";
+const JOURNALS = Number(process.env.BENCH_JOURNALS || 1_000_000);
+const DAYS_PER_USER = 365;
+const WEEKS_PER_USER = 52;
+const USERS = Math.ceil(JOURNALS / DAYS_PER_USER);
+
+const TABLES = [
+    "User",
+    "Domain",
+    "Goal",
+    "VisionBoard",
+    "TimelineSnapshot",
+    "DailyJournal",
+    "PixelDailyRollup",
+    "PixelWeeklyRollup",
+];
+const t = (table: string) => `"${SCHEMA}"."${table}"`;
+
+interface PlanNode {
+    "Node Type": string;
+    "Relation Name"?: string;
+    "Index Name"?: string;
+    Plans?: PlanNode[];
+}
+
+interface Case {
+    name: string;
+    sql: string;
+    indexOnly?: boolean;
+}
+
+// Same shapes as the Prisma queries in app/actions.ts and lib/pixels
+const TARGET = "'u1'";
+const CASES: Case[] = [
+    {
+        name: "current board",
+        sql: `SELECT * FROM ${t("VisionBoard")} WHERE "userId" = ${TARGET} AND "endDate" >= now()
+              ORDER BY "startDate" DESC LIMIT 1`,
+    },
+    {
+        name: "journals (last 365)",
+        sql: `SELECT * FROM ${t("DailyJournal")} WHERE "userId" = ${TARGET} ORDER BY "date" DESC LIMIT 365`,
+    },
+    {
+        name: "journal days (streaks)",
+        sql: `SELECT "date" FROM ${t("DailyJournal")} WHERE "userId" = ${TARGET} ORDER BY "date" DESC`,
+        indexOnly: true,
+    },
+    {
+        name: "journal for a day",
+        sql: `SELECT "userId", "date" FROM ${t("DailyJournal")} WHERE "userId" = ${TARGET} AND "date" = current_date`,
+        indexOnly: true,
+    },
+    {
+        name: "timeline weeks",
+        sql: `SELECT * FROM ${t("TimelineSnapshot")} WHERE "userId" = ${TARGET} AND "type" = 'weekly'
+              ORDER BY "date" DESC LIMIT 26`,
+    },
+    {
+        name: "pixel summary (days)",
+        sql: `SELECT "day", "domainId", "pixels" FROM ${t("PixelDailyRollup")}
+              WHERE "userId" = ${TARGET} AND "day" >= current_date - 13 AND "day" <= current_date`,
+    },
+    {
+        name: "pixel summary (weeks)",
+        sql: `SELECT "weekStart", "domainId", "pixels" FROM ${t("PixelWeeklyRollup")}
+              WHERE "userId" = ${TARGET} AND "weekStart" >= current_date - 364 AND "weekStart" < current_date`,
+    },
+    {
+        name: "domains",
+        sql: `SELECT * FROM ${t("Domain")} WHERE "userId" = ${TARGET}`,
+    },
+    {
+        name: "active goals",
+        sql: `SELECT g.* FROM ${t("Goal")} g JOIN ${t("Domain")} d ON d."id" = g."domainId"
+              WHERE d."userId" = ${TARGET} AND g."status" = 'ACTIVE'`,
+    },
+];
+
+async function exec(sql: string) {
+    await prisma.$executeRawUnsafe(sql);
+}
+
+async function setup() {
+    await exec(`DROP SCHEMA IF EXISTS "${SCHEMA}" CASCADE`);
+    await exec(`CREATE SCHEMA "${SCHEMA}"`);
+    for (const table of TABLES) {
+        // INCLUDING ALL copies defaults and every index, not foreign keys
+        await exec(`CREATE TABLE ${t(table)} (LIKE public."${table}" INCLUDING ALL)`);
+    }
+}
+
+async function seed() {
+    console.log(`Seeding ${USERS} users, ${USERS * DAYS_PER_USER} journals...`);
+    await exec(`
+        INSERT INTO ${t("User")} ("id", "email")
+        SELECT 'u' || u, 'bench' || u || '@example.com' FROM generate_series(1, ${USERS}) u`);
+    await exec(`
+        INSERT INTO ${t("DailyJournal")} ("id", "userId", "date", "text")
+        SELECT 'j' || u || '_' || d, 'u' || u, current_date - d, 'bench entry'
+        FROM generate_series(1, ${USERS}) u, generate_series(0, ${DAYS_PER_USER - 1}) d`);
+    await exec(`
+        INSERT INTO ${t("VisionBoard")} ("id", "userId", "type", "startDate", "endDate")
+        SELECT 'b' || u || '_' || w, 'u' || u, 'WEEKLY',
+               now() - make_interval(weeks => w), now() - make_interval(weeks => w - 1)
+        FROM generate_series(1, ${USERS}) u, generate_series(0, ${WEEKS_PER_USER - 1}) w`);
+    await exec(`
+        INSERT INTO ${t("TimelineSnapshot")} ("id", "userId", "date", "type", "pixelCount", "completionRate")
+        SELECT 's' || u || '_' || w, 'u' || u, current_date - 7 * w, 'weekly', 100 * w, 0.5
+        FROM generate_series(1, ${USERS}) u, generate_series(0, ${WEEKS_PER_USER - 1}) w`);
+    await exec(`
+        INSERT INTO ${t("Domain")} ("id", "userId", "name", "colorHex", "imageKeywords")
+        SELECT 'd' || u || '_' || n, 'u' || u, 'Domain ' || n, '#8b5cf6', '{}'
+        FROM generate_series(1, ${USERS}) u, generate_series(1, 4) n`);
+    await exec(`
+        INSERT INTO ${t("Goal")} ("id", "domainId", "title", "status")
+        SELECT 'g' || u || '_' || n || '_' || k, 'd' || u || '_' || n, 'Goal ' || k,
+               (ARRAY['ACTIVE', 'COMPLETED', 'ARCHIVED'])[k]
+        FROM generate_series(1, ${USERS}) u, generate_series(1, 4) n, generate_series(1, 3) k`);
+    await exec(`
+        INSERT INTO ${t("PixelDailyRollup")} ("userId", "day", "domainId", "pixels")
+        SELECT 'u' || u, current_date - d, 'd' || u || '_' || n, 12
+        FROM generate_series(1, ${USERS}) u, generate_series(0, ${DAYS_PER_USER - 1}) d, generate_series(1, 4) n`);
+    await exec(`
+        INSERT INTO ${t("PixelWeeklyRollup")} ("userId", "weekStart", "domainId", "pixels")
+        SELECT 'u' || u, date_trunc('week', current_date)::date - 7 * w, 'd' || u || '_' || n, 84
+        FROM generate_series(1, ${USERS}) u, generate_series(0, ${WEEKS_PER_USER - 1}) w, generate_series(1, 4) n`);
+    for (const table of TABLES) await exec(`VACUUM ANALYZE ${t(table)}`);
+}
+
+function walk(node: PlanNode, visit: (node: PlanNode) => void) {
+    visit(node);
+    node.Plans?.forEach((child) => walk(child, visit));
+}
+
+async function check(testCase: Case): Promise<string[]> {
+    const rows = await prisma.$queryRawUnsafe<Array<{ "QUERY PLAN": Array<{ Plan: PlanNode }> }>>(
+        `EXPLAIN (FORMAT JSON) ${testCase.sql}`
+    );
+    const plan = rows[0]["QUERY PLAN"][0].Plan;
+
+    const problems: string[] = [];
+    const nodes: string[] = [];
+    let indexOnlyScan = false;
+    walk(plan, (node) => {
+        nodes.push(node["Index Name"] ? `${node["Node Type"]} (${node["Index Name"]})` : node["Node Type"]);
+        if (node["Node Type"] === "Seq Scan") problems.push(`seq scan on ${node["Relation Name"]}`);
+        if (node["Node Type"] === "Sort") problems.push("sort");
+        if (node["Node Type"] === "Index Only Scan") indexOnlyScan = true;
+    });
+    if (testCase.indexOnly && !indexOnlyScan) problems.push("no index-only scan");
+
+    console.log(`${problems.length ? "FAIL" : "ok  "} ${testCase.name}: ${nodes.join(" > ")}`);
+    return problems.map((p) => `${testCase.name}: ${p}`);
+}
+
+async function main() {
+    await setup();
+    try {
+        await seed();
+        const failures: string[] = [];
+        for (const testCase of CASES) failures.push(...(await check(testCase)));
+        if (failures.length > 0) {
+            console.error(`\n${failures.length} plan regression(s):\n  ${failures.join("\n  ")}`);
+            process.exitCode = 1;
+        }
+    } finally {
+        await exec(`DROP SCHEMA IF EXISTS "${SCHEMA}" CASCADE`);
+    }
+}
+
+main()
+    .catch((e) => {
+        console.error(e);
+        process.exit(1);
+    })
+    .finally(async () => {
+        await prisma.$disconnect();
+    });
@@ -1,59 +1,201 @@
 import { PrismaClient } from "@prisma/client";
 
-const prisma = new PrismaClient();
+/**
+ * Duplicate-domain cleanup.
+ *
+ *   CLEANUP_DRY_RUN=1 npx tsx scripts/cleanup-domains.ts   # report only
+ *   CLEANUP_BATCH_SIZE=500 npx tsx scripts/cleanup-domains.ts
+ *
+ * Domains sharing a user and name are duplicates. Run this before
+ * deploying the Domain_userId_name_key migration, which refuses to build
+ * the unique index while duplicates remain:
+ *
+ *   1. npx tsx scripts/cleanup-domains.ts
+ *   2. npx prisma migrate deploy
+ *
+ * The pixel ledger tables (PixelEvent and the rollups) may not exist yet
+ * when step 1 runs, as their migration can be pending in the same deploy;
+ * they are merged when present and skipped otherwise.
+ *
+ * In each group the domain with the most goals and images is kept (ids are
+ * random, so they only break ties). The others are merged into it: their
+ * goals (with milestones), images, pixel events and pixel rollups move to
+ * the kept domain, and then the empty duplicate is deleted. Nothing the
+ * user made is dropped.
+ *
+ * Duplicates are found with one windowed query and queued in a work table,
+ * then merged in batches of CLEANUP_BATCH_SIZE domains (default 1000).
+ * Each batch is its own short transaction, so no lock is held for long; an
+ * interrupted run resumes from the work table. A session advisory lock
+ * keeps two runs from overlapping.
+ */
 
-async function main() {
-    const users = await prisma.user.findMany();
-    console.log(`Found ${users.length} users. Checking for duplicate domains...`);
+// One connection: the advisory lock is held by the session that took it
+const databaseUrl = new URL(process.env.DATABASE_URL!);
+databaseUrl.searchParams.set("connection_limit", "1");
+const prisma = new PrismaClient({ datasources: { db: { url: databaseUrl.toString() } } });
 
-    for (const user of users) {
-        const domains = await prisma.domain.findMany({
-            where: { userId: user.id }
-        });
+const DRY_RUN = process.env.CLEANUP_DRY_RUN === "1";
+const BATCH_SIZE = Number(process.env.CLEANUP_BATCH_SIZE || 1000);
+const LOCK_KEY = "cleanup-domains";
+const WORK_TABLE = `"_DomainCleanup"`;
 
-        const seenNames = new Set();
-        const duplicates = [];
+// Every duplicate domain id with the id it merges into, in one pass over Domain
+const DUPLICATES = `
+    SELECT "id", "keepId", "userId"
+    FROM (
+        SELECT
+            d."id",
+            d."userId",
+            first_value(d."id") OVER "group" AS "keepId",
+            row_number() OVER "group" AS "rank"
+        FROM "Domain" d
+        LEFT JOIN (SELECT "domainId", count(*) AS "n" FROM "Goal" GROUP BY "domainId") g ON g."domainId" = d."id"
+        LEFT JOIN (SELECT "domainId", count(*) AS "n" FROM "DomainImage" GROUP BY "domainId") i ON i."domainId" = d."id"
+        WINDOW "group" AS (
+            PARTITION BY d."userId", d."name"
+            ORDER BY coalesce(g."n", 0) + coalesce(i."n", 0) DESC, d."id"
+        )
+    ) d
+    WHERE "rank" > 1`;
 
-        for (const domain of domains) {
-            if (seenNames.has(domain.name)) {
-                duplicates.push(domain.id);
-            } else {
-                seenNames.add(domain.name);
-            }
-        }
+const LEDGER_TABLES = ["PixelEvent", "PixelDailyRollup", "PixelWeeklyRollup"] as const;
+type LedgerTable = (typeof LEDGER_TABLES)[number];
 
-        if (duplicates.length > 0) {
-            console.log(`Deleting ${duplicates.length} duplicate domains for user ${user.email}...`);
+/** The pixel ledger tables that exist in this database (created by 20261017190000_pixel_ledger). */
+async function ledgerTables(): Promise<Set<LedgerTable>> {
+    const rows = await prisma.$queryRaw<Array<{ name: LedgerTable; present: boolean }>>`
+        SELECT t."name", to_regclass(quote_ident(t."name")) IS NOT NULL AS "present"
+        FROM unnest(${[...LEDGER_TABLES]}::text[]) AS t("name")`;
+    return new Set(rows.filter((row) => row.present).map((row) => row.name));
+}
 
-            // 1. Delete dependent DomainImages
-            await prisma.domainImage.deleteMany({
-                where: { domainId: { in: duplicates } }
-            });
+async function report(ledger: Set<LedgerTable>) {
+    const events = ledger.has("PixelEvent")
+        ? `(SELECT count(*) FROM "PixelEvent" WHERE "domainId" IN (SELECT "id" FROM "dup"))`
+        : `0::bigint`;
+    const [row] = await prisma.$queryRawUnsafe<
+        Array<{ domains: bigint; users: bigint; images: bigint; goals: bigint; events: bigint }>
+    >(`
+        WITH "dup" AS MATERIALIZED (${DUPLICATES})
+        SELECT
+            (SELECT count(*) FROM "dup") AS "domains",
+            (SELECT count(DISTINCT "userId") FROM "dup") AS "users",
+            (SELECT count(*) FROM "DomainImage" WHERE "domainId" IN (SELECT "id" FROM "dup")) AS "images",
+            (SELECT count(*) FROM "Goal" WHERE "domainId" IN (SELECT "id" FROM "dup")) AS "goals",
+            ${events} AS "events"`);
+    console.log(
+        `Duplicates: ${row.domains} domains across ${row.users} users. ` +
+            `${row.goals} goals, ${row.images} images and ${row.events} pixel events move to the kept domains.`
+    );
+    if (ledger.size < LEDGER_TABLES.length) {
+        console.log(`Pixel ledger not migrated yet; skipping ${LEDGER_TABLES.filter((t) => !ledger.has(t)).join(", ")}.`);
+    }
+}
 
-            // 2. Delete dependent Goals and Milestones
-            // First find goal IDs to delete milestones
-            const goals = await prisma.goal.findMany({
-                where: { domainId: { in: duplicates } },
-                select: { id: true }
-            });
-            const goalIds = goals.map(g => g.id);
+/** Queue the duplicates, unless an interrupted run left a queue to finish. */
+async function enqueue(): Promise<number> {
+    await prisma.$executeRawUnsafe(
+        `CREATE UNLOGGED TABLE IF NOT EXISTS ${WORK_TABLE} ("id" TEXT PRIMARY KEY, "keepId" TEXT NOT NULL)`
+    );
+    const [{ pending }] = await prisma.$queryRawUnsafe<Array<{ pending: bigint }>>(
+        `SELECT count(*) AS "pending" FROM ${WORK_TABLE}`
+    );
+    if (pending > 0) {
+        console.log(`Resuming: ${pending} domains left from a previous run.`);
+        return Number(pending);
+    }
+    return prisma.$executeRawUnsafe(
+        `INSERT INTO ${WORK_TABLE} ("id", "keepId") SELECT "id", "keepId" FROM (${DUPLICATES}) d`
+    );
+}
+
+/** Merge one batch of queued domains into their kept domains. Returns the batch size. */
+async function mergeBatch(ledger: Set<LedgerTable>): Promise<number> {
+    const batch = await prisma.$queryRawUnsafe<Array<{ id: string }>>(
+        `SELECT "id" FROM ${WORK_TABLE} ORDER BY "id" LIMIT $1`,
+        BATCH_SIZE
+    );
+    if (batch.length === 0) return 0;
+    const ids = batch.map((row) => row.id);
+    const merge = `SELECT "id", "keepId" FROM ${WORK_TABLE} WHERE "id" = ANY($1)`;
+
+    // Milestones hang off goals and move with them. Images from two
+    // duplicates cannot share a contentHash: uploads (and that unique
+    // index) only exist once the unique-name migration has run.
+    await prisma.$transaction([
+        prisma.$executeRawUnsafe(
+            `UPDATE "Goal" g SET "domainId" = w."keepId" FROM (${merge}) w WHERE g."domainId" = w."id"`,
+            ids
+        ),
+        // After the kept domain's images, in their own order
+        prisma.$executeRawUnsafe(
+            `UPDATE "DomainImage" i
+             SET "domainId" = w."keepId",
+                 "sortOrder" = i."sortOrder" + coalesce(
+                     (SELECT max(k."sortOrder") + 1 FROM "DomainImage" k WHERE k."domainId" = w."keepId"), 0)
+             FROM (${merge}) w
+             WHERE i."domainId" = w."id"`,
+            ids
+        ),
+        ...(ledger.has("PixelEvent")
+            ? [
+                  prisma.$executeRawUnsafe(
+                      `UPDATE "PixelEvent" e SET "domainId" = w."keepId" FROM (${merge}) w WHERE e."domainId" = w."id"`,
+                      ids
+                  ),
+              ]
+            : []),
+        // Rollups are keyed by domain: fold the duplicate's rows into the kept domain's
+        ...(["PixelDailyRollup", "PixelWeeklyRollup"] as const)
+            .filter((table) => ledger.has(table))
+            .flatMap((table) => {
+                const period = table === "PixelDailyRollup" ? `"day"` : `"weekStart"`;
+                return [
+                    prisma.$executeRawUnsafe(
+                        `INSERT INTO "${table}" ("userId", ${period}, "domainId", "pixels")
+                         SELECT r."userId", r.${period}, w."keepId", sum(r."pixels")
+                         FROM "${table}" r JOIN (${merge}) w ON r."domainId" = w."id"
+                         GROUP BY r."userId", r.${period}, w."keepId"
+                         ON CONFLICT ("userId", ${period}, "domainId")
+                         DO UPDATE SET "pixels" = "${table}"."pixels" + EXCLUDED."pixels"`,
+                        ids
+                    ),
+                    prisma.$executeRawUnsafe(`DELETE FROM "${table}" WHERE "domainId" = ANY($1)`, ids),
+                ];
+            }),
+        prisma.$executeRaw`DELETE FROM "Domain" WHERE "id" = ANY(${ids})`,
+        prisma.$executeRawUnsafe(`DELETE FROM ${WORK_TABLE} WHERE "id" = ANY($1)`, ids),
+    ]);
+    return ids.length;
+}
+
+async function main() {
+    const [{ locked }] = await prisma.$queryRaw<Array<{ locked: boolean }>>`
+        SELECT pg_try_advisory_lock(hashtext(${LOCK_KEY})) AS "locked"`;
+    if (!locked) {
+        console.error("Another domain cleanup is running.");
+        process.exitCode = 1;
+        return;
+    }
 
-            if (goalIds.length > 0) {
-                await prisma.milestone.deleteMany({
-                    where: { goalId: { in: goalIds } }
-                });
-                await prisma.goal.deleteMany({
-                    where: { id: { in: goalIds } }
-                });
-            }
+    try {
+        const ledger = await ledgerTables();
+        await report(ledger);
+        if (DRY_RUN) return;
 
-            // 3. Finally delete the Domains
-            await prisma.domain.deleteMany({
-                where: { id: { in: duplicates } }
-            });
-        } else {
-            console.log(`No duplicates for ${user.email}.`);
+        // A batch waiting on a busy row fails fast instead of queueing behind it; rerun to resume
+        await prisma.$executeRawUnsafe(`SET lock_timeout = '5s'`);
+        const total = await enqueue();
+        let merged = 0;
+        for (let n = await mergeBatch(ledger); n > 0; n = await mergeBatch(ledger)) {
+            merged += n;
+            console.log(`Merged ${merged}/${total} duplicate domains...`);
         }
+        await prisma.$executeRawUnsafe(`DROP TABLE ${WORK_TABLE}`);
+        console.log(merged > 0 ? "Done." : "No duplicates.");
+    } finally {
+        await prisma.$queryRaw`SELECT pg_advisory_unlock(hashtext(${LOCK_KEY}))`;
     }
 }
 
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import waits
+
 async def run_test():
     pw = None
     browser = None
@@ -50,32 +52,32 @@ async def run_test():
         frame = context.pages[-1]
         # Click on 'create a new account' link to navigate to signup page
         elem = frame.locator('xpath=html/body/div[2]/div/div/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Fill in the signup form with valid user information and submit.
         frame = context.pages[-1]
         # Input full name as 'abir'
         elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
+        await waits.fill(elem, 'abir')
         
 
         frame = context.pages[-1]
         # Input email address as 'abir@example.com'
         elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
+        await waits.fill(elem, 'abir@example.com')
         
 
         frame = context.pages[-1]
         # Input password as 'Mannu#123'
         elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
+        await waits.fill(elem, 'Mannu#123')
         
 
         frame = context.pages[-1]
         # Click on 'Create account' button to submit the registration form
         elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Check for any visible confirmation messages or notifications on the dashboard page indicating successful registration or email confirmation.
@@ -157,7 +159,6 @@ async def run_test():
         await expect(frame.locator('text=TARGET_LOCK').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=5,683 / 7,500 PIXELS').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=CONTINUE MISSION').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
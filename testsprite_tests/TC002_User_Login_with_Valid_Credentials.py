@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import waits
+
 async def run_test():
     pw = None
     browser = None
@@ -50,50 +52,49 @@ async def run_test():
         frame = context.pages[-1]
         # Input valid registered email 'abir'
         elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
+        await waits.fill(elem, 'abir')
         
 
         frame = context.pages[-1]
         # Input valid password 'Mannu#123'
         elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
+        await waits.fill(elem, 'Mannu#123')
         
 
         frame = context.pages[-1]
         # Click the Sign in button to submit the login form
         elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Input a valid registered email with '@' symbol and the correct password, then submit the login form.
         frame = context.pages[-1]
         # Correct the email input to a valid registered email 'abir@example.com'
         elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
+        await waits.fill(elem, 'abir@example.com')
         
 
         frame = context.pages[-1]
         # Click the Sign in button to submit the login form with corrected email
         elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Reload the dashboard page or navigate back to login page to attempt reloading and access session details.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click the 'CONTINUE MISSION' button to proceed and check if any further session or token information is revealed.
         frame = context.pages[-1]
         # Click the CONTINUE MISSION button on the dashboard
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         await expect(frame.locator('text=User session active.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,91 +48,59 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in to start onboarding flow.
-        frame = context.pages[-1]
-        # Input username 'abir' in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password 'Mannu#123' in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to login and start onboarding
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Correct the email input to a valid format and retry login.
-        frame = context.pages[-1]
-        # Correct email input to 'abir@example.com' to pass validation
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to login with corrected email
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click the 'CONTINUE MISSION' button to proceed with the onboarding flow.
         frame = context.pages[-1]
         # Click 'CONTINUE MISSION' button to proceed with onboarding
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Start onboarding flow by clicking on the first module in Daily Protocol to define multi-domain life vision and input required details.
         frame = context.pages[-1]
         # Click 'Complete module 1 design' in Daily Protocol to start defining vision and domains
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/div[2]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Try clicking on the 'Vision Update' button in Quick Ops to start the onboarding flow or define vision and domains.
         frame = context.pages[-1]
         # Click 'Tasks Protocol' button in Quick Ops to check for onboarding start options
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div[3]/div[3]/div/div[2]/a[2]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Click on the first task 'Mentor session with junior developer' to review details and approve or modify it.
         frame = context.pages[-1]
         # Click on 'Mentor session with junior developer' task to review and approve or modify
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Approve the remaining AI-suggested tasks 'Morning yoga session' and 'Complete ML course module 6' to complete task approval step.
         frame = context.pages[-1]
         # Approve 'Morning yoga session' task
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         frame = context.pages[-1]
         # Approve 'Complete ML course module 6' task
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Click the 'LOCK DAY STRUCTURE' button to finalize the task approval and complete the onboarding process.
         frame = context.pages[-1]
         # Click 'LOCK DAY STRUCTURE' button to finalize onboarding and task approval
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Click the 'CONTINUE MISSION' button to complete the onboarding process and access the user dashboard.
         frame = context.pages[-1]
         # Click 'CONTINUE MISSION' button to complete onboarding and access dashboard
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # --> Assertions to verify final state
@@ -184,7 +154,6 @@ async def run_test():
         await expect(frame.locator('text=04').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=RELATIONSHIPS').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=10%').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
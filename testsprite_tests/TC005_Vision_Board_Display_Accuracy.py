@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,43 +48,11 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to log in.
-        frame = context.pages[-1]
-        # Input username in email address field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Correct the email address format by adding '@' and domain, then retry login.
-        frame = context.pages[-1]
-        # Correct email address format by adding '@example.com'
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit corrected login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click 'CONTINUE MISSION' button to proceed to the vision board.
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to proceed to vision board
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Verify that pixel colors accurately reflect user effort and progress status for each life domain by inspecting pixelated images and color-coded progress bars.
@@ -93,7 +63,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click Vision Update button to refresh and verify vision board pixel mapping and design style
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div[3]/div[3]/div/div[2]/a[3]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # --> Assertions to verify final state
@@ -145,7 +115,6 @@ async def run_test():
         await expect(frame.locator('text=RELATIONSHIPS').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=9,750').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=10% COMPLETE').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,88 +48,56 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to access dashboard
-        frame = context.pages[-1]
-        # Input username 'abir' in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Correct the email input to a valid format and retry login
-        frame = context.pages[-1]
-        # Correct email input to 'abir@example.com' to fix validation error
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit corrected login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click 'CONTINUE MISSION' button to dismiss modal and access dashboard elements including the Journal button.
         frame = context.pages[-1]
         # Click 'CONTINUE MISSION' button to dismiss modal
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Enter daily reflections in the journal text area and mark completed tasks.
         frame = context.pages[-1]
         # Enter daily reflections in the journal text area
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div[2]/div/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Today I completed all my design modules and felt productive.')
+        await waits.fill(elem, 'Today I completed all my design modules and felt productive.')
         
 
         frame = context.pages[-1]
         # Mark task 'Complete module 1 design' as completed
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/div[2]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         frame = context.pages[-1]
         # Mark task 'Complete module 2 design' as completed
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/div[2]/div[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         frame = context.pages[-1]
         # Mark task 'Complete module 3 design' as completed
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/div[2]/div[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Click the 'UPLOAD TO CORE' button to submit the journal entry and validate pixel awarding.
         frame = context.pages[-1]
         # Click 'UPLOAD TO CORE' button to submit the journal entry and tasks
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div[2]/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem, response=waits.server_action())
         
 
         # -> Validate that only one journal entry can be submitted per day by attempting to submit another entry and checking for system response.
         frame = context.pages[-1]
         # Enter a second journal entry text to test one entry per day restriction
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div[2]/div/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trying to submit a second journal entry for today to test system restriction.')
+        await waits.fill(elem, 'Trying to submit a second journal entry for today to test system restriction.')
         
 
         frame = context.pages[-1]
         # Click 'UPLOAD TO CORE' button to attempt submitting second journal entry
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div[2]/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem, response=waits.server_action())
         
 
         # --> Assertions to verify final state
@@ -137,7 +107,6 @@ async def run_test():
         await expect(frame.locator('text=Complete module 1 design').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Complete module 2 design').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Complete module 3 design').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,45 +48,12 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to log in.
-        frame = context.pages[-1]
-        # Input username 'abir' in email address field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Correct the email input to a valid email format and then input password and click Sign in.
-        frame = context.pages[-1]
-        # Correct email input to 'abir@example.com' to fix validation error
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form after correcting email
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # --> Assertions to verify final state
         frame = context.pages[-1]
         try:
             await expect(frame.locator('text=Duplicate journal entry detected').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test failed: The system did not reject the second journal entry submission for the same day as required by the test plan.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,66 +48,37 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to log in.
-        frame = context.pages[-1]
-        # Input username 'abir' in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Correct the email address format by adding '@' and domain, then retry login.
-        frame = context.pages[-1]
-        # Correct email address by adding '@example.com' to 'abir'
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit corrected login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click 'Continue Mission' button to proceed to journal entry submission or reflection input.
         frame = context.pages[-1]
         # Click 'CONTINUE MISSION' button to proceed to next step for journal entry submission
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Input a rich journal reflection into the mission log textarea and submit it by clicking 'Upload to Core' button.
         frame = context.pages[-1]
         # Input rich journal reflection describing emotional state and energy levels.
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div[2]/div/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Today I felt a mix of excitement and anxiety as I tackled the new project module. The flow was interrupted by some unexpected challenges, but I managed to stay focused and energized throughout. My energy levels fluctuated but overall remained positive, and emotionally I felt motivated to push through despite the friction.')
+        await waits.fill(elem, 'Today I felt a mix of excitement and anxiety as I tackled the new project module. The flow was interrupted by some unexpected challenges, but I managed to stay focused and energized throughout. My energy levels fluctuated but overall remained positive, and emotionally I felt motivated to push through despite the friction.')
         
 
         frame = context.pages[-1]
         # Click 'Upload to Core' button to submit the journal entry for AI analysis
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div[2]/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         await expect(frame.locator('text=Journal Entry received.').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=+45 Pixels generated.').first).to_be_visible(timeout=30000)
+        # The entry is analyzed in the background (needs the Inngest dev server; AI_MOCK_MODEL=true works offline)
+        analysis = frame.locator('[data-testid="journal-analysis"]')
+        await expect(analysis).to_have_attribute("data-status", "done", timeout=60000)
+        await expect(analysis.locator('text=Mood:').first).to_be_visible(timeout=5000)
         await expect(frame.locator('text=Complete module 1 design').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Complete module 2 design').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Complete module 3 design').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
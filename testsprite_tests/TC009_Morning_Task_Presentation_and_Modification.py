@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,50 +48,18 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to log in.
-        frame = context.pages[-1]
-        # Input username in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input a valid email address with '@' symbol and correct password, then click Sign in button.
-        frame = context.pages[-1]
-        # Correct email input with valid format
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit corrected login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click 'CONTINUE MISSION' button to proceed to task list or morning reminder notification.
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to proceed to task list or morning reminder notification
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Approve the first task by clicking its checkbox and verify the task status update.
         frame = context.pages[-1]
         # Click checkbox to approve 'Complete module 1 design' task
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/div[2]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # --> Assertions to verify final state
@@ -98,7 +68,6 @@ async def run_test():
             await expect(frame.locator('text=Task Approval Successful').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError('Test case failed: Morning tasks generated by AI are not displayed properly or cannot be approved, adjusted, or skipped as required by the test plan.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
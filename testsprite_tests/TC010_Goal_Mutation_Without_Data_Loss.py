@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,57 +48,25 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to access dashboard.
-        frame = context.pages[-1]
-        # Input username 'abir' in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Correct the email input to a valid format and attempt sign-in again.
-        frame = context.pages[-1]
-        # Correct email input to 'abir@example.com'
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to retry login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Navigate to goal management section by clicking the appropriate navigation element.
         frame = context.pages[-1]
         # Click Timeline to navigate to goal management section
         elem = frame.locator('xpath=html/body/div[2]/nav/div/div[2]/div/a[2]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Initiate the goal mutation/change process by selecting an existing goal to modify or change.
         frame = context.pages[-1]
         # Click on Week 26 goal card to initiate goal mutation/change process
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div/div[3]/div[2]/div/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Look for and confirm archiving and locking of old goal progress before creating new goals.
         frame = context.pages[-1]
         # Click on the completion or pixels area to check for archiving and locking details
         elem = frame.locator('xpath=html/body/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Look for alternative ways or navigation elements to initiate new goal creation or mutation process.
@@ -106,7 +76,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click Archives tab to check if new goal creation or transition narrative options exist there
         elem = frame.locator('xpath=html/body/div[2]/nav/div/div[2]/div/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # --> Assertions to verify final state
@@ -115,7 +85,6 @@ async def run_test():
             await expect(frame.locator('text=Goal Mutation Successful').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test failed: The system did not archive old goals, lock pixel progress, create new goals, or preserve historical context with transition narratives as expected during goal changes.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,49 +48,11 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input email and password, then click Sign in button to access dashboard.
-        frame = context.pages[-1]
-        # Input email address for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input a valid email address with '@' symbol and password, then click Sign in button to access dashboard.
-        frame = context.pages[-1]
-        # Input valid email address for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Input password for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Navigate to Archives or Timeline to check for weekly wrap generation and narrative summary presence.
         frame = context.pages[-1]
         # Click on Archives to check for weekly wrap generation and narrative summary
         elem = frame.locator('xpath=html/body/div[2]/nav/div/div[2]/div/a[3]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Scroll down to check for any weekly wrap or narrative summary section below the fold.
@@ -103,7 +67,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click on Timeline tab to check for weekly wrap and narrative summary
         elem = frame.locator('xpath=html/body/div[2]/nav/div/div[2]/div/a[2]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Verify the smooth animated progression of pixels corresponding to weekly effort by observing pixel progression animations or pixel reveal bars for recent weeks.
@@ -122,7 +86,6 @@ async def run_test():
         await expect(frame.locator('text=Excellent Progress!').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=80%').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=79%').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
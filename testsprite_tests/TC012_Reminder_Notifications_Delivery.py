@@ -1,16 +1,53 @@
 import asyncio
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
+# Requires the dev server to run with NOTIFICATION_SINK=file: reminders are then
+# recorded by the local fake sink and /api/dev/reminders drives the scheduler tick.
+BASE_URL = "http://localhost:3000"
+REMINDER_ZONE = "Asia/Kolkata"  # Half-hour offset, so a zone mix-up can't pass by accident
+
+
+def iso_minute(dt: datetime) -> str:
+    # Same shape as JavaScript's Date.toISOString()
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:00.000Z")
+
+
+async def run_tick(page, at: datetime) -> dict:
+    response = await page.request.post(f"{BASE_URL}/api/dev/reminders", data={"at": at.isoformat()})
+    assert response.ok, f"Scheduler tick failed with HTTP {response.status} (is NOTIFICATION_SINK=file set?)"
+    return await response.json()
+
+
+async def bedtime_notifications(page, fire_at: str) -> list:
+    response = await page.request.get(f"{BASE_URL}/api/dev/reminders")
+    assert response.ok, f"Reading the fake notification sink failed with HTTP {response.status}"
+    notifications = (await response.json())["notifications"]
+    return [n for n in notifications if n["kind"] == "bedtime" and n["fireAt"] == fire_at]
+
+
+async def save_reminder_settings(page, zone: str, bedtime: str) -> None:
+    await page.locator('select[name="timezone"]').select_option(zone)
+    await waits.fill(page.locator('input[name="bedtimeReminder"]'), bedtime)
+    await waits.click(page.locator("text=SAVE REMINDERS").first, response=waits.server_action())
+
+
 async def run_test():
     pw = None
     browser = None
     context = None
-    
+    # The signed-in user is shared with the rest of the suite: put their settings back afterwards
+    original_settings = None
+
     try:
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
-        
+
         # Launch a Chromium browser in headless mode with custom arguments
         browser = await pw.chromium.launch(
             headless=True,
@@ -21,100 +58,71 @@ async def run_test():
                 "--single-process"                # Run the browser in a single process mode
             ],
         )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
-        
+
         # Open a new page in the browser context
         page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000/dashboard", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Input email and password, then click Sign in button to access dashboard.
-        frame = context.pages[-1]
-        # Input email address for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
 
+        # -> Open settings, where bedtime/morning reminder times and the timezone are configured.
+        await waits.goto(page, f"{BASE_URL}/settings")
         frame = context.pages[-1]
-        # Input password for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
+        await waits.expect_visible(frame.locator("text=REMINDERS").first)
 
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Correct the email input to a valid format and retry login.
-        frame = context.pages[-1]
-        # Correct email input with valid format
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
+        # -> Set the bedtime reminder a few minutes ahead in a non-UTC timezone and save.
+        local_fire = datetime.now(ZoneInfo(REMINDER_ZONE)).replace(second=0, microsecond=0) + timedelta(minutes=10)
+        bedtime = local_fire.strftime("%H:%M")
+        expected_fire = iso_minute(local_fire)
 
-        frame = context.pages[-1]
-        # Click Sign in button to submit corrected login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        original_settings = (
+            await frame.locator('select[name="timezone"]').input_value(),
+            await frame.locator('input[name="bedtimeReminder"]').input_value(),
+        )
+        await save_reminder_settings(frame, REMINDER_ZONE, bedtime)
 
-        # -> Navigate to user settings to configure bedtime journal and morning task reminder times.
-        frame = context.pages[-1]
-        # Click on 'System' menu to access user settings
-        elem = frame.locator('xpath=html/body/div[2]/nav/div/div[2]/div/a[4]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        # -> The schedule is recomputed on save: next bedtime fire is that wall time in that zone, in UTC.
+        next_bedtime = frame.locator('[data-testid="reminder-next-bedtime"]')
+        await expect(next_bedtime).to_have_attribute("data-next", expected_fire, timeout=5000)
 
-        # -> Scroll down to find bedtime journal and morning task reminder time settings or related configuration.
-        await page.mouse.wheel(0, 300)
-        
+        # -> Tick the minute before: nothing may be sent early.
+        fire_dt = datetime.fromisoformat(expected_fire.replace("Z", "+00:00"))
+        await run_tick(page, fire_dt - timedelta(minutes=1))
+        assert await bedtime_notifications(page, expected_fire) == [], "Bedtime reminder was sent before its minute"
 
-        # -> Scroll further down or explore other tabs/sections to locate bedtime journal and morning task reminder time configuration.
-        await page.mouse.wheel(0, 300)
-        
+        # -> Tick the due minute: exactly one bedtime reminder, at the user's local time and zone.
+        await run_tick(page, fire_dt)
+        sent = await bedtime_notifications(page, expected_fire)
+        assert len(sent) == 1, f"Expected 1 bedtime reminder at {expected_fire}, sink recorded {len(sent)}"
+        assert sent[0]["localTime"] == bedtime, f"Reminder local time {sent[0]['localTime']} != {bedtime}"
+        assert sent[0]["timeZone"] == REMINDER_ZONE, f"Reminder zone {sent[0]['timeZone']} != {REMINDER_ZONE}"
 
-        # -> Click 'Edit Profile' button to check if reminder time settings are under user profile management.
-        frame = context.pages[-1]
-        # Click 'Edit Profile' button to explore user profile settings for reminder time configuration
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        # -> Re-run the same minute (retry / overlapping tick): no duplicate.
+        await run_tick(page, fire_dt)
+        assert len(await bedtime_notifications(page, expected_fire)) == 1, "Duplicate bedtime reminder sent on re-tick"
 
         # --> Assertions to verify final state
+        # After firing, the reminder is rescheduled for the same wall time the next day.
+        await waits.goto(page, f"{BASE_URL}/settings")
         frame = context.pages[-1]
         try:
-            await expect(frame.locator('text=Reminder sent successfully at 3 AM').first).to_be_visible(timeout=1000)
+            await expect(frame.locator('[data-testid="reminder-next-bedtime"]')).to_have_attribute(
+                "data-next", iso_minute(local_fire + timedelta(days=1)), timeout=5000
+            )
         except AssertionError:
-            raise AssertionError("Test failed: Bedtime journal and morning task validation reminders did not send as scheduled or duplicates were detected, violating user-configured times and timezones.")
-        await asyncio.sleep(5)
-    
+            raise AssertionError("Test failed: Bedtime reminder was not rescheduled for the next day after sending, violating user-configured times and timezones.")
+
     finally:
+        if context and original_settings:
+            page = await context.new_page()
+            await waits.goto(page, f"{BASE_URL}/settings")
+            await save_reminder_settings(page, *original_settings)
         if context:
             await context.close()
         if browser:
             await browser.close()
         if pw:
             await pw.stop()
-            
+
 asyncio.run(run_test())
-    
\ No newline at end of file
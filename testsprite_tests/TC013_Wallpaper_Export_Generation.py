@@ -2,6 +2,10 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
+BASE_URL = "http://localhost:3000"
+
 async def run_test():
     pw = None
     browser = None
@@ -22,87 +26,39 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000/dashboard", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to access dashboard.
+        # -> Open the main vision board, where the wallpaper export lives.
+        await waits.goto(page, f"{BASE_URL}/boards/main")
         frame = context.pages[-1]
-        # Input username in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
 
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Correct the email address format by adding '@' and domain, then retry login.
-        frame = context.pages[-1]
-        # Correct email format by adding '@example.com' to username
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to retry login with corrected email
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click CONTINUE MISSION button to proceed to vision board UI for wallpaper export.
-        frame = context.pages[-1]
-        # Click CONTINUE MISSION button to proceed to vision board UI
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Locate and click the button or menu option to request wallpaper export in mobile and desktop resolutions.
-        await page.mouse.wheel(0, 300)
-        
-
-        frame = context.pages[-1]
-        # Click button that might trigger wallpaper export or open export options
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div[2]/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        # -> Request the export: the server renders the phone and desktop sizes.
+        elem = frame.locator("button", has_text="Export").first
+        await waits.click(elem)
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         try:
-            await expect(frame.locator('text=Export Successful! Your wallpaper is ready for download.').first).to_be_visible(timeout=1000)
+            await expect(frame.locator('text=Export Successful! Your wallpaper is ready for download.').first).to_be_visible(timeout=15000)
         except AssertionError:
             raise AssertionError("Test failed: Wallpaper export did not complete successfully or the expected confirmation message was not found. The test plan requires verifying export and download URL validity for mobile and desktop resolutions.")
-        await asyncio.sleep(5)
-    
+
+        # Every download link must serve an image (rendered or cached), for both mobile and desktop.
+        links = frame.locator('[data-testid="wallpaper-export"] a')
+        presets = [await links.nth(i).get_attribute("data-preset") for i in range(await links.count())]
+        assert "phone" in presets and any(p.startswith("desktop") for p in presets), f"Missing mobile/desktop downloads: {presets}"
+        for i in range(await links.count()):
+            href = await links.nth(i).get_attribute("href")
+            response = await page.request.get(f"{BASE_URL}{href}")
+            assert response.ok, f"Wallpaper download {href} failed with HTTP {response.status}"
+            assert response.headers.get("content-type", "").startswith("image/"), f"Wallpaper download {href} is not an image"
+            assert "attachment" in response.headers.get("content-disposition", ""), f"Wallpaper download {href} is not served as a download"
+
     finally:
         if context:
             await context.close()
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,80 +48,36 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to access dashboard.
-        frame = context.pages[-1]
-        # Input username in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input a valid email address with '@' symbol and the password, then click Sign in to access the dashboard.
-        frame = context.pages[-1]
-        # Input valid email address in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Focus password field to clear any error state
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form with valid credentials
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Test dashboard rendering and animations on tablet screen size.
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to observe animation and component behavior
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Simulate tablet screen size to verify dashboard components layout, usability, and animation smoothness.
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to observe animation and component behavior on tablet view
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
@@ -129,58 +87,58 @@ async def run_test():
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to observe animation and component behavior on tablet view
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to transition to main dashboard view and observe animations on tablet view
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to transition to main dashboard view and observe animations on tablet view
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to transition to main dashboard view and observe animations on tablet view
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to transition to main dashboard view and observe animations on tablet view
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Simulate tablet screen size and verify dashboard components layout, usability, and animation smoothness.
         await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # --> Assertions to verify final state
@@ -189,7 +147,6 @@ async def run_test():
             await expect(frame.locator('text=Dashboard layout is perfect and animations are smooth').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test plan failed: Dashboard components did not render consistently or adapt responsively across multiple device screen sizes with smooth animations.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,41 +48,9 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input email and password, then click Sign in button to authenticate and obtain JWT token.
-        frame = context.pages[-1]
-        # Input email address for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input valid email 'abir@example.com' and password, then click Sign in button to authenticate and obtain JWT token.
-        frame = context.pages[-1]
-        # Input valid email address for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Send API requests with valid JWT tokens to verify authorized access and correct data response.
         await page.goto('http://localhost:3000/api/test-auth', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Explore dashboard page or navigation elements to find accessible API test endpoints or documentation for backend API authentication testing.
@@ -91,17 +61,17 @@ async def run_test():
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to explore further options
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Send API requests with valid JWT tokens to verify authorized access and correct data response.
         await page.goto('http://localhost:3000/api/validate-auth', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Send API requests with valid JWT tokens to known or assumed backend API endpoints to validate authentication and error handling.
         await page.goto('http://localhost:3000/api/user/profile', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # --> Assertions to verify final state
@@ -110,7 +80,6 @@ async def run_test():
             await expect(frame.locator('text=Authentication Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Backend API authentication validation did not pass as expected. The test plan requires verifying proper authentication, correct responses to authorized requests, and graceful error handling with meaningful messages.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -2,6 +2,8 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import auth, waits
+
 async def run_test():
     pw = None
     browser = None
@@ -22,8 +24,8 @@ async def run_test():
             ],
         )
         
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        # Create a browser context that is already signed in (cached storage state)
+        context = await auth.new_authenticated_context(browser)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -46,63 +48,25 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Input username and password, then click Sign in button to log in.
-        frame = context.pages[-1]
-        # Input username in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input a valid email address and password, then click Sign in button to test AI-driven login feature.
-        frame = context.pages[-1]
-        # Input valid email address in email field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('abir@example.com')
-        
-
-        frame = context.pages[-1]
-        # Input password in password field
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mannu#123')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click CONTINUE MISSION button to invoke AI-driven features such as goal decomposition, reflection interpretation, and story generation.
         frame = context.pages[-1]
         # Click CONTINUE MISSION button to invoke AI-driven features
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/div[2]/div[6]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Invoke AI-driven feature for goal decomposition by clicking the appropriate button or link.
         frame = context.pages[-1]
         # Click Tasks PROTOCOL button to invoke AI-driven features for goal decomposition
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div[3]/div[3]/div/div[2]/a[2]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # -> Simulate AI service failure or timeout to test fallback mechanism for goal decomposition feature.
         frame = context.pages[-1]
         # Click LOCK DAY STRUCTURE button to simulate AI service failure or trigger fallback mechanism
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.click(elem)
         
 
         # --> Assertions to verify final state
@@ -111,7 +75,6 @@ async def run_test():
             await expect(frame.locator('text=AI Service Operational').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: AI integrations did not respond as expected or fallback mechanisms did not activate upon AI service failure or unexpected data.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
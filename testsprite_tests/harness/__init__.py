@@ -0,0 +1,10 @@
+"""Local execution harness for the generated testsprite TC scripts.
+
+The ``TC0xx_*.py`` files are generated one-per-test and each one is a
+standalone ``asyncio.run(run_test())`` script. This package runs them as a
+suite: ``python -m harness`` from ``testsprite_tests/``.
+"""
+
+from harness.runner import TestCase, discover, load_run_test, main, select_shard
+
+__all__ = ["TestCase", "discover", "load_run_test", "main", "select_shard"]
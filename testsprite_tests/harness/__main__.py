@@ -0,0 +1,7 @@
+import sys
+
+from harness.runner import main
+
+# Guarded because spawned worker processes re-import the main module.
+if __name__ == "__main__":
+    sys.exit(main())
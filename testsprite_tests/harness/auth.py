@@ -0,0 +1,154 @@
+"""Authenticated storage-state cache for the TC scripts.
+
+Most TC scripts only need a signed-in user on ``/dashboard``. Instead of
+driving the Clerk sign-in form in every test, the first test of a worker
+signs in once, the resulting Playwright ``storage_state`` is saved under
+``tmp/auth/`` with an expiry, and later contexts are created from it.
+
+The cache refreshes itself: the first context of a process is checked
+against ``/dashboard``, and any navigation that ``middleware.ts`` bounces to
+sign-in marks the cached state stale so the next context signs in again.
+
+    from harness import auth
+
+    context = await auth.new_authenticated_context(browser)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from playwright import async_api
+
+from harness import waits
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+STATE_DIR = TESTS_DIR / "tmp" / "auth"
+CONFIG_FILE = TESTS_DIR / "tmp" / "config.json"
+
+BASE_URL = os.environ.get("TESTSPRITE_BASE_URL", "http://localhost:3000")
+DEFAULT_TTL = float(os.environ.get("TESTSPRITE_AUTH_TTL", 3600))
+
+# The sign-in form as recorded by the generated tests.
+EMAIL_INPUT = "xpath=html/body/div[2]/div/form/div/div/input"
+PASSWORD_INPUT = "xpath=html/body/div[2]/div/form/div/div[2]/input"
+SUBMIT_BUTTON = "xpath=html/body/div[2]/div/form/div[2]/button"
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+_lock = asyncio.Lock()
+_verified: set[Path] = set()
+
+
+def _credentials() -> tuple[str, str]:
+    password = os.environ.get("TESTSPRITE_LOGIN_PASSWORD")
+    if password is None and CONFIG_FILE.exists():
+        password = json.loads(CONFIG_FILE.read_text()).get("loginPassword")
+    email = os.environ.get("TESTSPRITE_LOGIN_EMAIL", "abir@example.com")
+    if not password:
+        raise RuntimeError("Set TESTSPRITE_LOGIN_PASSWORD or loginPassword in tmp/config.json")
+    return email, password
+
+
+def state_path(worker: str | None = None) -> Path:
+    """Cache file for this worker; the runner sets ``TESTSPRITE_WORKER``."""
+    worker = worker if worker is not None else os.environ.get("TESTSPRITE_WORKER", "0")
+    return STATE_DIR / f"storage-state-w{worker}.json"
+
+
+def load_cached_state(path: Path, now: float | None = None) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if cached.get("expiresAt", 0) <= (now if now is not None else time.time()):
+        return None
+    return cached.get("storageState")
+
+
+def invalidate(path: Path) -> None:
+    _verified.discard(path)
+    path.unlink(missing_ok=True)
+
+
+def _on_dashboard(url: str) -> bool:
+    return urlparse(url).path.startswith("/dashboard")
+
+
+async def sign_in(browser: Any, path: Path, ttl: float = DEFAULT_TTL) -> dict[str, Any]:
+    """Sign in through the UI once and persist the resulting storage state."""
+    email, password = _credentials()
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        # middleware.ts redirects the protected route to the sign-in form
+        await waits.goto(page, f"{BASE_URL}/dashboard")
+        await waits.fill(page.locator(EMAIL_INPUT).nth(0), email)
+        await waits.fill(page.locator(PASSWORD_INPUT).nth(0), password)
+        await waits.click(page.locator(SUBMIT_BUTTON).nth(0))
+        await page.wait_for_url(_on_dashboard, timeout=3 * waits.STEP_BUDGET_MS)
+        state = await context.storage_state()
+    finally:
+        await context.close()
+
+    now = time.time()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"savedAt": now, "expiresAt": now + ttl, "storageState": state})
+    )
+    return state
+
+
+async def is_accepted(context: async_api.BrowserContext) -> bool:
+    """True when the middleware lets this context through to ``/dashboard``."""
+    page = await context.new_page()
+    try:
+        await page.goto(f"{BASE_URL}/dashboard", wait_until="domcontentloaded", timeout=waits.STEP_BUDGET_MS)
+        return _on_dashboard(page.url)
+    finally:
+        await page.close()
+
+
+def _watch_for_rejection(path: Path):
+    def on_response(response: async_api.Response) -> None:
+        if response.status not in _REDIRECT_STATUSES:
+            return
+        if not response.request.is_navigation_request():
+            return
+        if "sign-in" in response.headers.get("location", ""):
+            invalidate(path)
+
+    return on_response
+
+
+async def _cached_or_fresh_state(browser: Any, path: Path) -> dict[str, Any]:
+    async with _lock:
+        state = load_cached_state(path)
+        if state is None:
+            state = await sign_in(browser, path)
+        return state
+
+
+async def new_authenticated_context(browser: Any, **options: Any) -> async_api.BrowserContext:
+    """Open a context that is already signed in as the test user."""
+    path = state_path()
+    for attempt in range(2):
+        state = await _cached_or_fresh_state(browser, path)
+        context = await browser.new_context(storage_state=state, **options)
+        if path in _verified or await is_accepted(context):
+            break
+        await context.close()
+        invalidate(path)
+        if attempt:
+            raise RuntimeError("Freshly signed-in session was rejected by the middleware")
+    _verified.add(path)
+    context.on("response", _watch_for_rejection(path))
+    return context
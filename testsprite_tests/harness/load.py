@@ -0,0 +1,609 @@
+"""Load generator that replays the daily loop against the Next.js app.
+
+Each virtual user (VU) walks the same flow TC006/TC009 drive through the
+browser, but over plain HTTP so thousands of them fit in one process:
+
+1. ``login``          Clerk password sign-in for the VU's own account
+                       (Frontend API), then GET ``/dashboard`` with the new
+                       session (a redirect to sign-in counts as an error)
+2. ``getCurrentBoard`` server action
+3. ``getDomains``     server action
+4. ``submitJournal``  server action
+5. ``getTodayTasks``  GET ``<api>/todos/today``
+6. ``validateTasks``  POST ``<api>/tasks/validate`` approving those tasks,
+                       as the morning validation page does (``lib/api/todos.ts``)
+
+Every VU signs in as a distinct account, one per line of ``--accounts``
+(``email,password``). Accounts are never shared between VUs, so each
+``submitJournal`` is a user's first entry of the day and exercises the
+insert path; use a fresh accounts file (or wait for the next day) before
+re-running. ``--provision N`` creates N Clerk test accounts through the
+Backend API (``CLERK_SECRET_KEY``), completes onboarding for each one with
+the ``syncOnboardingData`` action (our ``User`` row, domains, goals and
+board only exist after it), and writes the accounts that made it through to
+that file. Provisioning runs against the app, so it needs it up, too.
+
+VUs arrive following ``--curve`` (``constant``, ``ramp`` or ``spike``, the
+last one modelling the 22:00 bedtime-reminder peak) over ``--duration``
+seconds. The report gives count, error rate, p50/p95/p99 and throughput per
+action. Run the app against a local Postgres (``DATABASE_URL``) to see how
+``app/actions.ts`` and the database hold up.
+
+Server actions are addressed by id. Ids are read from the production build
+(``.next/static``) or given explicitly with ``--action name=id``.
+
+Dependencies are in ``requirements.txt``.
+
+    python -m harness.load --provision 10000 --accounts tmp/load_accounts.csv
+    python -m harness.load --users 10000 --duration 600 --curve spike \\
+        --accounts tmp/load_accounts.csv --out tmp/load_report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import csv
+import json
+import math
+import os
+import random
+import re
+import secrets
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+FRONTEND_DIR = TESTS_DIR.parent / "frontend"
+DEFAULT_BASE_URL = "http://localhost:3000"
+# The task API the frontend calls (lib/api/client.ts)
+DEFAULT_API_BASE_URL = os.environ.get("NEXT_PUBLIC_API_BASE_URL", "http://localhost:3001/api")
+CLERK_BACKEND_API = "https://api.clerk.com/v1"
+
+ACTIONS = ("getCurrentBoard", "getDomains", "submitJournal")
+SETUP_ACTIONS = ("syncOnboardingData",)
+FLOW = ("login", "getCurrentBoard", "getDomains", "submitJournal", "getTodayTasks", "validateTasks")
+
+# Clerk session tokens live 60 s; refresh a little before that
+TOKEN_REFRESH_AFTER = 45.0
+
+# Client chunks register every server action as
+#   createServerReference("<id>", callServer, void 0, findSourceMapURL, "<name>")
+# and minification only renames the functions, not the literals.
+_REFERENCE_RE = re.compile(r'\("([0-9a-f]{40,42})",[\w$.]+,void 0,[\w$.]+,"(\w+)"\)')
+
+JOURNAL_TEXTS = [
+    "Shipped the module I was stuck on and went for a run.",
+    "Slow day, but I kept the streak and read for an hour.",
+    "Deep work block in the morning, family dinner at night.",
+]
+
+# What a finished onboarding submits (app/onboarding/page.tsx), minus the
+# per-account idempotencyKey
+ONBOARDING_DOMAINS = [
+    ("Career", "#3B82F6", ["laptop", "desk", "focus"], "Ship the side project", ["Launch the beta", "First 100 users"]),
+    ("Health", "#10B981", ["gym", "running", "yoga"], "Run a half marathon", ["Run 10k", "Train four times a week"]),
+    ("Creativity", "#F59E0B", ["painting", "sketch", "studio"], "Finish a sketchbook", ["Sketch daily", "Fill 50 pages"]),
+]
+ONBOARDING_IMAGE = "https://images.unsplash.com/photo-1506784365847-bbad939e9335?w=800&auto=format&fit=crop"
+
+
+# ---------------------------------------------------------------------------
+# Setup
+# ---------------------------------------------------------------------------
+
+
+def discover_action_ids(build_dir: Path) -> dict[str, str]:
+    """Map server-action export names to ids from a ``next build`` output."""
+    ids: dict[str, str] = {}
+    for chunk in (build_dir / "static").rglob("*.js"):
+        for action_id, name in _REFERENCE_RE.findall(chunk.read_text(errors="ignore")):
+            ids.setdefault(name, action_id)
+    return ids
+
+
+@dataclass(frozen=True)
+class Account:
+    email: str
+    password: str
+
+
+def load_accounts(path: Path) -> list[Account]:
+    """``email,password`` rows, one account per VU."""
+    with path.open(newline="") as f:
+        return [Account(row[0].strip(), row[1]) for row in csv.reader(f) if len(row) >= 2 and row[0].strip()]
+
+
+def frontend_api_host(publishable_key: str) -> str:
+    """Clerk Frontend API host encoded in a publishable key (``pk_test_<base64 host$>``)."""
+    encoded = publishable_key.split("_", 2)[-1]
+    host = base64.b64decode(encoded + "=" * (-len(encoded) % 4)).decode()
+    return host.rstrip("$")
+
+
+def onboarding_payload() -> dict[str, Any]:
+    return {
+        "vision": "Build things I am proud of and stay healthy doing it.",
+        "domains": [
+            {"name": name, "description": goal, "colorHex": color, "imageKeywords": keywords}
+            for name, color, keywords, goal, _ in ONBOARDING_DOMAINS
+        ],
+        "domainImages": {name: [ONBOARDING_IMAGE] for name, *_ in ONBOARDING_DOMAINS},
+        "design": None,
+        "goals": [
+            {"domain": name, "milestones": milestones, "todos": []} for name, _, _, _, milestones in ONBOARDING_DOMAINS
+        ],
+        "reminders": {"bedtime": "22:00", "morning": "07:00", "timezone": "UTC"},
+        "idempotencyKey": secrets.token_hex(16),
+    }
+
+
+async def create_clerk_users(count: int, secret_key: str, concurrency: int = 10) -> list[Account]:
+    """Create ``count`` Clerk users with passwords.
+
+    ``+clerk_test`` addresses need no email verification on development
+    instances.
+    """
+    run = secrets.token_hex(3)
+    accounts = [Account(f"load-{run}-{i}+clerk_test@example.com", secrets.token_urlsafe(18)) for i in range(count)]
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(
+        base_url=CLERK_BACKEND_API, headers={"Authorization": f"Bearer {secret_key}"}, timeout=30.0
+    ) as client:
+
+        async def create(account: Account) -> None:
+            async with semaphore:
+                for attempt in range(5):
+                    response = await client.post(
+                        "/users",
+                        json={"email_address": [account.email], "password": account.password, "skip_password_checks": True},
+                    )
+                    if response.status_code != 429:
+                        break
+                    await asyncio.sleep(float(response.headers.get("retry-after", 2 ** attempt)))
+                response.raise_for_status()
+
+        await asyncio.gather(*(create(account) for account in accounts))
+    return accounts
+
+
+async def onboard_accounts(config: LoadConfig, accounts: list[Account], concurrency: int = 10) -> list[Account]:
+    """Sign each account in and run ``syncOnboardingData``; returns the ones that succeeded."""
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncHTTPTransport() as transport:
+
+        async def onboard(account: Account) -> bool:
+            async with semaphore:
+                session = AppSession(transport, config)
+                if await _timed(config, "login", session.sign_in(account)) is None:
+                    return False
+                synced = await _timed(
+                    config, "syncOnboardingData", session.call("syncOnboardingData", onboarding_payload(), path="/onboarding")
+                )
+                return synced is not None
+
+        done = await asyncio.gather(*(onboard(account) for account in accounts))
+    return [account for account, ok in zip(accounts, done) if ok]
+
+
+async def provision_accounts(config: LoadConfig, count: int, path: Path, secret_key: str) -> int:
+    """Create and onboard ``count`` accounts and write the usable ones to ``path``."""
+    accounts = await onboard_accounts(config, await create_clerk_users(count, secret_key))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as f:
+        csv.writer(f).writerows((a.email, a.password) for a in accounts)
+    return len(accounts)
+
+
+def arrival_times(users: int, duration: float, curve: str, rng: random.Random) -> list[float]:
+    """Start offsets (seconds) for ``users`` VUs spread over ``duration``."""
+    if users <= 0:
+        return []
+    if curve == "constant":
+        return [i * duration / users for i in range(users)]
+    if curve == "ramp":
+        # Arrival rate grows linearly, so the cumulative count is quadratic.
+        return [duration * math.sqrt(i / users) for i in range(users)]
+    if curve == "spike":
+        centre, sigma = duration / 2, duration / 8
+        return sorted(min(duration, max(0.0, rng.gauss(centre, sigma))) for _ in range(users))
+    raise ValueError(f"unknown arrival curve {curve!r}")
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Sample:
+    action: str
+    started: float
+    latency_ms: float
+    ok: bool
+    error: str = ""
+
+
+@dataclass
+class LoadConfig:
+    base_url: str
+    api_base_url: str
+    frontend_api: str
+    clerk_development: bool
+    action_ids: dict[str, str]
+    accounts: list[Account]
+    think_time: float = 0.0
+    request_timeout: float = 30.0
+    samples: list[Sample] = field(default_factory=list)
+    vu_failures: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class StepFailed(Exception):
+    """A step failed in a way the VU cannot continue past (e.g. no session)."""
+
+
+def _action_failed(body: str) -> str:
+    """Best-effort check of a flight response for ``{success: false}``."""
+    for line in body.splitlines():
+        _, sep, payload = line.partition(":")
+        if not sep or not payload.startswith("{"):
+            continue
+        try:
+            value = json.loads(payload)
+        except ValueError:
+            continue
+        if isinstance(value, dict) and value.get("success") is False:
+            return "action returned success=false"
+    return ""
+
+
+def _response_error(action: str, response: httpx.Response) -> str:
+    if response.is_redirect and "sign-in" in response.headers.get("location", ""):
+        return "redirected to sign-in"
+    if response.status_code >= 400:
+        return f"HTTP {response.status_code}"
+    if action in ACTIONS or action in SETUP_ACTIONS:
+        return _action_failed(response.text)
+    return ""
+
+
+async def _timed(config: LoadConfig, action: str, step) -> Any:
+    """Run one step (a coroutine returning a response) and record a sample.
+
+    Returns the response, or None when the step failed.
+    """
+    started = time.perf_counter()
+    result = None
+    try:
+        response = await step
+        error = _response_error(action, response)
+        if not error:
+            result = response
+    except StepFailed as exc:
+        error = str(exc)
+    except httpx.HTTPError as exc:
+        error = type(exc).__name__
+    except (KeyError, TypeError, ValueError) as exc:
+        # A 2xx whose body is not what the flow expects (not JSON, no token)
+        error = f"unexpected response ({type(exc).__name__})"
+    latency = (time.perf_counter() - started) * 1000
+    config.samples.append(Sample(action, started, latency, not error, error))
+    return result
+
+
+async def _think(config: LoadConfig, rng: random.Random) -> None:
+    if config.think_time:
+        await asyncio.sleep(rng.uniform(0, config.think_time))
+
+
+class ClerkSession:
+    """One VU's Clerk session, signed in over the Frontend API like clerk-js does."""
+
+    def __init__(self, fapi: httpx.AsyncClient, development: bool):
+        self.fapi = fapi
+        self.development = development
+        self.dev_browser = ""
+        self.session_id = ""
+        self.token = ""
+        self.token_at = 0.0
+
+    def _params(self) -> dict[str, str]:
+        # Development instances identify the client by a dev-browser JWT instead of a cookie
+        return {"__clerk_db_jwt": self.dev_browser} if self.dev_browser else {}
+
+    async def sign_in(self, account: Account) -> None:
+        if self.development:
+            response = await self.fapi.post("/v1/dev_browser")
+            response.raise_for_status()
+            body = response.json()
+            self.dev_browser = body.get("token") or body.get("id", "")
+        response = await self.fapi.post(
+            "/v1/client/sign_ins",
+            params=self._params(),
+            data={"identifier": account.email, "password": account.password, "strategy": "password"},
+        )
+        if response.status_code >= 400:
+            raise StepFailed(f"sign-in HTTP {response.status_code}")
+        body = response.json()
+        self.session_id = body.get("response", {}).get("created_session_id") or ""
+        session = next((s for s in body.get("client", {}).get("sessions", []) if s.get("id") == self.session_id), None)
+        if not session:
+            raise StepFailed("sign-in did not complete")
+        self._set_token(session["last_active_token"]["jwt"])
+
+    def _set_token(self, token: str) -> None:
+        self.token = token
+        self.token_at = time.monotonic()
+
+    async def fresh_token(self) -> str:
+        if time.monotonic() - self.token_at > TOKEN_REFRESH_AFTER:
+            response = await self.fapi.post(f"/v1/client/sessions/{self.session_id}/tokens", params=self._params())
+            response.raise_for_status()
+            self._set_token(response.json()["jwt"])
+        return self.token
+
+    async def app_cookies(self) -> dict[str, str]:
+        """Cookies clerk-js sets on the app's own domain for a signed-in session."""
+        cookies = {"__session": await self.fresh_token(), "__client_uat": str(int(time.time()))}
+        if self.dev_browser:
+            cookies["__clerk_db_jwt"] = self.dev_browser
+        return cookies
+
+
+class AppSession:
+    """One VU's HTTP clients: the app, the task API and its Clerk session.
+
+    The clients keep each user's cookies apart while sharing the transport's
+    connection pool; they are not closed, as closing one would close the pool.
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, config: LoadConfig):
+        options = {"transport": transport, "timeout": config.request_timeout, "follow_redirects": False}
+        self.config = config
+        self.app = httpx.AsyncClient(base_url=config.base_url, **options)
+        self.api = httpx.AsyncClient(base_url=config.api_base_url, **options)
+        fapi = httpx.AsyncClient(base_url=f"https://{config.frontend_api}", headers={"Origin": config.base_url}, **options)
+        self.clerk = ClerkSession(fapi, config.clerk_development)
+
+    async def page(self, path: str) -> httpx.Response:
+        self.app.cookies.update(await self.clerk.app_cookies())
+        return await self.app.get(path)
+
+    async def call(self, action: str, *args: Any, path: str = "/dashboard") -> httpx.Response:
+        self.app.cookies.update(await self.clerk.app_cookies())
+        return await self.app.post(
+            path,
+            content=json.dumps(list(args)),
+            headers={
+                "Next-Action": self.config.action_ids[action],
+                "Accept": "text/x-component",
+                "Content-Type": "text/plain;charset=UTF-8",
+            },
+        )
+
+    async def sign_in(self, account: Account) -> httpx.Response:
+        await self.clerk.sign_in(account)
+        return await self.page("/dashboard")
+
+    async def api_request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        token = await self.clerk.fresh_token()
+        return await self.api.request(method, path, headers={"Authorization": f"Bearer {token}"}, **kwargs)
+
+
+async def virtual_user(
+    transport: httpx.AsyncHTTPTransport, config: LoadConfig, account: Account, rng: random.Random
+) -> None:
+    session = AppSession(transport, config)
+    if await _timed(config, "login", session.sign_in(account)) is None:
+        return
+    await _think(config, rng)
+    await _timed(config, "getCurrentBoard", session.call("getCurrentBoard"))
+    await _timed(config, "getDomains", session.call("getDomains"))
+    await _think(config, rng)
+    await _timed(config, "submitJournal", session.call("submitJournal", rng.choice(JOURNAL_TEXTS)))
+    await _think(config, rng)
+    today = await _timed(config, "getTodayTasks", session.api_request("GET", "/todos/today"))
+    try:
+        task_ids = [task["id"] for task in today.json()] if today is not None else []
+    except (ValueError, TypeError, KeyError):
+        task_ids = []
+    await _timed(
+        config,
+        "validateTasks",
+        session.api_request("POST", "/tasks/validate", json={"approvedTasks": task_ids, "skippedTasks": []}),
+    )
+
+
+async def run_load(
+    config: LoadConfig, users: int, duration: float, curve: str, max_connections: int, seed: int
+) -> float:
+    rng = random.Random(seed)
+    offsets = arrival_times(users, duration, curve, rng)
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    async with httpx.AsyncHTTPTransport(limits=limits) as transport:
+        started = time.perf_counter()
+
+        async def arrive(index: int, offset: float) -> None:
+            await asyncio.sleep(max(0.0, offset - (time.perf_counter() - started)))
+            try:
+                await virtual_user(transport, config, config.accounts[index], random.Random(seed + index))
+            except Exception as exc:
+                # Steps record their own errors; this is the backstop that keeps
+                # one broken VU from cancelling the rest of the run
+                config.vu_failures[type(exc).__name__] += 1
+
+        await asyncio.gather(*(arrive(i, t) for i, t in enumerate(offsets)))
+        return time.perf_counter() - started
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(samples: list[Sample], wall_seconds: float) -> dict[str, dict[str, Any]]:
+    by_action: dict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_action[sample.action].append(sample)
+    report = {}
+    for action in FLOW:
+        rows = by_action.get(action, [])
+        latencies = [s.latency_ms for s in rows]
+        errors = [s for s in rows if not s.ok]
+        error_kinds: dict[str, int] = defaultdict(int)
+        for s in errors:
+            error_kinds[s.error] += 1
+        report[action] = {
+            "count": len(rows),
+            "errors": len(errors),
+            "errorRate": round(len(errors) / len(rows), 4) if rows else 0.0,
+            "p50": round(_percentile(latencies, 50), 1),
+            "p95": round(_percentile(latencies, 95), 1),
+            "p99": round(_percentile(latencies, 99), 1),
+            "throughput": round(len(rows) / wall_seconds, 2) if wall_seconds else 0.0,
+            "errorKinds": dict(error_kinds),
+        }
+    return report
+
+
+def print_report(report: dict[str, dict[str, Any]], wall_seconds: float, vu_failures: dict[str, int]) -> None:
+    print(f"{'action':<16}{'count':>8}{'err%':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>9}")
+    for action, row in report.items():
+        print(
+            f"{action:<16}{row['count']:>8}{row['errorRate'] * 100:>7.1f}%"
+            f"{row['p50']:>10.1f}{row['p95']:>10.1f}{row['p99']:>10.1f}{row['throughput']:>9.1f}"
+        )
+    if vu_failures:
+        print(f"aborted VUs: {', '.join(f'{kind} x{n}' for kind, n in vu_failures.items())}")
+    print(f"wall time {wall_seconds:.1f}s")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _parse_action(value: str) -> tuple[str, str]:
+    name, sep, action_id = value.partition("=")
+    known = ACTIONS + SETUP_ACTIONS
+    if not sep or name not in known:
+        raise argparse.ArgumentTypeError(f"expected one of {', '.join(known)} as name=id, got {value!r}")
+    return name, action_id
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness.load", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--api-base-url", default=DEFAULT_API_BASE_URL, help="task API (NEXT_PUBLIC_API_BASE_URL)")
+    parser.add_argument("--users", type=int, default=100, help="number of virtual users")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds over which users arrive")
+    parser.add_argument("--curve", choices=("constant", "ramp", "spike"), default="spike")
+    parser.add_argument("--think", type=float, default=0.0, help="max random think time between steps (s)")
+    parser.add_argument("--max-connections", type=int, default=500)
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout (s)")
+    parser.add_argument(
+        "--accounts", type=Path, default=TESTS_DIR / "tmp" / "load_accounts.csv", help="email,password per VU"
+    )
+    parser.add_argument(
+        "--provision", type=int, metavar="N", help="create and onboard N Clerk test accounts into --accounts and exit"
+    )
+    parser.add_argument(
+        "--clerk-publishable-key",
+        default=os.environ.get("NEXT_PUBLIC_CLERK_PUBLISHABLE_KEY"),
+        help="the app's Clerk key (NEXT_PUBLIC_CLERK_PUBLISHABLE_KEY)",
+    )
+    parser.add_argument("--build-dir", type=Path, default=FRONTEND_DIR / ".next", help="Next.js build output")
+    parser.add_argument("--action", type=_parse_action, action="append", default=[], help="override an action id: name=id")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", type=Path, help="write the JSON report here")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    secret_key = os.environ.get("CLERK_SECRET_KEY")
+    if args.provision and not secret_key:
+        print("Set CLERK_SECRET_KEY to provision accounts.", file=sys.stderr)
+        return 2
+
+    action_ids = discover_action_ids(args.build_dir) if args.build_dir.exists() else {}
+    action_ids.update(dict(args.action))
+    missing = [name for name in (SETUP_ACTIONS if args.provision else ACTIONS) if name not in action_ids]
+    if missing:
+        print(f"Unknown server action ids for: {', '.join(missing)} (build the app or pass --action)", file=sys.stderr)
+        return 2
+
+    if not args.clerk_publishable_key:
+        print("Set NEXT_PUBLIC_CLERK_PUBLISHABLE_KEY or pass --clerk-publishable-key.", file=sys.stderr)
+        return 2
+    accounts = []
+    if not args.provision:
+        accounts = load_accounts(args.accounts) if args.accounts.exists() else []
+        if len(accounts) < args.users:
+            print(
+                f"{args.users} VUs need as many accounts; {args.accounts} has {len(accounts)} (see --provision).",
+                file=sys.stderr,
+            )
+            return 2
+
+    config = LoadConfig(
+        base_url=args.base_url,
+        api_base_url=args.api_base_url,
+        frontend_api=frontend_api_host(args.clerk_publishable_key),
+        clerk_development=args.clerk_publishable_key.startswith("pk_test_"),
+        action_ids=action_ids,
+        accounts=accounts,
+        think_time=args.think,
+        request_timeout=args.timeout,
+    )
+
+    if args.provision:
+        onboarded = asyncio.run(provision_accounts(config, args.provision, args.accounts, secret_key))
+        print(f"Wrote {onboarded} onboarded accounts to {args.accounts}")
+        errors = defaultdict(int)
+        for sample in config.samples:
+            if not sample.ok:
+                errors[f"{sample.action}: {sample.error}"] += 1
+        for error, n in errors.items():
+            print(f"  {error} x{n}", file=sys.stderr)
+        return 0 if onboarded == args.provision else 1
+
+    wall = asyncio.run(run_load(config, args.users, args.duration, args.curve, args.max_connections, args.seed))
+    report = summarize(config.samples, wall)
+    print_report(report, wall, config.vu_failures)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(
+            json.dumps(
+                {
+                    "users": args.users,
+                    "curve": args.curve,
+                    "wallSeconds": round(wall, 2),
+                    "actions": report,
+                    "abortedVUs": dict(config.vu_failures),
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+    failed = config.vu_failures or any(row["errors"] for row in report.values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""Page-performance capture for the testsprite harness (``--perf``).
+
+While a TC runs, every context it opens is instrumented with:
+
+* an init script that reports navigation timing, LCP, CLS, INP (worst
+  interaction duration) and long tasks through a Playwright binding,
+* network listeners that total response bytes per route and time every
+  Next.js server-action POST (requests carrying a ``Next-Action`` header).
+
+``PerfRecorder.summary()`` becomes the ``perf`` field of the test result.
+The runner collects the summaries into a per-commit artifact under
+``tmp/perf/`` and compares it with a checked-in baseline; a metric that
+grows past its threshold fails the run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from playwright import async_api
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+ARTIFACT_DIR = TESTS_DIR / "tmp" / "perf"
+BASELINE_FILE = TESTS_DIR / "perf_baseline.json"
+
+_BINDING = "__testspritePerf"
+
+_INIT_SCRIPT = """
+(() => {
+  if (window !== window.top || window.__testspritePerfInstalled) return;
+  window.__testspritePerfInstalled = true;
+  const report = (kind, data) => {
+    try { window.%(binding)s({ kind, route: location.pathname, ...data }); } catch (e) {}
+  };
+  const observe = (type, onEntry, extra) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(onEntry))
+        .observe({ type, buffered: true, ...(extra || {}) });
+    } catch (e) {}
+  };
+  observe('largest-contentful-paint', (e) => report('lcp', { value: e.startTime }));
+  observe('layout-shift', (e) => { if (!e.hadRecentInput) report('cls', { value: e.value }); });
+  observe('longtask', (e) => report('longtask', { value: e.duration }));
+  observe('event', (e) => { if (e.interactionId) report('inp', { value: e.duration }); }, { durationThreshold: 16 });
+  addEventListener('load', () => setTimeout(() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav) return;
+    report('navigation', {
+      ttfb: nav.responseStart,
+      domContentLoaded: nav.domContentLoadedEventEnd,
+      load: nav.loadEventEnd,
+    });
+  }, 0));
+})();
+""" % {"binding": _BINDING}
+
+
+# metric -> (allowed relative growth, absolute slack). A value regresses when
+# current > baseline * (1 + ratio) + slack.
+DEFAULT_THRESHOLDS: dict[str, tuple[float, float]] = {
+    "ttfb": (0.25, 50),
+    "domContentLoaded": (0.25, 100),
+    "load": (0.25, 150),
+    "lcp": (0.20, 100),
+    "cls": (0.50, 0.02),
+    "inp": (0.30, 40),
+    "longTaskCount": (0.50, 2),
+    "longTaskMs": (0.30, 50),
+    "transferBytes": (0.10, 20_000),
+    "serverActionCount": (0.0, 0),
+    "serverActionP95": (0.30, 50),
+}
+
+
+def _route(url: str) -> str:
+    return urlparse(url).path or "/"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+@dataclass
+class RouteStats:
+    ttfb: float = 0.0
+    domContentLoaded: float = 0.0
+    load: float = 0.0
+    lcp: float = 0.0
+    cls: float = 0.0
+    inp: float = 0.0
+    longTaskCount: int = 0
+    longTaskMs: float = 0.0
+    transferBytes: int = 0
+    requests: int = 0
+    serverActionCount: int = 0
+    serverActionLatencies: list[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "ttfb": round(self.ttfb, 1),
+            "domContentLoaded": round(self.domContentLoaded, 1),
+            "load": round(self.load, 1),
+            "lcp": round(self.lcp, 1),
+            "cls": round(self.cls, 4),
+            "inp": round(self.inp, 1),
+            "longTaskCount": self.longTaskCount,
+            "longTaskMs": round(self.longTaskMs, 1),
+            "transferBytes": self.transferBytes,
+            "requests": self.requests,
+            "serverActionCount": self.serverActionCount,
+            "serverActionP50": round(_percentile(self.serverActionLatencies, 50), 1),
+            "serverActionP95": round(_percentile(self.serverActionLatencies, 95), 1),
+        }
+
+
+class PerfRecorder:
+    """Collects performance data for every context of one test."""
+
+    def __init__(self) -> None:
+        self.routes: dict[str, RouteStats] = {}
+        self._pending: set[asyncio.Task[None]] = set()
+
+    def _stats(self, route: str) -> RouteStats:
+        return self.routes.setdefault(route, RouteStats())
+
+    async def attach(self, context: async_api.BrowserContext) -> None:
+        await context.expose_binding(_BINDING, self._on_report)
+        await context.add_init_script(_INIT_SCRIPT)
+        context.on("requestfinished", self._on_request_finished)
+
+    def _on_report(self, _source: Any, payload: dict[str, Any]) -> None:
+        stats = self._stats(payload.get("route", "/"))
+        kind, value = payload.get("kind"), payload.get("value", 0)
+        if kind == "navigation":
+            # Several loads of the same route: keep the slowest.
+            stats.ttfb = max(stats.ttfb, payload.get("ttfb", 0))
+            stats.domContentLoaded = max(stats.domContentLoaded, payload.get("domContentLoaded", 0))
+            stats.load = max(stats.load, payload.get("load", 0))
+        elif kind == "lcp":
+            stats.lcp = max(stats.lcp, value)
+        elif kind == "cls":
+            stats.cls += value
+        elif kind == "inp":
+            stats.inp = max(stats.inp, value)
+        elif kind == "longtask":
+            stats.longTaskCount += 1
+            stats.longTaskMs += value
+
+    def _on_request_finished(self, request: async_api.Request) -> None:
+        task = asyncio.ensure_future(self._record_request(request))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _record_request(self, request: async_api.Request) -> None:
+        try:
+            route = _route(request.frame.url)
+        except async_api.Error:
+            route = "unknown"
+        stats = self._stats(route)
+        stats.requests += 1
+        try:
+            sizes = await request.sizes()
+            stats.transferBytes += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+        except async_api.Error:
+            pass
+        if request.method == "POST" and "next-action" in request.headers:
+            timing = request.timing
+            latency = timing["responseEnd"] if timing["responseEnd"] > 0 else timing["responseStart"]
+            stats.serverActionCount += 1
+            stats.serverActionLatencies.append(max(0.0, latency))
+
+    async def flush(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def summary(self) -> dict[str, Any]:
+        latencies = [l for s in self.routes.values() for l in s.serverActionLatencies]
+        return {
+            "routes": {route: stats.as_dict() for route, stats in sorted(self.routes.items())},
+            "serverActions": {
+                "count": len(latencies),
+                "p50": round(_percentile(latencies, 50), 1),
+                "p95": round(_percentile(latencies, 95), 1),
+                "max": round(max(latencies, default=0.0), 1),
+            },
+        }
+
+
+# ---------------------------------------------------------------------------
+# Artifacts and baseline comparison
+# ---------------------------------------------------------------------------
+
+
+def current_commit() -> str:
+    for var in ("GIT_COMMIT", "GITHUB_SHA"):
+        if os.environ.get(var):
+            return os.environ[var][:12]
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            cwd=TESTS_DIR, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "local"
+
+
+def build_artifact(per_test: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "commit": current_commit(),
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "tests": per_test,
+    }
+
+
+def write_artifact(artifact: dict[str, Any], directory: Path = ARTIFACT_DIR) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{artifact['commit']}.json"
+    path.write_text(json.dumps(artifact, indent=2) + "\n")
+    return path
+
+
+def save_baseline(artifact: dict[str, Any], path: Path = BASELINE_FILE) -> None:
+    previous = load_baseline(path) or {}
+    baseline = {
+        "commit": artifact["commit"],
+        "thresholds": previous.get("thresholds", {}),
+        "tests": artifact["tests"],
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def compare(artifact: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Return one human-readable line per metric that regressed.
+
+    Only tests and routes present in both runs are compared, so adding a TC
+    or visiting a new route never fails the gate by itself. The baseline may
+    override ``DEFAULT_THRESHOLDS`` under its ``thresholds`` key.
+    """
+    thresholds = {**DEFAULT_THRESHOLDS}
+    for metric, (ratio, slack) in baseline.get("thresholds", {}).items():
+        thresholds[metric] = (ratio, slack)
+
+    regressions = []
+    for test, current in artifact["tests"].items():
+        reference = baseline.get("tests", {}).get(test)
+        if not reference:
+            continue
+        for route, metrics in current.get("routes", {}).items():
+            base_metrics = reference.get("routes", {}).get(route)
+            if not base_metrics:
+                continue
+            for metric, (ratio, slack) in thresholds.items():
+                if metric not in metrics or metric not in base_metrics:
+                    continue
+                limit = base_metrics[metric] * (1 + ratio) + slack
+                if metrics[metric] > limit:
+                    regressions.append(
+                        f"{test} {route} {metric}: {metrics[metric]} > {limit:g} "
+                        f"(baseline {base_metrics[metric]})"
+                    )
+    return regressions
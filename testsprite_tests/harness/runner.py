@@ -0,0 +1,543 @@
+"""Parallel, sharded runner for the testsprite Playwright suite.
+
+Every generated ``TC0xx_*.py`` script starts Playwright, launches its own
+Chromium and finishes with a module-level ``asyncio.run(run_test())``. Run
+one after the other that is one browser start-up per test and a suite that
+takes minutes. The runner instead:
+
+* discovers the scripts and loads their ``run_test()`` coroutine without
+  executing the trailing ``asyncio.run(...)`` call,
+* starts one Chromium per worker process and hands each test its own
+  ``BrowserContext`` on that browser (the scripts' ``launch()``/``close()``
+  calls are routed to the shared browser, so they run unmodified),
+* runs the tests of a worker concurrently, bounded by ``--per-worker``,
+  except the ones in ``SERIAL_TESTS``, which change the signed-in account's
+  data: they all go to the first worker (and the first shard) and run there
+  one at a time, in id order,
+* signs in once per worker (see ``harness.auth``) so tests start on
+  ``/dashboard`` with a cached storage state,
+* writes results in the ``tmp/test_results.json`` format and, optionally,
+  as JUnit XML for CI,
+* with ``--perf``, records page and server-action timings per test (see
+  ``harness.perf``) and fails the run on regressions against the baseline.
+
+Usage, from ``testsprite_tests/``::
+
+    python -m harness --workers 4
+    python -m harness --workers 2 --shard 1/3 --junit tmp/junit.xml
+    python -m harness -k TC006 -k TC009 --headed
+    python -m harness --perf --update-perf-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import asyncio
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from playwright import async_api
+
+from harness import auth, perf
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+TEST_GLOB = "TC[0-9][0-9][0-9]_*.py"
+TEST_PLAN = TESTS_DIR / "testsprite_frontend_test_plan.json"
+DEFAULT_RESULTS = TESTS_DIR / "tmp" / "runner_results.json"
+
+# Same flags as the generated scripts minus "--single-process", which only
+# makes sense when every test owns a throwaway browser.
+BROWSER_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+]
+
+DEFAULT_TIMEOUT = 300.0
+
+# Every test signs in as the same account. These write to it (onboarding,
+# today's journal, task approvals, goals, reminder settings, uploads), so
+# running two of them at once, or in a different order, changes what the
+# other one sees.
+SERIAL_TESTS = frozenset({"TC004", "TC006", "TC007", "TC008", "TC009", "TC010", "TC012", "TC018"})
+
+
+@dataclass
+class TestCase:
+    id: str
+    path: Path
+    title: str
+    description: str = ""
+    serial: bool = False
+
+
+@dataclass
+class TestResult:
+    title: str
+    description: str
+    code: str
+    testStatus: str
+    testError: str = ""
+    testType: str = "FRONTEND"
+    createFrom: str = "harness"
+    created: str = ""
+    modified: str = ""
+    durationMs: int = 0
+    worker: int = 0
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RunOptions:
+    headless: bool = True
+    timeout: float = DEFAULT_TIMEOUT
+    per_worker: int = 2
+    perf: bool = False
+    context_options: dict[str, Any] = field(default_factory=dict)
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+
+def _load_plan(plan_path: Path = TEST_PLAN) -> dict[str, dict[str, Any]]:
+    if not plan_path.exists():
+        return {}
+    with plan_path.open() as fh:
+        return {entry["id"]: entry for entry in json.load(fh)}
+
+
+def discover(
+    tests_dir: Path = TESTS_DIR, keywords: list[str] | None = None
+) -> list[TestCase]:
+    """Return the TC scripts in ``tests_dir`` ordered by test id.
+
+    ``keywords`` keeps only tests whose id, title or file name contains one
+    of the given substrings (case-insensitive).
+    """
+    plan = _load_plan(tests_dir / TEST_PLAN.name)
+    cases = []
+    for path in sorted(tests_dir.glob(TEST_GLOB)):
+        test_id = path.stem.split("_", 1)[0]
+        entry = plan.get(test_id, {})
+        title = entry.get("title") or path.stem.split("_", 1)[1].replace("_", " ")
+        cases.append(
+            TestCase(
+                id=test_id,
+                path=path,
+                title=f"{test_id}-{title}",
+                description=entry.get("description", ""),
+                serial=test_id in SERIAL_TESTS,
+            )
+        )
+    if keywords:
+        needles = [k.lower() for k in keywords]
+        cases = [
+            c
+            for c in cases
+            if any(n in f"{c.id} {c.title} {c.path.name}".lower() for n in needles)
+        ]
+    return cases
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value)
+    if not match:
+        raise argparse.ArgumentTypeError(f"shard must look like 'i/n', got {value!r}")
+    index, total = int(match.group(1)), int(match.group(2))
+    if total < 1 or not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"shard index must be within 1..{total}, got {index}")
+    return index, total
+
+
+def select_shard(cases: list[TestCase], index: int, total: int) -> list[TestCase]:
+    """Stable 1-based ``index``-of-``total`` slice of ``cases``.
+
+    Serial tests all belong to shard 1, so two shards never mutate the
+    shared account at the same time.
+    """
+    parallel = [c for c in cases if not c.serial][index - 1 :: total]
+    serial = [c for c in cases if c.serial] if index == 1 else []
+    order = {c.id: i for i, c in enumerate(cases)}
+    return sorted(serial + parallel, key=lambda c: order[c.id])
+
+
+def _is_entrypoint_call(node: ast.stmt) -> bool:
+    # Matches the generated trailer: ``asyncio.run(run_test())``
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return False
+    func = node.value.func
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr == "run"
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "asyncio"
+    )
+
+
+def load_run_test(
+    path: Path, api: Any | None = None
+) -> Callable[[], Awaitable[None]]:
+    """Load ``run_test`` from a TC script without running it.
+
+    When ``api`` is given it replaces the module's ``async_api`` global, which
+    is how the runner redirects the script's browser launch.
+    """
+    source = path.read_text()
+    tree = ast.parse(source, filename=str(path))
+    tree.body = [node for node in tree.body if not _is_entrypoint_call(node)]
+    namespace: dict[str, Any] = {
+        "__name__": f"testsprite.{path.stem}",
+        "__file__": str(path),
+    }
+    exec(compile(tree, str(path), "exec"), namespace)
+    if api is not None:
+        namespace["async_api"] = api
+    run_test = namespace.get("run_test")
+    if run_test is None or not asyncio.iscoroutinefunction(run_test):
+        raise LookupError(f"{path.name} does not define an async run_test()")
+    return run_test
+
+
+# ---------------------------------------------------------------------------
+# Shared browser shim
+# ---------------------------------------------------------------------------
+
+
+class SharedBrowserApi:
+    """Stand-in for ``playwright.async_api`` inside one loaded TC module.
+
+    ``async_playwright().start()`` and ``chromium.launch()`` resolve to the
+    worker's already running browser; ``new_context()`` opens a real, isolated
+    context on it; ``browser.close()`` and ``pw.stop()`` only close the
+    contexts this test opened. Everything else (``Error``, ``expect``...) is
+    forwarded to the real module.
+    """
+
+    def __init__(
+        self,
+        browser: async_api.Browser,
+        context_options: dict[str, Any],
+        recorder: perf.PerfRecorder | None = None,
+    ):
+        self._browser = browser
+        self._context_options = context_options
+        self.recorder = recorder
+        self.contexts: list[async_api.BrowserContext] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(async_api, name)
+
+    def async_playwright(self) -> "_SharedPlaywrightStarter":
+        return _SharedPlaywrightStarter(self)
+
+    async def new_context(self, **options: Any) -> async_api.BrowserContext:
+        context = await self._browser.new_context(**{**self._context_options, **options})
+        self.contexts.append(context)
+        if self.recorder is not None:
+            await self.recorder.attach(context)
+        return context
+
+    async def close(self) -> None:
+        while self.contexts:
+            context = self.contexts.pop()
+            try:
+                await context.close()
+            except async_api.Error:
+                pass
+
+
+class _SharedPlaywrightStarter:
+    def __init__(self, api: SharedBrowserApi):
+        self._api = api
+
+    async def start(self) -> "_SharedPlaywright":
+        return _SharedPlaywright(self._api)
+
+
+class _SharedPlaywright:
+    def __init__(self, api: SharedBrowserApi):
+        self.chromium = _SharedBrowserType(api)
+
+    async def stop(self) -> None:
+        pass
+
+
+class _SharedBrowserType:
+    def __init__(self, api: SharedBrowserApi):
+        self._api = api
+
+    async def launch(self, **_ignored: Any) -> "_SharedBrowser":
+        return _SharedBrowser(self._api)
+
+
+class _SharedBrowser:
+    def __init__(self, api: SharedBrowserApi):
+        self._api = api
+
+    @property
+    def contexts(self) -> list[async_api.BrowserContext]:
+        return list(self._api.contexts)
+
+    async def new_context(self, **options: Any) -> async_api.BrowserContext:
+        return await self._api.new_context(**options)
+
+    async def new_page(self, **options: Any) -> async_api.Page:
+        context = await self._api.new_context(**options)
+        return await context.new_page()
+
+    async def close(self) -> None:
+        await self._api.close()
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+
+def _describe_failure(exc: BaseException) -> str:
+    if isinstance(exc, AssertionError) and str(exc):
+        return str(exc)
+    lines = traceback.format_exception_only(type(exc), exc)
+    return "".join(lines).strip()
+
+
+async def run_case(
+    case: TestCase,
+    browser: async_api.Browser,
+    options: RunOptions,
+    worker: int = 0,
+) -> TestResult:
+    recorder = perf.PerfRecorder() if options.perf else None
+    api = SharedBrowserApi(browser, options.context_options, recorder)
+    created = _utc_now()
+    started = time.monotonic()
+    status, error = "PASSED", ""
+    try:
+        run_test = load_run_test(case.path, api)
+        await asyncio.wait_for(run_test(), timeout=options.timeout)
+    except asyncio.TimeoutError:
+        status, error = "FAILED", f"Test execution timed out after {options.timeout:g} seconds"
+    except Exception as exc:  # a failing test must not take the worker down
+        status, error = "FAILED", _describe_failure(exc)
+    finally:
+        if recorder is not None:
+            await recorder.flush()
+        await api.close()
+    extra = {"perf": recorder.summary()} if recorder is not None else {}
+    return TestResult(
+        title=case.title,
+        description=case.description,
+        code=case.path.read_text(),
+        testStatus=status,
+        testError=error,
+        created=created,
+        modified=_utc_now(),
+        durationMs=int((time.monotonic() - started) * 1000),
+        worker=worker,
+        extra=extra,
+    )
+
+
+async def run_worker(
+    cases: list[TestCase], options: RunOptions, worker: int = 0
+) -> list[TestResult]:
+    """Run ``cases`` on one shared browser, ``options.per_worker`` at a time."""
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=options.headless, args=BROWSER_ARGS)
+        semaphore = asyncio.Semaphore(max(1, options.per_worker))
+        # Taken in gather order (asyncio locks are FIFO), so serial tests keep id order
+        serial_lock = asyncio.Lock()
+
+        async def bounded(case: TestCase) -> TestResult:
+            if case.serial:
+                async with serial_lock, semaphore:
+                    result = await run_case(case, browser, options, worker)
+            else:
+                async with semaphore:
+                    result = await run_case(case, browser, options, worker)
+            print(f"[w{worker}] {result.testStatus:<6} {case.title} ({result.durationMs} ms)", flush=True)
+            return result
+
+        try:
+            return list(await asyncio.gather(*(bounded(c) for c in cases)))
+        finally:
+            await browser.close()
+
+
+def _worker_entry(cases: list[TestCase], options: RunOptions, worker: int) -> list[TestResult]:
+    # Entry point of a spawned worker process: one event loop, one browser.
+    # harness.auth keys its signed-in storage-state cache on this.
+    os.environ["TESTSPRITE_WORKER"] = str(worker)
+    return asyncio.run(run_worker(cases, options, worker))
+
+
+def partition(cases: list[TestCase], workers: int) -> list[list[TestCase]]:
+    """Split ``cases`` over at most ``workers`` buckets; serial tests share the first."""
+    serial = [c for c in cases if c.serial]
+    parallel = [c for c in cases if not c.serial]
+    buckets: list[list[TestCase]] = [[] for _ in range(max(1, min(workers, len(parallel) + bool(serial))))]
+    buckets[0].extend(serial)
+    # The serial bucket is already the longest; fill the others first
+    start = 1 if serial and len(buckets) > 1 else 0
+    for i, case in enumerate(parallel):
+        buckets[(start + i) % len(buckets)].append(case)
+    return buckets
+
+
+def run_suite(cases: list[TestCase], workers: int, options: RunOptions) -> list[TestResult]:
+    if not cases:
+        return []
+    buckets = partition(cases, workers)
+    if len(buckets) == 1:
+        results = _worker_entry(buckets[0], options, 0)
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(buckets), mp_context=ctx) as pool:
+            futures = [
+                pool.submit(_worker_entry, bucket, options, i)
+                for i, bucket in enumerate(buckets)
+            ]
+            results = [r for f in futures for r in f.result()]
+    order = {c.title: i for i, c in enumerate(cases)}
+    return sorted(results, key=lambda r: order[r.title])
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+def write_json(results: list[TestResult], path: Path) -> None:
+    """Write results using the same record shape as ``tmp/test_results.json``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    records = []
+    for result in results:
+        record = asdict(result)
+        record.update(record.pop("extra"))
+        records.append(record)
+    path.write_text(json.dumps(records, indent=2) + "\n")
+
+
+def write_junit(results: list[TestResult], path: Path, wall_seconds: float) -> None:
+    failures = sum(r.testStatus != "PASSED" for r in results)
+    suite = ET.Element(
+        "testsuite",
+        name="testsprite",
+        tests=str(len(results)),
+        failures=str(failures),
+        errors="0",
+        time=f"{wall_seconds:.3f}",
+        timestamp=_utc_now(),
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname="testsprite",
+            name=result.title,
+            time=f"{result.durationMs / 1000:.3f}",
+        )
+        if result.testStatus != "PASSED":
+            failure = ET.SubElement(case, "failure", message=result.testError.splitlines()[0] if result.testError else "failed")
+            failure.text = result.testError
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness", description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", dest="keywords", action="append", help="only run tests matching this substring (repeatable)")
+    parser.add_argument("--workers", type=int, default=max(1, min(4, multiprocessing.cpu_count())), help="worker processes, one browser each")
+    parser.add_argument("--per-worker", type=int, default=2, help="concurrent tests (contexts) per worker browser")
+    parser.add_argument("--shard", type=parse_shard, default=(1, 1), metavar="I/N", help="run only shard I of N")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="per-test timeout in seconds")
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    parser.add_argument("--json", type=Path, default=DEFAULT_RESULTS, help="results file (test_results.json format)")
+    parser.add_argument("--junit", type=Path, help="also write a JUnit XML report here")
+    parser.add_argument("--perf", action="store_true", help="record page/server-action performance and compare with the baseline")
+    parser.add_argument("--perf-baseline", type=Path, default=perf.BASELINE_FILE, help="baseline file for --perf")
+    parser.add_argument("--update-perf-baseline", action="store_true", help="with --perf, store this run as the new baseline")
+    parser.add_argument("--reset-auth", action="store_true", help="discard cached signed-in storage state first")
+    parser.add_argument("--list", action="store_true", help="print the selected tests and exit")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    cases = select_shard(discover(keywords=args.keywords), *args.shard)
+
+    if args.list:
+        for case in cases:
+            print(f"{case.id}  {case.path.name}")
+        return 0
+    if not cases:
+        print("No tests selected.", file=sys.stderr)
+        return 0
+
+    if args.reset_auth:
+        for path in auth.STATE_DIR.glob("storage-state-*.json"):
+            path.unlink()
+
+    options = RunOptions(
+        headless=not args.headed,
+        timeout=args.timeout,
+        per_worker=args.per_worker,
+        perf=args.perf,
+    )
+    started = time.monotonic()
+    results = run_suite(cases, args.workers, options)
+    wall = time.monotonic() - started
+
+    write_json(results, args.json)
+    if args.junit:
+        write_junit(results, args.junit, wall)
+
+    failed = [r for r in results if r.testStatus != "PASSED"]
+    print(f"\n{len(results) - len(failed)} passed, {len(failed)} failed in {wall:.1f}s")
+    for result in failed:
+        print(f"  FAILED {result.title}: {result.testError.splitlines()[0] if result.testError else ''}")
+
+    regressions: list[str] = []
+    if args.perf:
+        regressions = _report_perf(results, args.perf_baseline, args.update_perf_baseline)
+    return 1 if failed or regressions else 0
+
+
+def _report_perf(results: list[TestResult], baseline_path: Path, update: bool) -> list[str]:
+    per_test = {r.title.split("-", 1)[0]: r.extra["perf"] for r in results if "perf" in r.extra}
+    artifact = perf.build_artifact(per_test)
+    print(f"Performance artifact: {perf.write_artifact(artifact)}")
+    if update:
+        perf.save_baseline(artifact, baseline_path)
+        print(f"Performance baseline updated: {baseline_path}")
+        return []
+    baseline = perf.load_baseline(baseline_path)
+    if baseline is None:
+        print(f"No performance baseline at {baseline_path}; run with --update-perf-baseline to create one.")
+        return []
+    regressions = perf.compare(artifact, baseline)
+    for line in regressions:
+        print(f"  PERF REGRESSION {line}")
+    return regressions
@@ -0,0 +1,108 @@
+"""Event-driven wait primitives for the TC scripts.
+
+The generated scripts used to sleep ``page.wait_for_timeout(3000)`` before
+every interaction. These helpers wait for the thing that actually matters
+instead (the locator becoming actionable, the network going idle, a server
+action answering) and give every step a hard budget, so a test takes as long
+as the app does and a hung step fails fast.
+
+    from harness import waits
+
+    await waits.fill(elem, "abir@example.com")
+    await waits.click(elem, response=waits.server_action())
+    await waits.expect_visible(frame.locator("text=Journal Entry received.").first)
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from playwright import async_api
+from playwright.async_api import expect
+
+# Upper bound for a single interaction, including what it waits on.
+STEP_BUDGET_MS = 10_000
+# How long to give the network to go quiet after a step. Next's dev server
+# keeps long-lived connections open, so "networkidle" is best effort.
+SETTLE_BUDGET_MS = 2_000
+
+ResponsePredicate = Callable[[async_api.Response], bool]
+
+
+class _Deadline:
+    def __init__(self, budget_ms: float):
+        self._end = time.monotonic() + budget_ms / 1000
+
+    def remaining_ms(self, floor_ms: float = 1) -> float:
+        return max(floor_ms, (self._end - time.monotonic()) * 1000)
+
+
+def server_action(path: str | None = None) -> ResponsePredicate:
+    """Match the response of a Next.js server action POST.
+
+    Server actions are posted to the current route with a ``Next-Action``
+    header; ``path`` optionally narrows the match to one route.
+    """
+
+    def predicate(response: async_api.Response) -> bool:
+        request = response.request
+        if request.method != "POST" or "next-action" not in request.headers:
+            return False
+        return path is None or path in request.url
+
+    return predicate
+
+
+async def settle(page: async_api.Page, budget_ms: float = SETTLE_BUDGET_MS) -> None:
+    """Wait for network idle, giving up quietly once ``budget_ms`` is spent."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=budget_ms)
+    except async_api.Error:
+        pass
+
+
+async def goto(
+    page: async_api.Page, url: str, *, budget_ms: float = STEP_BUDGET_MS
+) -> None:
+    deadline = _Deadline(budget_ms)
+    await page.goto(url, wait_until="domcontentloaded", timeout=budget_ms)
+    await settle(page, min(SETTLE_BUDGET_MS, deadline.remaining_ms()))
+
+
+async def fill(
+    locator: async_api.Locator, value: str, *, budget_ms: float = STEP_BUDGET_MS
+) -> None:
+    # Locator.fill already waits for visible, enabled and editable.
+    await locator.fill(value, timeout=budget_ms)
+
+
+async def click(
+    locator: async_api.Locator,
+    *,
+    response: ResponsePredicate | None = None,
+    budget_ms: float = STEP_BUDGET_MS,
+    settle_ms: float = SETTLE_BUDGET_MS,
+) -> async_api.Response | None:
+    """Click once actionable, then wait for ``response`` (if given) and idle.
+
+    Returns the matched response so callers can assert on its status.
+    """
+    deadline = _Deadline(budget_ms)
+    page = locator.page
+    matched = None
+    if response is not None:
+        async with page.expect_response(response, timeout=budget_ms) as info:
+            await locator.click(timeout=budget_ms)
+        matched = await info.value
+    else:
+        await locator.click(timeout=budget_ms)
+    if settle_ms:
+        await settle(page, min(settle_ms, deadline.remaining_ms()))
+    return matched
+
+
+async def expect_visible(
+    locator: async_api.Locator, *, budget_ms: float = STEP_BUDGET_MS
+) -> None:
+    await expect(locator).to_be_visible(timeout=budget_ms)